@@ -6,42 +6,78 @@ ChromaDB Data Inspector
 Simple script to inspect ChromaDB data and view collection contents
 """
 
-import chromadb
-from chromadb.config import Settings
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_bytes(obj, pretty=False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if pretty else orjson.OPT_NON_STR_KEYS)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
 def export_collection_to_json(collection_name="documentation_collection", 
                               output_file="chromadb_export.json",
-                              chromadb_path="./chromadb_data"):
-    """Export a specific collection to JSON for viewing"""
+                              chromadb_path="./chromadb_data",
+                              batch_size=1000,
+                              pretty=True):
+    """Export a specific collection to JSON for viewing
+
+    Documents are read from the collection in pages of ``batch_size`` and written
+    to the file as they arrive, so memory use stays bounded by one page.
+    """
+    
+    # Imported here so the heavy chromadb import is only paid when exporting
+    import chromadb
     
     client = chromadb.PersistentClient(path=chromadb_path)
     
     try:
         collection = client.get_collection(collection_name)
-        results = collection.get(include=['metadatas', 'documents'])
-        
-        # Format for JSON export
-        export_data = {
-            "collection_name": collection_name,
-            "document_count": len(results['ids']),
-            "documents": []
-        }
-        
-        for i, doc_id in enumerate(results['ids']):
-            doc = {
-                "id": doc_id,
-                "content": results['documents'][i] if i < len(results['documents']) else "",
-                "metadata": results['metadatas'][i] if i < len(results['metadatas']) else {}
-            }
-            export_data["documents"].append(doc)
+        document_count = collection.count()
+        exported = 0
         
-        # Save to JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            # Write the envelope by hand so documents can be streamed into the array
+            f.write(b'{\n')
+            f.write(b'  "collection_name": ' + _dumps_bytes(collection_name) + b',\n')
+            f.write(b'  "document_count": ' + _dumps_bytes(document_count) + b',\n')
+            f.write(b'  "documents": [')
+            
+            offset = 0
+            while True:
+                results = collection.get(include=['metadatas', 'documents'], limit=batch_size, offset=offset)
+                ids = results['ids']
+                if not ids:
+                    break
+                
+                for i, doc_id in enumerate(ids):
+                    doc = {
+                        "id": doc_id,
+                        "content": results['documents'][i] if i < len(results['documents']) else "",
+                        "metadata": results['metadatas'][i] if i < len(results['metadatas']) else {}
+                    }
+                    record = _dumps_bytes(doc, pretty)
+                    if pretty:
+                        record = b'    ' + record.replace(b'\n', b'\n    ')
+                    f.write(b',\n' if exported else b'\n')
+                    f.write(record)
+                    exported += 1
+                
+                offset += len(ids)
+            
+            f.write(b'\n  ]\n}\n')
         
-        print(f"✅ Exported {len(results['ids'])} documents to {output_file}")
+        print(f"✅ Exported {exported} documents to {output_file}")
         
     except Exception as e:
         print(f"❌ Export failed: {e}")
@@ -54,9 +90,11 @@ if __name__ == "__main__":
     print("=========================")
     
     # Parse command line arguments
-    # Usage: python export_chromadb_data.py [collection_name] [output_file]
-    collection_name = sys.argv[1] if len(sys.argv) > 1 else "documentation_collection"
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "chromadb_export.json"
+    # Usage: python export_chromadb_data.py [collection_name] [output_file] [--compact]
+    pretty = "--compact" not in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--compact"]
+    collection_name = args[0] if len(args) > 0 else "documentation_collection"
+    output_file = args[1] if len(args) > 1 else "chromadb_export.json"
     
     print(f"📤 Exporting collection '{collection_name}' to '{output_file}'...")
-    export_collection_to_json(collection_name, output_file)
+    export_collection_to_json(collection_name, output_file, pretty=pretty)
@@ -5,18 +5,15 @@ Documentation Retrieval MCP Server Entry Point
 
 Entry point for the Model Context Protocol server that provides search capabilities
 for documentation stored in Azure Cognitive Search.
-"""
 
-import sys
-from pathlib import Path
+The project root (this file's directory) is already on sys.path when the script
+runs, so the server is imported through the regular `src` package - the same
+module path the rest of the codebase uses. `python -m src.mcp_server` works too.
+"""
 
-# ONE simple line to fix all imports - find project root and add src
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root / 'src'))
+import asyncio
 
-# Import and run our MCP server (renamed to avoid conflicts)
-from mcp_server.server import main
+from src.mcp_server.server import main
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
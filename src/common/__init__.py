@@ -6,10 +6,24 @@ Shared components used across both document upload and MCP server functionality.
 Includes Azure Cognitive Search integration, embedding services, and OpenAI services.
 """
 
-# Export main classes and functions
-from .vector_search_services.azure_cognitive_search import AzureCognitiveSearch, get_azure_search_service
-from .embedding_services.azure_openai_embedding_service import AzureOpenAIEmbeddingGenerator, get_azure_openai_embedding_generator
-from .embedding_services.embedding_service_factory import get_embedding_generator
+import importlib
+
+# Export main classes and functions. They are resolved lazily on first access so that
+# importing any src.common submodule does not pull in the Azure SDK and embedding providers
+_LAZY_EXPORTS = {
+    'AzureCognitiveSearch': '.vector_search_services.azure_cognitive_search',
+    'get_azure_search_service': '.vector_search_services.azure_cognitive_search',
+    'AzureOpenAIEmbeddingGenerator': '.embedding_services.azure_openai_embedding_service',
+    'get_azure_openai_embedding_generator': '.embedding_services.azure_openai_embedding_service',
+    'get_embedding_generator': '.embedding_services.embedding_service_factory',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'AzureCognitiveSearch',
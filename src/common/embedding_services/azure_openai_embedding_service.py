@@ -8,11 +8,14 @@ Handles both single queries and batch processing with rate limiting and error ha
 
 import os
 import asyncio
+import logging
 from typing import List, Optional
-from dotenv import load_dotenv
+from src.common.environment import load_environment
 
 # Load environment variables
-load_dotenv()
+load_environment()
+
+logger = logging.getLogger(__name__)
 
 
 class AzureOpenAIEmbeddingGenerator:
@@ -49,10 +52,12 @@ class AzureOpenAIEmbeddingGenerator:
         if self._client is None:
             try:
                 from openai import AzureOpenAI
+                from src.common.http_client import get_shared_http_client
                 self._client = AzureOpenAI(
                     azure_endpoint=self.azure_ai_foundry_endpoint,
                     api_key=self.azure_ai_foundry_embedding_model_key,
-                    api_version=self.api_version
+                    api_version=self.api_version,
+                    http_client=get_shared_http_client()
                 )
             except ImportError as e:
                 print(f"Failed to import OpenAI library: {e}")
@@ -90,7 +95,9 @@ class AzureOpenAIEmbeddingGenerator:
         """
         try:
             client = self._get_client()
-            response = client.embeddings.create(
+            # Blocking request runs in a worker thread so the event loop stays responsive
+            response = await asyncio.to_thread(
+                client.embeddings.create,
                 model=self.embedding_model,
                 input=[text]
             )
@@ -103,59 +110,67 @@ class AzureOpenAIEmbeddingGenerator:
             print(f"Error generating embedding for text: {e}")
             return None
     
-    async def generate_embeddings_batch(self, texts: List[str], batch_size: int = 16) -> List[List[float]]:
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed one batch with a single (blocking) API request
+        
+        Args:
+            batch: Texts sent in one request
+            
+        Returns:
+            One embedding per text, with zero vectors where generation failed
+        """
+        empty_embedding = [0.0] * self.embedding_dimension
+        
+        client = self._get_client()
+        response = client.embeddings.create(
+            model=self.embedding_model,
+            input=batch
+        )
+        
+        # Handle response and extract embeddings
+        if not response or not response.data:
+            # Add empty embeddings for failed batch
+            return [empty_embedding] * len(batch)
+        
+        return [
+            embedding_data.embedding if embedding_data and embedding_data.embedding else empty_embedding
+            for embedding_data in response.data
+        ]
+    
+    async def generate_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
         """
-        Generate embeddings for text chunks in batches with rate limiting
+        Generate embeddings for text chunks in batches, several requests at a time
+        
+        Texts are split into batches of batch_size and up to EMBEDDING_MAX_CONCURRENCY
+        (default 4) requests run concurrently in worker threads. Throttled requests are
+        retried with backoff by the OpenAI client itself.
         
         Args:
             texts: List of text strings to generate embeddings for
-            batch_size: Number of texts to process in each batch (default: 16)
+            batch_size: Number of texts per request (from EMBEDDING_BATCH_SIZE if None, default 64)
             
         Returns:
             List of embedding vectors (one per input text)
         """
-        all_embeddings = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-
-            try:
-                # Add delay to respect rate limits
-                if i > 0:
-                    await asyncio.sleep(1)  # 1 second between batches
-
-                client = self._get_client()
-                response = client.embeddings.create(
-                    model=self.embedding_model,
-                    input=batch
-                )
-                
-                # Handle response and extract embeddings
-                batch_embeddings = []
-                if response and response.data:
-                    for embedding_data in response.data:
-                        if embedding_data and embedding_data.embedding:
-                            batch_embeddings.append(embedding_data.embedding)
-                        else:
-                            # Add empty embedding for failed generation
-                            empty_embedding = [0.0] * self.embedding_dimension
-                            batch_embeddings.append(empty_embedding)
-                else:
-                    # Add empty embeddings for failed batch
-                    empty_embedding = [0.0] * self.embedding_dimension
-                    batch_embeddings = [empty_embedding] * len(batch)
-                
-                all_embeddings.extend(batch_embeddings)
-                print(f"Generated embeddings for batch {i//batch_size + 1}/{(len(texts) + batch_size - 1)//batch_size}")
-
-            except Exception as e:
-                print(f"Error generating embeddings for batch {i//batch_size + 1}: {e}")
-                # Add empty embeddings for failed batch to maintain alignment
-                empty_embedding = [0.0] * self.embedding_dimension
-                all_embeddings.extend([empty_embedding] * len(batch))
-
-        return all_embeddings
-   
+        batch_size = batch_size or int(os.getenv('EMBEDDING_BATCH_SIZE', '64'))
+        semaphore = asyncio.Semaphore(int(os.getenv('EMBEDDING_MAX_CONCURRENCY', '4')))
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        
+        async def embed(batch_number: int, batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                try:
+                    batch_embeddings = await asyncio.to_thread(self._embed_batch, batch)
+                    logger.debug("Generated embeddings for batch %d/%d", batch_number, len(batches))
+                    return batch_embeddings
+                except Exception as e:
+                    logger.error(f"Error generating embeddings for batch {batch_number}: {e}")
+                    # Add empty embeddings for failed batch to maintain alignment
+                    return [[0.0] * self.embedding_dimension] * len(batch)
+        
+        results = await asyncio.gather(*(embed(n, batch) for n, batch in enumerate(batches, 1)))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+    
     def get_empty_embedding(self) -> List[float]:
         """Return an empty embedding vector"""
         return [0.0] * self.embedding_dimension
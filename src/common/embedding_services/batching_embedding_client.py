@@ -0,0 +1,151 @@
+"""
+Batching Embedding Client
+=========================
+
+Coalesces concurrent single-text embedding requests into batched calls.
+When an MCP client fires several search tools in one turn, each query would
+otherwise pay its own embedding round-trip; this client collects requests that
+arrive within a short window and sends them as one batch. Batches are sent
+concurrently (up to ``max_inflight``), so a query arriving during a flush does
+not wait for the previous round-trip to finish.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingEmbeddingClient:
+    """
+    Drop-in wrapper around an embedding generator that micro-batches queries
+
+    Exposes the same async ``generate_embedding(text)`` method as the wrapped
+    generator, so it can be used anywhere a generator is expected.
+    """
+
+    def __init__(self, embedding_generator, max_batch: int = 16, max_wait: float = 0.01,
+                 max_inflight: int = 4):
+        """
+        Initialize the batching client
+
+        Args:
+            embedding_generator: Generator exposing async ``generate_embeddings_batch(texts)``
+            max_batch: Maximum number of texts sent in one batch (default: 16)
+            max_wait: Seconds to wait for more requests after the first arrives (default: 0.01)
+            max_inflight: Maximum batches being embedded at once (default: 4)
+        """
+        self.embedding_generator = embedding_generator
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_inflight = max(1, max_inflight)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        # Strong references to running dispatch tasks (the loop only keeps weak ones)
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
+    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Queue a text for embedding and wait for its batch to complete
+
+        Args:
+            text: Input text to generate embedding for
+
+        Returns:
+            Embedding vector, or None if generation failed
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the batching worker on the running event loop if needed"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._inflight = asyncio.Semaphore(self.max_inflight)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Collect pending requests into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Send the batch in the background so the next one can form meanwhile;
+            # waiting for a slot caps the embedding requests in flight
+            await inflight.acquire()
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(lambda done, slot=inflight: self._dispatch_done(done, slot))
+    
+    def _dispatch_done(self, task: asyncio.Task, inflight: asyncio.Semaphore) -> None:
+        """Release the in-flight slot and reference held for a finished dispatch task"""
+        self._dispatch_tasks.discard(task)
+        inflight.release()
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve each caller's future"""
+        # Blank texts can't be embedded (generators drop them from batches, and some
+        # services reject the whole request): resolve them as failures up front
+        pending = []
+        for text, future in batch:
+            if text and text.strip():
+                pending.append((text, future))
+            elif not future.done():
+                future.set_result(None)
+        if not pending:
+            return
+
+        # Sort by length so similarly-sized texts share a request
+        ordered = sorted(pending, key=lambda item: len(item[0]))
+        texts = [text for text, _ in ordered]
+
+        try:
+            embeddings = await self.embedding_generator.generate_embeddings_batch(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            # Don't let one bad text fail the others: embed each text on its own
+            logger.warning(f"[WARNING] Batched embedding generation failed, embedding texts individually: {e}")
+            embeddings = await asyncio.gather(*(self._embed_single(text) for text in texts))
+        else:
+            # Generators pad a failed request with zero vectors, which would fail every
+            # text that shared it; retry those texts individually
+            failed = [i for i, embedding in enumerate(embeddings) if not self._is_valid(embedding)]
+            if failed and len(texts) > 1:
+                retried = await asyncio.gather(*(self._embed_single(texts[i]) for i in failed))
+                embeddings = list(embeddings)
+                for i, embedding in zip(failed, retried):
+                    embeddings[i] = embedding
+
+        for (_, future), embedding in zip(ordered, embeddings):
+            if future.done():
+                continue
+            future.set_result(embedding if self._is_valid(embedding) else None)
+
+    @staticmethod
+    def _is_valid(embedding: Optional[List[float]]) -> bool:
+        """Check for a usable embedding (batch generators pad failures with zero vectors)"""
+        return bool(embedding) and any(embedding)
+
+    async def _embed_single(self, text: str) -> Optional[List[float]]:
+        """Embed one text with the wrapped generator, returning None on failure"""
+        try:
+            return await self.embedding_generator.generate_embedding(text)
+        except Exception as e:
+            logger.error(f"[ERROR] Embedding generation failed: {e}")
+            return None
@@ -8,12 +8,12 @@ Automatically handles fallbacks and provider switching.
 
 import os
 from typing import List
-from dotenv import load_dotenv
+from src.common.environment import load_environment
 
 from src.common.embedding_services.azure_openai_embedding_service import get_azure_openai_embedding_generator
 from src.common.embedding_services.local_embedding_service import get_local_embedding_generator
 
-load_dotenv()
+load_environment()
 
 
 def get_embedding_generator(provider: str = None):
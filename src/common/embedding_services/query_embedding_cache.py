@@ -0,0 +1,250 @@
+"""
+Query Embedding Cache
+====================
+
+Small in-process LRU cache of query -> embedding vectors with a TTL.
+Search services use it so that repeated queries (agent retry loops, the same
+concept searched several times in one session) skip the embedding round-trip.
+Queries that differ only in case, spacing or trailing punctuation share an
+entry, and concurrent misses for the same query share one request.
+
+When QUERY_EMBEDDING_CACHE_REDIS_URL is set (and the redis package is
+installed), embeddings are also written through to Redis under
+sha256(model|query), so they survive restarts and are shared between servers.
+
+Both tiers store embeddings as packed numpy blobs (float32 by default, or
+float16 / scaled int8 via QUERY_EMBEDDING_CACHE_PRECISION) rather than Python
+float lists, and rebuild the list on read.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Messages go through logging, never stdout, which carries the stdio MCP protocol
+logger = logging.getLogger(__name__)
+
+CachePrecision = Literal['fp32', 'fp16', 'int8']
+CACHE_PRECISIONS = ('fp32', 'fp16', 'int8')
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of normalized query strings to embedding vectors
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry is
+    evicted once ``max_size`` is reached.
+    """
+
+    def __init__(self,
+                 max_size: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 redis_url: Optional[str] = None,
+                 redis_ttl_seconds: Optional[int] = None,
+                 cache_precision: Optional[CachePrecision] = None):
+        """
+        Initialize the query embedding cache
+
+        Args:
+            max_size: Maximum number of cached queries (from env if None, default 512)
+            ttl_seconds: Entry lifetime in seconds (from env if None, default 300)
+            redis_url: Redis URL for the persistent tier (from env if None; unset disables it)
+            redis_ttl_seconds: Redis entry lifetime in seconds (from env if None, default 3600)
+            cache_precision: Stored precision - 'fp32', 'fp16' or 'int8' (from env if None, default 'fp32')
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv('QUERY_EMBEDDING_CACHE_SIZE', '512'))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('QUERY_EMBEDDING_CACHE_TTL', '300'))
+        self.redis_ttl_seconds = (redis_ttl_seconds if redis_ttl_seconds is not None
+                                  else int(os.getenv('QUERY_EMBEDDING_CACHE_REDIS_TTL', '3600')))
+        redis_url = redis_url if redis_url is not None else os.getenv('QUERY_EMBEDDING_CACHE_REDIS_URL')
+        self._redis = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._redis = redis_asyncio.from_url(redis_url)
+            else:
+                logger.warning("[WARNING] QUERY_EMBEDDING_CACHE_REDIS_URL is set but the redis package is not installed")
+        self.cache_precision = cache_precision or os.getenv('QUERY_EMBEDDING_CACHE_PRECISION', 'fp32')
+        if self.cache_precision not in CACHE_PRECISIONS:
+            logger.warning(f"[WARNING] Unknown query embedding cache precision '{self.cache_precision}', using fp32")
+            self.cache_precision = 'fp32'
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        # normalized query -> embedding task already in flight
+        self._pending: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a query string into its cache key (case, whitespace and trailing punctuation)"""
+        return " ".join(query.split()).lower().rstrip("?!.,;:").rstrip()
+
+    @staticmethod
+    def model_name(embedding_generator) -> str:
+        """Return the model identifier of a generator (unwrapping batching clients)"""
+        generator = getattr(embedding_generator, 'embedding_generator', embedding_generator)
+        return (getattr(generator, 'embedding_model', None)
+                or getattr(generator, 'model_name', None)
+                or type(generator).__name__)
+
+    def persistent_key(self, query: str, model: str) -> str:
+        """Build the Redis key for a query embedded by a given model at this cache's precision"""
+        digest = hashlib.sha256(f"{model}|{self.normalize(query)}".encode('utf-8')).hexdigest()
+        return f"query-embedding:{self.cache_precision}:{digest}"
+
+    def encode(self, embedding: List[float]) -> bytes:
+        """Pack an embedding into a blob at the configured precision"""
+        import numpy as np
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self.cache_precision == 'fp16':
+            return vector.astype(np.float16).tobytes()
+        if self.cache_precision == 'int8':
+            # Symmetric quantization; the float32 scale is appended to the blob
+            scale = np.float32(np.abs(vector).max() / 127.0) if vector.size else np.float32(0.0)
+            if scale == 0.0:
+                scale = np.float32(1.0)
+            quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+            return quantized.tobytes() + scale.tobytes()
+        return vector.tobytes()
+
+    def decode(self, blob: bytes) -> List[float]:
+        """Rebuild an embedding list from a blob produced by encode()"""
+        import numpy as np
+        if self.cache_precision == 'fp16':
+            return np.frombuffer(blob, dtype=np.float16).astype(np.float32).tolist()
+        if self.cache_precision == 'int8':
+            scale = np.frombuffer(blob[-4:], dtype=np.float32)[0]
+            return (np.frombuffer(blob[:-4], dtype=np.int8).astype(np.float32) * scale).tolist()
+        return np.frombuffer(blob, dtype=np.float32).tolist()
+
+    def get(self, query: str) -> Optional[List[float]]:
+        """
+        Get the cached embedding for a query
+
+        Args:
+            query: Raw query string
+
+        Returns:
+            Cached embedding vector, or None on a miss or expired entry
+        """
+        if self.max_size <= 0:
+            return None
+
+        key = self.normalize(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, blob = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self.decode(blob)
+
+    def put(self, query: str, embedding: List[float]) -> None:
+        """
+        Store an embedding for a query, evicting the oldest entry when full
+
+        Args:
+            query: Raw query string
+            embedding: Embedding vector for the query
+        """
+        if self.max_size <= 0 or not embedding:
+            return
+
+        key = self.normalize(query)
+        self._entries[key] = (time.monotonic(), self.encode(embedding))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_generate(self, query: str, embedding_generator) -> Optional[List[float]]:
+        """
+        Return the cached embedding for a query, generating and caching it on a miss
+
+        Args:
+            query: Raw query string
+            embedding_generator: Generator exposing async ``generate_embedding(text)``
+
+        Returns:
+            Embedding vector, or None if generation failed
+        """
+        embedding = self.get(query)
+        if embedding is not None:
+            return embedding
+
+        key = self.normalize(query)
+        pending = self._pending.get(key)
+        if pending is None:
+            # Generation runs as its own task that every caller shields, so cancelling
+            # one caller (even the one that started it) never cancels the others
+            pending = asyncio.get_running_loop().create_task(self._generate(query, embedding_generator))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda task: self._generation_done(key, task))
+        return await asyncio.shield(pending)
+
+    async def _generate(self, query: str, embedding_generator) -> Optional[List[float]]:
+        """Read the persistent tier or generate an embedding, caching the result"""
+        redis_key = self.persistent_key(query, self.model_name(embedding_generator)) if self._redis else None
+        embedding = await self._get_persistent(redis_key) if redis_key else None
+        if embedding is not None:
+            self.put(query, embedding)
+            return embedding
+
+        embedding = await embedding_generator.generate_embedding(query)
+        if embedding:
+            self.put(query, embedding)
+            if redis_key:
+                await self._put_persistent(redis_key, embedding)
+        return embedding
+
+    def _generation_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished generation task"""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        # Waiters observe any exception; mark it retrieved in case all of them were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_persistent(self, redis_key: str) -> Optional[List[float]]:
+        """Read an embedding from Redis, or None on a miss or Redis failure"""
+        try:
+            blob = await self._redis.get(redis_key)
+        except Exception as e:
+            self._disable_persistent(e)
+            return None
+        return self.decode(blob) if blob else None
+
+    async def _put_persistent(self, redis_key: str, embedding: List[float]) -> None:
+        """Write an embedding through to Redis; failures only disable the tier"""
+        try:
+            await self._redis.setex(redis_key, self.redis_ttl_seconds, self.encode(embedding))
+        except Exception as e:
+            self._disable_persistent(e)
+
+    def _disable_persistent(self, error: Exception) -> None:
+        """Fall back to the in-process tier after a Redis error"""
+        if self._redis is not None:
+            logger.warning(f"[WARNING] Query embedding Redis cache disabled: {error}")
+            self._redis = None
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
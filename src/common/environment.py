@@ -0,0 +1,48 @@
+"""
+Environment Loading
+===================
+
+Loads the project's .env file once per process. Library modules and scripts
+call load_environment() instead of load_dotenv(), so the upward directory
+search for .env and its parsing happen on the first call only, and the
+python-dotenv import is skipped entirely when no .env file exists.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+_loaded_env_file: Optional[Path] = None
+_env_checked = False
+
+
+def _find_env_file() -> Optional[Path]:
+    """Return the nearest .env file in this package's directory or its parents"""
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / '.env'
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_environment() -> Optional[Path]:
+    """
+    Load variables from the project's .env file into os.environ (first call only)
+
+    Variables already set in the environment are never overridden, so credentials
+    supplied directly by CI or the shell take precedence over the file.
+
+    Returns:
+        Path of the loaded .env file, or None if there is none
+    """
+    global _loaded_env_file, _env_checked
+
+    if _env_checked:
+        return _loaded_env_file
+    _env_checked = True
+
+    env_file = _find_env_file()
+    if env_file is not None:
+        from dotenv import load_dotenv
+        load_dotenv(env_file, override=False)
+        _loaded_env_file = env_file
+    return _loaded_env_file
@@ -0,0 +1,55 @@
+"""
+Shared HTTP Client
+==================
+
+Process-wide httpx client for the Azure OpenAI SDK clients (embeddings and
+AI tag generation). Both talk to the same Azure AI Foundry endpoint, so
+sharing one connection pool lets them reuse keep-alive connections instead
+of each client paying its own TCP/TLS handshakes.
+"""
+
+import os
+import threading
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - only needed to enable HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_shared_client: Optional[httpx.Client] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """
+    Get the shared httpx client, creating it on first use
+
+    Pool limits come from HTTP_MAX_CONNECTIONS (default 100) and
+    HTTP_MAX_KEEPALIVE_CONNECTIONS (default 20). HTTP/2 is used when the
+    optional 'h2' package is installed, unless HTTP2_ENABLED=false.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _shared_client
+
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                http2 = HTTP2_AVAILABLE and os.getenv('HTTP2_ENABLED', 'true').lower() == 'true'
+                _shared_client = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=int(os.getenv('HTTP_MAX_CONNECTIONS', '100')),
+                        max_keepalive_connections=int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '20'))
+                    ),
+                    # Matches the OpenAI SDK's default timeout; SDK clients may override per request
+                    timeout=httpx.Timeout(600.0, connect=5.0),
+                    follow_redirects=True
+                )
+
+    return _shared_client
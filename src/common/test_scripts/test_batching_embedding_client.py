@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test Batching Embedding Client
+==============================
+
+Test that the batching embedding client resolves blank texts on their own and
+falls back to per-text embedding when a batched call fails
+"""
+
+import asyncio
+
+
+class FakeEmbeddingGenerator:
+    """Embedding generator that rejects any batch containing a blank text"""
+
+    def __init__(self, fail_batches: bool = False):
+        self.fail_batches = fail_batches
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    async def generate_embeddings_batch(self, texts):
+        self.batch_calls += 1
+        if self.fail_batches or any(not text.strip() for text in texts):
+            raise ValueError("batch rejected")
+        return [[float(len(text)), 1.0] for text in texts]
+
+    async def generate_embedding(self, text):
+        self.single_calls += 1
+        if not text.strip():
+            raise ValueError("blank text")
+        return [float(len(text)), 1.0]
+
+
+async def test_mixed_blank_and_valid_batch():
+    """Test that a blank query doesn't fail the valid queries batched with it"""
+    print("🧪 Testing mixed blank/valid batch...")
+
+    from src.common.embedding_services.batching_embedding_client import BatchingEmbeddingClient
+
+    generator = FakeEmbeddingGenerator()
+    client = BatchingEmbeddingClient(generator, max_wait=0.05)
+    results = await asyncio.gather(
+        client.generate_embedding("hello"),
+        client.generate_embedding("   "),
+        client.generate_embedding("search query"),
+    )
+
+    expected = [[5.0, 1.0], None, [12.0, 1.0]]
+    if results != expected or generator.batch_calls != 1 or generator.single_calls != 0:
+        print(f"❌ Unexpected results: {results} "
+              f"(batch calls: {generator.batch_calls}, single calls: {generator.single_calls})")
+        return False
+
+    print("✅ Blank query resolved as None, valid queries embedded in one batch")
+    return True
+
+
+async def test_failed_batch_falls_back_per_text():
+    """Test that a failed batch call is retried one text at a time"""
+    print("🧪 Testing per-text fallback on batch failure...")
+
+    from src.common.embedding_services.batching_embedding_client import BatchingEmbeddingClient
+
+    generator = FakeEmbeddingGenerator(fail_batches=True)
+    client = BatchingEmbeddingClient(generator, max_wait=0.05)
+    results = await asyncio.gather(
+        client.generate_embedding("first"),
+        client.generate_embedding("second"),
+    )
+
+    if results != [[5.0, 1.0], [6.0, 1.0]] or generator.single_calls != 2:
+        print(f"❌ Unexpected results: {results} (single calls: {generator.single_calls})")
+        return False
+
+    print("✅ Failed batch embedded text by text")
+    return True
+
+
+async def main():
+    """Run all batching embedding client tests"""
+    print("🚀 Batching Embedding Client Test Suite\n")
+
+    results = [
+        await test_mixed_blank_and_valid_batch(),
+        await test_failed_batch_falls_back_per_text(),
+    ]
+
+    if all(results):
+        print("\n✅ All batching embedding client tests passed!")
+    else:
+        print(f"\n❌ {results.count(False)} test(s) failed.")
+
+if __name__ == "__main__":
+    asyncio.run(main())
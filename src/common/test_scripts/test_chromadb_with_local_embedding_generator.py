@@ -7,12 +7,8 @@ Test ChromaDB service with local embedding service
 """
 
 import os
-import sys
 import asyncio
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 async def test_chromadb_with_local_embedding():
     """Test ChromaDB service with local embedding"""
     print("🧪 Testing ChromaDB with Local Embedding Service...")
@@ -24,12 +24,8 @@ Test Local Embedding Service
 """
 
 import os
-import sys
 import asyncio
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 async def test_local_embedding_service():
     """Test local embedding service with all available models"""
     print("🧪 Testing Local Embedding Service - All Models...")
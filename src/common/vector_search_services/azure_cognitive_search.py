@@ -13,16 +13,27 @@ used throughout the Work Item Documentation system.
 """
 
 import os
+import asyncio
+import atexit
+import functools
+import heapq
 import json
+import logging
 import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import sys
-from typing import List, Dict, Optional, Any, Tuple
-from dotenv import load_dotenv
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Dict, Optional, Any, Tuple
+from src.common.environment import load_environment
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Azure Search imports
-from azure.search.documents import SearchClient
+from azure.search.documents import SearchClient, RequestEntityTooLargeError
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     SearchIndex,
@@ -32,6 +43,7 @@ from azure.search.documents.indexes.models import (
     SearchableField,
     VectorSearch,
     HnswAlgorithmConfiguration,
+    HnswParameters,
     VectorSearchProfile,
     SemanticConfiguration,
     SemanticPrioritizedFields,
@@ -39,21 +51,216 @@ from azure.search.documents.indexes.models import (
     SemanticSearch
 )
 from azure.search.documents.models import VectorizedQuery
+
+# Vector compression needs azure-search-documents 11.5+ (API version 2024-07-01)
+try:
+    from azure.search.documents.indexes.models import (
+        ScalarQuantizationCompression,
+        ScalarQuantizationParameters
+    )
+    VECTOR_COMPRESSION_AVAILABLE = True
+except ImportError:
+    VECTOR_COMPRESSION_AVAILABLE = False
+
+# Native async searches use the aio client, whose default transport needs aiohttp;
+# without it async callers fall back to the sync client in a worker thread
+try:
+    import aiohttp  # noqa: F401
+    from azure.search.documents.aio import SearchClient as AsyncSearchClient
+    ASYNC_SEARCH_AVAILABLE = True
+except ImportError:
+    ASYNC_SEARCH_AVAILABLE = False
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 from azure.core.exceptions import ResourceNotFoundError
 
 # Import the vector search interface
 from .vector_search_interface import IVectorSearchService
 
-# ONE simple line to fix all imports - find project root and add src
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / 'src'))
-
 # Import embedding service
 from src.common.embedding_services.embedding_service_factory import get_embedding_generator
+from src.common.embedding_services.query_embedding_cache import QueryEmbeddingCache
+from src.common.embedding_services.batching_embedding_client import BatchingEmbeddingClient
 
 # Load environment variables
-load_dotenv()
+load_environment()
+
+# Operational messages go through logging (stderr by default), never stdout, which
+# carries the protocol stream when the service runs inside the stdio MCP server
+logger = logging.getLogger(__name__)
+
+# Maximum documents per indexing request accepted by Azure Cognitive Search
+MAX_DOCUMENTS_PER_BATCH = 1000
+
+# Fields returned by the search methods: everything except the embedding vector,
+# which would add tens of kilobytes of JSON per result that no caller reads
+SEARCH_RESULT_FIELDS = (
+    "id", "content", "file_path", "file_name", "file_type", "title", "tags",
+    "category", "context_name", "last_modified", "chunk_index", "metadata_json"
+)
+_SEARCH_RESULT_SELECT = ",".join(SEARCH_RESULT_FIELDS)
+_SEARCH_RESULT_SELECT_WITH_VECTOR = _SEARCH_RESULT_SELECT + ",content_vector"
+
+SEMANTIC_CONFIGURATION_NAME = "general-semantic-config"
+
+
+# Index schema parts that don't depend on create_index arguments, built once at import.
+# The content_vector field and the vector search configuration are added per call.
+_INDEX_KEY_FIELDS = (
+    SimpleField(
+        name="id",
+        type=SearchFieldDataType.String,
+        key=True,
+        filterable=True,
+        retrievable=True
+    ),
+    SearchableField(
+        name="content",
+        type=SearchFieldDataType.String,
+        searchable=True,
+        retrievable=True,
+        analyzer_name="standard.lucene"
+    )
+)
+_INDEX_METADATA_FIELDS = (
+    # Core file information
+    SimpleField(
+        name="file_path",
+        type=SearchFieldDataType.String,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    SearchableField(
+        name="file_name",
+        type=SearchFieldDataType.String,
+        searchable=True,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    SimpleField(
+        name="file_type",
+        type=SearchFieldDataType.String,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    # Document metadata
+    SearchableField(
+        name="title",
+        type=SearchFieldDataType.String,
+        searchable=True,
+        retrievable=True
+    ),
+    SearchableField(
+        name="tags",
+        type=SearchFieldDataType.String,  # String instead of Collection(String)
+        # Note: Tags are stored as comma-separated string (e.g., "tag1, tag2") 
+        # rather than array. Tried Collection(String) but document upload failed.
+        # Current implementation in processing_strategies.py line 702 joins tags with ', '
+        searchable=True,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    SearchableField(
+        name="category",
+        type=SearchFieldDataType.String,
+        searchable=True,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    # Context/grouping (flexible - can be work_item_id, project, folder, etc.)
+    SearchableField(
+        name="context_name",
+        type=SearchFieldDataType.String,
+        searchable=True,
+        filterable=True,
+        retrievable=True,
+        facetable=True
+    ),
+    # Timestamps
+    SimpleField(
+        name="last_modified",
+        type=SearchFieldDataType.DateTimeOffset,
+        filterable=True,
+        retrievable=True,
+        sortable=True
+    ),
+    # Chunk information
+    SearchableField(
+        name="chunk_index",
+        type=SearchFieldDataType.String,
+        filterable=True,
+        retrievable=True,
+        sortable=True
+    ),
+    # Optional: Custom metadata as JSON string for strategy-specific data
+    SimpleField(
+        name="metadata_json",
+        type=SearchFieldDataType.String,
+        retrievable=True
+    ),
+    # Hash of the chunk's uploaded fields, used to skip unchanged re-uploads
+    SimpleField(
+        name="content_hash",
+        type=SearchFieldDataType.String,
+        retrievable=True
+    )
+)
+
+# Semantic configuration - matching create_index.py schema
+_SEMANTIC_SEARCH = SemanticSearch(
+    configurations=[
+        SemanticConfiguration(
+            name=SEMANTIC_CONFIGURATION_NAME,
+            prioritized_fields=SemanticPrioritizedFields(
+                title_field=SemanticField(field_name="title"),
+                content_fields=[
+                    SemanticField(field_name="content"),
+                    SemanticField(field_name="file_name")
+                ],
+                keywords_fields=[
+                    SemanticField(field_name="tags"),
+                    SemanticField(field_name="category"),
+                    SemanticField(field_name="context_name"),
+                    # chunk_index as searchable field enables:
+                    # - Direct chunk navigation (e.g., "AppDescription.md_chunk_0")
+                    # - Better semantic understanding of document structure
+                    # - Enhanced ranking for queries about specific sections
+                    # - File-aware chunk searching with enhanced format
+                    SemanticField(field_name="chunk_index")
+                ]
+            )
+        )
+    ]
+)
+
+
+def _freeze_filter_value(value: Any) -> tuple:
+    """
+    Turn a filter value into a hashable cache key that keeps its exact type
+    
+    Types are recorded alongside values because True == 1 and a list filter
+    must not share a key with a tuple value.
+    """
+    if isinstance(value, list):
+        return ('list', tuple(_freeze_filter_value(item) for item in value))
+    if isinstance(value, dict):
+        return ('dict', tuple((op, _freeze_filter_value(item)) for op, item in value.items()))
+    return ('value', type(value), value)
+
+
+def _thaw_filter_value(frozen: tuple) -> Any:
+    """Rebuild a filter value from _freeze_filter_value output"""
+    kind = frozen[0]
+    if kind == 'list':
+        return [_thaw_filter_value(item) for item in frozen[1]]
+    if kind == 'dict':
+        return {op: _thaw_filter_value(item) for op, item in frozen[1]}
+    return frozen[2]
 
 
 class AzureCognitiveSearchFilterBuilder:
@@ -146,76 +353,130 @@ class AzureCognitiveSearchFilterBuilder:
         if not filters:
             return None
 
+        # Identical filter dictionaries (the same context or file searched repeatedly)
+        # are built once; values that can't be frozen into a cache key skip the cache
+        try:
+            frozen_filters = tuple((field_name, _freeze_filter_value(field_value))
+                                   for field_name, field_value in filters.items())
+            hash(frozen_filters)
+        except TypeError:
+            return AzureCognitiveSearchFilterBuilder._build_filter_expression(filters.items())
+        return AzureCognitiveSearchFilterBuilder._build_frozen_filter(frozen_filters)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_frozen_filter(frozen_filters: tuple) -> Optional[str]:
+        """Build (and memoize) the expression for a filter frozen by _freeze_filter_value"""
+        # Filters with only scalar values render through a template compiled once per
+        # shape (field names and value types), so new values skip the type dispatch
+        if all(frozen_value[0] == 'value' for _, frozen_value in frozen_filters):
+            shape = tuple((field_name, frozen_value[1]) for field_name, frozen_value in frozen_filters)
+            template, formatters = AzureCognitiveSearchFilterBuilder._compile_filter_shape(shape)
+            if template is None:
+                return None
+            return template.format(*[format_literal(frozen_value[2])
+                                     for (_, frozen_value), format_literal in zip(frozen_filters, formatters)
+                                     if format_literal is not None])
+        
+        return AzureCognitiveSearchFilterBuilder._build_filter_expression(
+            (field_name, _thaw_filter_value(frozen_value)) for field_name, frozen_value in frozen_filters
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _compile_filter_shape(shape: tuple) -> Tuple[Optional[str], tuple]:
+        """
+        Compile a scalar filter shape into an expression template and literal formatters
+        
+        Args:
+            shape: (field_name, value_type) pairs in filter order
+            
+        Returns:
+            Tuple of (str.format template with one placeholder per non-None value, or
+            None when every value is None; one formatter per field, None for skipped fields)
+        """
         expressions = []
-        for field_name, field_value in filters.items():
+        formatters = []
+        for field_name, value_type in shape:
+            if value_type is type(None):
+                formatters.append(None)
+                continue
+            escaped_field = field_name.replace('{', '{{').replace('}', '}}')
+            expressions.append(f"{escaped_field} eq {{{len(expressions)}}}")
+            formatters.append(AzureCognitiveSearchFilterBuilder._literal_formatter(value_type))
+        template = " and ".join(expressions) if expressions else None
+        return template, tuple(formatters)
+
+    @staticmethod
+    def _literal_formatter(value_type: type) -> Callable[[Any], str]:
+        """Return the function formatting values of one type as OData literals (see _comparison)"""
+        if issubclass(value_type, str):
+            return lambda value: "'" + value.replace("'", "''") + "'"
+        if issubclass(value_type, bool):
+            return lambda value: str(value).lower()
+        if issubclass(value_type, (int, float)):
+            return str
+        return lambda value: "'" + str(value).replace("'", "''") + "'"
+
+    @staticmethod
+    def _build_filter_expression(filter_items) -> Optional[str]:
+        """Convert (field_name, value) pairs to an OData expression (uncached)"""
+        expressions = []
+        for field_name, field_value in filter_items:
             if field_value is None:
                 continue
                 
-            if isinstance(field_value, str):
-                # OData string escaping: single quotes are escaped by doubling them ('→'')
-                # Example: "user's data" becomes "user''s data" in OData expression
-                escaped_value = field_value.replace("'", "''")
-                expressions.append(f"{field_name} eq '{escaped_value}'")
-            elif isinstance(field_value, (int, float)):
-                expressions.append(f"{field_name} eq {field_value}")
-            elif isinstance(field_value, list) and len(field_value) > 0:
-                # Internal recursion: For each list item, we recursively apply the same 
-                # type checking and escaping logic that the main method uses
-                # Handle multiple values with OR expressions
-                if len(field_value) == 1:
-                    # Single item in list - treat as simple value with proper type handling
-                    single_value = field_value[0]
-                    if isinstance(single_value, str):
-                        # OData string escaping: single quotes are escaped by doubling them ('→'')
-                        # NOT by backslash escaping. This follows OData v4.01 specification.
-                        escaped_value = single_value.replace("'", "''")
-                        expressions.append(f"{field_name} eq '{escaped_value}'")
-                    elif isinstance(single_value, (int, float)):
-                        expressions.append(f"{field_name} eq {single_value}")
-                    elif isinstance(single_value, bool):
-                        bool_str = str(single_value).lower()  # Convert True/False to true/false
-                        expressions.append(f"{field_name} eq {bool_str}")
-                    elif single_value is None:
-                        # Skip null values rather than converting to string "None"
-                        continue
-                    else:
-                        # Fallback: convert to string and escape for other types
-                        escaped_value = str(single_value).replace("'", "''")
-                        expressions.append(f"{field_name} eq '{escaped_value}'")
-                else:
-                    # Multiple items - use OR expressions with proper type handling
-                    value_exprs = []
-                    for v in field_value:
-                        if isinstance(v, str):
-                            # OData string escaping: single quotes are escaped by doubling them ('→'')
-                            escaped_value = v.replace("'", "''")
-                            value_exprs.append(f"{field_name} eq '{escaped_value}'")
-                        elif isinstance(v, (int, float)):
-                            value_exprs.append(f"{field_name} eq {v}")
-                        elif isinstance(v, bool):
-                            bool_str = str(v).lower()  # Convert True/False to true/false
-                            value_exprs.append(f"{field_name} eq {bool_str}")
-                        elif v is not None:
-                            # Fallback: convert to string and escape for other types
-                            escaped_value = str(v).replace("'", "''")
-                            value_exprs.append(f"{field_name} eq '{escaped_value}'")
-                        # Skip None values
-                    if value_exprs:  # Only add if we have valid expressions
-                        expressions.append(f"({' or '.join(value_exprs)})")
+            if isinstance(field_value, list):
+                # Handle multiple values with OR expressions (None items are skipped)
+                value_exprs = [AzureCognitiveSearchFilterBuilder._comparison(field_name, 'eq', v)
+                               for v in field_value if v is not None]
+                if len(value_exprs) == 1:
+                    expressions.append(value_exprs[0])
+                elif value_exprs:
+                    expressions.append(f"({' or '.join(value_exprs)})")
             elif isinstance(field_value, dict):
                 # Handle range/comparison operations
-                field_exprs = []
-                for op, val in field_value.items():
-                    if op in ['eq', 'ne', 'gt', 'lt', 'ge', 'le']:
-                        if isinstance(val, str):
-                            escaped_val = val.replace("'", "''")
-                            field_exprs.append(f"{field_name} {op} '{escaped_val}'")
-                        else:
-                            field_exprs.append(f"{field_name} {op} {val}")
+                field_exprs = [AzureCognitiveSearchFilterBuilder._comparison(field_name, op, val)
+                               for op, val in field_value.items()
+                               if op in ['eq', 'ne', 'gt', 'lt', 'ge', 'le']]
                 if field_exprs:
                     expressions.append(f"({' and '.join(field_exprs)})")
+            else:
+                expressions.append(AzureCognitiveSearchFilterBuilder._comparison(field_name, 'eq', field_value))
         return " and ".join(expressions) if expressions else None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _eq_filter(field: str, value: str) -> str:
+        """
+        Build (and memoize) an equality expression for a string value
+        
+        OData string escaping: single quotes are escaped by doubling them ('→''),
+        NOT by backslash escaping. This follows OData v4.01 specification.
+        Example: "user's data" becomes "user''s data" in OData expression
+        """
+        escaped_value = value.replace("'", "''")
+        return f"{field} eq '{escaped_value}'"
+
+    @staticmethod
+    def _comparison(field: str, op: str, value: Any) -> str:
+        """
+        Build a single comparison expression with the value formatted as an OData literal
+        
+        Booleans become true/false, numbers are left bare, and anything else is
+        quoted as an escaped string.
+        """
+        if isinstance(value, str) and op == 'eq':
+            return AzureCognitiveSearchFilterBuilder._eq_filter(field, value)
+        if isinstance(value, bool):
+            literal = str(value).lower()  # Convert True/False to true/false
+        elif isinstance(value, (int, float)):
+            literal = str(value)
+        else:
+            escaped_value = str(value).replace("'", "''")
+            literal = f"'{escaped_value}'"
+        return f"{field} {op} {literal}"
+
     @staticmethod
     def build_text_search_filter(field: str, search_term: str) -> str:
         """
@@ -354,6 +615,10 @@ class AzureCognitiveSearchFilterBuilder:
         return " and ".join(expressions) if expressions else None
 
 
+# Short name used by the service and the Azure scripts
+FilterBuilder = AzureCognitiveSearchFilterBuilder
+
+
 class AzureCognitiveSearch(IVectorSearchService):
     """
     Comprehensive Azure Cognitive Search service class
@@ -366,7 +631,9 @@ class AzureCognitiveSearch(IVectorSearchService):
     def __init__(self, 
                  service_name: Optional[str] = None,
                  admin_key: Optional[str] = None,
-                 index_name: Optional[str] = None):
+                 index_name: Optional[str] = None,
+                 max_connections: Optional[int] = None,
+                 upload_workers: Optional[int] = None):
         """
         Initialize Azure Cognitive Search service
         
@@ -374,6 +641,10 @@ class AzureCognitiveSearch(IVectorSearchService):
             service_name: Azure Search service name (from env if not provided)
             admin_key: Azure Search admin key (from env if not provided)
             index_name: Search index name (from env if not provided)
+            max_connections: Size of the shared HTTPS connection pool
+                             (from AZURE_SEARCH_POOL_SIZE if not provided, default 32)
+            upload_workers: Upload batches sent concurrently (from AZURE_SEARCH_UPLOAD_WORKERS
+                            if not provided, default 4; 1 uploads batches one at a time)
         """
         self.service_name = service_name or os.getenv('AZURE_SEARCH_SERVICE')
         self.admin_key = admin_key or os.getenv('AZURE_SEARCH_KEY')
@@ -387,49 +658,195 @@ class AzureCognitiveSearch(IVectorSearchService):
         self.endpoint = f"https://{self.service_name}.search.windows.net"
         self.credential = AzureKeyCredential(self.admin_key)
         
+        # Throttled requests (429/503) are retried by the SDK retry policy with
+        # exponential backoff, honouring the service's Retry-After header
+        retry_options = {
+            'retry_total': int(os.getenv('AZURE_SEARCH_MAX_RETRIES', '4')),
+            'retry_backoff_factor': float(os.getenv('AZURE_SEARCH_RETRY_BACKOFF', '0.25'))
+        }
+        
+        # Share one pooled HTTPS session between the clients so connections (and their
+        # TLS handshakes) are reused across calls; retries are left to the SDK policy
+        pool_size = max_connections or int(os.getenv('AZURE_SEARCH_POOL_SIZE', '32'))
+        self._http_session = requests.Session()
+        self._http_session.mount('https://', HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+        ))
+        self._timeouts = {
+            'connection_timeout': float(os.getenv('AZURE_SEARCH_CONNECTION_TIMEOUT', '30')),
+            'read_timeout': float(os.getenv('AZURE_SEARCH_READ_TIMEOUT', '300'))
+        }
+        transport = RequestsTransport(
+            session=self._http_session,
+            session_owner=False,
+            **self._timeouts
+        )
+        self._transport = transport
+        self._retry_options = retry_options
+        
+        # Serializes uploads, which share the batch size probe state
+        self._upload_lock = threading.Lock()
+        # Upload batch size: fixed when AZURE_SEARCH_UPLOAD_BATCH_SIZE is set, otherwise
+        # probed on the first uploads (see _tune_upload_batch_size)
+        configured_batch_size = os.getenv('AZURE_SEARCH_UPLOAD_BATCH_SIZE')
+        self._upload_batch_size = int(configured_batch_size) if configured_batch_size else 500
+        self._batch_size_probe: Optional[Dict[str, float]] = (
+            None if configured_batch_size else {'size': 10, 'best_size': 10, 'best_rate': 0.0}
+        )
+        self._upload_workers = max(1, upload_workers or int(os.getenv('AZURE_SEARCH_UPLOAD_WORKERS', '4')))
+        
         # Initialize clients
         self.index_client = SearchIndexClient(
             endpoint=self.endpoint,
-            credential=self.credential
+            credential=self.credential,
+            transport=transport,
+            **retry_options
         )
         
         self.search_client = SearchClient(
             endpoint=self.endpoint,
             index_name=self.index_name,
-            credential=self.credential
+            credential=self.credential,
+            transport=transport,
+            **retry_options
         )
+        atexit.register(self.close)
+        
+        # Async search client, created on first use in the running event loop
+        # (see _get_async_search_client)
+        self._async_search_client = None
+        self._async_search_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Lazy initialization for embedding service (only searches need it)
+        self._embedding_generator = None
+        self._query_embedder = None
+        self.query_embedding_cache = QueryEmbeddingCache()
         
-        self.embedding_generator = get_embedding_generator(provider='openai')
+        # Short-lived cache for slowly-changing index metadata (counts, unique values, stats)
+        self.metadata_cache_ttl = float(os.getenv('SEARCH_METADATA_CACHE_TTL', '60'))
+        self._metadata_cache: Dict[Any, Tuple[float, Any]] = {}
+        self._metadata_cache_lock = threading.Lock()
+        # Field names of the live index schema (see _index_field_names)
+        self._index_fields: Optional[set] = None
 
+    @property
+    def embedding_generator(self):
+        """Lazy initialization of the Azure OpenAI embedding generator"""
+        if self._embedding_generator is None:
+            self._embedding_generator = get_embedding_generator(provider='azure_openai')
+        return self._embedding_generator
+    
+    @property
+    def query_embedder(self) -> BatchingEmbeddingClient:
+        """Lazy batching wrapper that coalesces concurrent query embeddings"""
+        if self._query_embedder is None:
+            self._query_embedder = BatchingEmbeddingClient(self.embedding_generator)
+        return self._query_embedder
+    
+    def close(self):
+        """Close the search clients and the shared HTTP session"""
+        try:
+            self.search_client.close()
+            self.index_client.close()
+            self._http_session.close()
+        except Exception as e:
+            logger.warning(f"[WARNING] Error closing Azure Search clients: {e}")
+    
+    async def aclose(self):
+        """Close the async search client (call from the event loop that used it, e.g. on shutdown)"""
+        client, self._async_search_client = self._async_search_client, None
+        self._async_search_client_loop = None
+        if client is not None:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"[WARNING] Error closing async Azure Search client: {e}")
+    
+    async def _get_async_search_client(self):
+        """
+        Get the aio search client for the running event loop, creating it on first use
+        
+        The aio client's connection pool belongs to the loop it was created on, so a
+        new client is created when called from a different loop, after closing the
+        previous one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_search_client is not None and self._async_search_client_loop is not loop:
+            await self.aclose()
+        if self._async_search_client is None:
+            self._async_search_client = AsyncSearchClient(
+                endpoint=self.endpoint,
+                index_name=self.index_name,
+                credential=self.credential,
+                **self._timeouts,
+                **self._retry_options
+            )
+            self._async_search_client_loop = loop
+        return self._async_search_client
+    
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached metadata value, recomputing it once the TTL has expired
+        
+        Args:
+            key: Cache key for the value
+            compute: Callable producing the value on a miss (exceptions are not cached)
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._metadata_cache_lock:
+            entry = self._metadata_cache.get(key)
+        if entry is not None and now - entry[0] < self.metadata_cache_ttl:
+            return entry[1]
+        
+        value = compute()
+        with self._metadata_cache_lock:
+            self._metadata_cache[key] = (now, value)
+        return value
+    
+    def invalidate_metadata_cache(self) -> None:
+        """Drop cached index metadata after the index changes"""
+        with self._metadata_cache_lock:
+            self._metadata_cache.clear()
+    
     # ===== INDEX MANAGEMENT =====
     
-    def create_index(self, vector_dimensions: int = 1536) -> bool:
+    def create_index(self,
+                     vector_dimensions: int = 1536,
+                     hnsw_m: Optional[int] = None,
+                     hnsw_ef_construction: Optional[int] = None,
+                     hnsw_ef_search: Optional[int] = None) -> bool:
         """
         Create the search index with vector search capabilities
         
+        The HNSW parameters only take effect when the index is created; changing them
+        for an existing index means rebuilding it. Larger m and efConstruction give a
+        denser graph (better recall, slower indexing, more memory); efSearch trades
+        recall against per-query latency, which grows roughly linearly with it.
+        
         Args:
             vector_dimensions: Dimension of the vector embeddings (default 1536 for OpenAI)
+            hnsw_m: Bi-directional links per HNSW node (from AZURE_SEARCH_HNSW_M if None, default 16)
+            hnsw_ef_construction: Candidate list size while building the graph
+                                  (from AZURE_SEARCH_HNSW_EF_CONSTRUCTION if None, default 200)
+            hnsw_ef_search: Candidate list size per query
+                            (from AZURE_SEARCH_HNSW_EF_SEARCH if None, default 100)
             
         Returns:
             bool: True if successful, False otherwise
         """
+        hnsw_m = hnsw_m or int(os.getenv('AZURE_SEARCH_HNSW_M', '16'))
+        hnsw_ef_construction = hnsw_ef_construction or int(os.getenv('AZURE_SEARCH_HNSW_EF_CONSTRUCTION', '200'))
+        hnsw_ef_search = hnsw_ef_search or int(os.getenv('AZURE_SEARCH_HNSW_EF_SEARCH', '100'))
+        
         try:
-            # Define the fields for the index - matching create_index.py schema
+            # Static fields come from the module-level schema; only the vector field varies
             fields = [
-                SimpleField(
-                    name="id",
-                    type=SearchFieldDataType.String,
-                    key=True,
-                    filterable=True,
-                    retrievable=True
-                ),
-                SearchableField(
-                    name="content",
-                    type=SearchFieldDataType.String,
-                    searchable=True,
-                    retrievable=True,
-                    analyzer_name="standard.lucene"
-                ),
+                *_INDEX_KEY_FIELDS,
                 SearchField(
                     name="content_vector",
                     type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
@@ -437,131 +854,42 @@ class AzureCognitiveSearch(IVectorSearchService):
                     vector_search_dimensions=vector_dimensions,
                     vector_search_profile_name="vector-profile"
                 ),
-                # Core file information
-                SimpleField(
-                    name="file_path",
-                    type=SearchFieldDataType.String,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                SearchableField(
-                    name="file_name",
-                    type=SearchFieldDataType.String,
-                    searchable=True,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                SimpleField(
-                    name="file_type",
-                    type=SearchFieldDataType.String,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                # Document metadata
-                SearchableField(
-                    name="title",
-                    type=SearchFieldDataType.String,
-                    searchable=True,
-                    retrievable=True
-                ),
-                SearchableField(
-                    name="tags",
-                    type=SearchFieldDataType.String,  # String instead of Collection(String)
-                    # Note: Tags are stored as comma-separated string (e.g., "tag1, tag2") 
-                    # rather than array. Tried Collection(String) but document upload failed.
-                    # Current implementation in processing_strategies.py line 702 joins tags with ', '
-                    searchable=True,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                SearchableField(
-                    name="category",
-                    type=SearchFieldDataType.String,
-                    searchable=True,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                # Context/grouping (flexible - can be work_item_id, project, folder, etc.)
-                SearchableField(
-                    name="context_name",
-                    type=SearchFieldDataType.String,
-                    searchable=True,
-                    filterable=True,
-                    retrievable=True,
-                    facetable=True
-                ),
-                # Timestamps
-                SimpleField(
-                    name="last_modified",
-                    type=SearchFieldDataType.DateTimeOffset,
-                    filterable=True,
-                    retrievable=True,
-                    sortable=True
-                ),
-                # Chunk information
-                SearchableField(
-                    name="chunk_index",
-                    type=SearchFieldDataType.String,
-                    filterable=True,
-                    retrievable=True,
-                    sortable=True
-                ),
-                # Optional: Custom metadata as JSON string for strategy-specific data
-                SimpleField(
-                    name="metadata_json",
-                    type=SearchFieldDataType.String,
-                    retrievable=True
-                )
+                *_INDEX_METADATA_FIELDS
             ]
             
             # Configure vector search
+            # Store an int8 scalar-quantized copy of the vectors for the HNSW graph when the
+            # SDK supports it: about 4x less vector index memory at a small recall cost
+            use_quantization = (VECTOR_COMPRESSION_AVAILABLE and
+                                os.getenv('AZURE_SEARCH_SCALAR_QUANTIZATION', 'true').lower() == 'true')
+            compression_options = {}
+            profile_options = {}
+            if use_quantization:
+                compression_options['compressions'] = [
+                    ScalarQuantizationCompression(
+                        compression_name="scalar-quantization",
+                        parameters=ScalarQuantizationParameters(quantized_data_type="int8")
+                    )
+                ]
+                profile_options['compression_name'] = "scalar-quantization"
+            
             vector_search = VectorSearch(
                 profiles=[
                     VectorSearchProfile(
                         name="vector-profile",
-                        algorithm_configuration_name="hnsw-algorithm"
+                        algorithm_configuration_name="hnsw-algorithm",
+                        **profile_options
                     )
                 ],
+                **compression_options,
                 algorithms=[
                     HnswAlgorithmConfiguration(
                         name="hnsw-algorithm",
-                        parameters={
-                            "metric": "cosine",
-                            "m": 4,
-                            "efConstruction": 400,
-                            "efSearch": 500
-                        }
-                    )
-                ]
-            )
-            
-            # Configure semantic search - matching create_index.py schema
-            semantic_search = SemanticSearch(
-                configurations=[
-                    SemanticConfiguration(
-                        name="general-semantic-config",
-                        prioritized_fields=SemanticPrioritizedFields(
-                            title_field=SemanticField(field_name="title"),
-                            content_fields=[
-                                SemanticField(field_name="content"),
-                                SemanticField(field_name="file_name")
-                            ],
-                            keywords_fields=[
-                                SemanticField(field_name="tags"),
-                                SemanticField(field_name="category"),
-                                SemanticField(field_name="context_name"),
-                                # chunk_index as searchable field enables:
-                                # - Direct chunk navigation (e.g., "AppDescription.md_chunk_0")
-                                # - Better semantic understanding of document structure
-                                # - Enhanced ranking for queries about specific sections
-                                # - File-aware chunk searching with enhanced format
-                                SemanticField(field_name="chunk_index")
-                            ]
+                        parameters=HnswParameters(
+                            metric="cosine",
+                            m=hnsw_m,
+                            ef_construction=hnsw_ef_construction,
+                            ef_search=hnsw_ef_search
                         )
                     )
                 ]
@@ -572,17 +900,21 @@ class AzureCognitiveSearch(IVectorSearchService):
                 name=self.index_name,
                 fields=fields,
                 vector_search=vector_search,
-                semantic_search=semantic_search
+                semantic_search=_SEMANTIC_SEARCH
             )
             
             # Create or update the index
             result = self.index_client.create_or_update_index(index)
+            self.invalidate_metadata_cache()
+            self._index_fields = None
             print(f"[SUCCESS] Index '{self.index_name}' created successfully!")
             print(f"   Service: {self.service_name}")
             print(f"   Endpoint: {self.endpoint}")
             print(f"   Fields: {len(fields)} (optimized for general-purpose search)")
             print("   Core Features:")
             print(f"   - Vector search enabled ({vector_dimensions} dimensions)")
+            print(f"   - HNSW parameters: m={hnsw_m}, efConstruction={hnsw_ef_construction}, efSearch={hnsw_ef_search}")
+            print(f"   - Scalar quantization (int8): {'enabled' if use_quantization else 'disabled'}")
             print("   - Semantic search configured")
             print("   - File name and metadata search")
             print("   - Context-based grouping (flexible)")
@@ -607,7 +939,7 @@ class AzureCognitiveSearch(IVectorSearchService):
         except ResourceNotFoundError:
             return False
         except Exception as e:
-            print(f"[ERROR] Error checking index existence: {e}")
+            logger.error(f"[ERROR] Error checking index existence: {e}")
             return False
     
     def delete_index(self) -> bool:
@@ -619,62 +951,32 @@ class AzureCognitiveSearch(IVectorSearchService):
         """
         try:
             self.index_client.delete_index(self.index_name)
-            print(f"🗑️  Index '{self.index_name}' deleted successfully")
+            self.invalidate_metadata_cache()
+            self._index_fields = None
+            logger.info("[SUCCESS] Index '%s' deleted", self.index_name)
             return True
         except Exception as e:
-            print(f"[ERROR] Error deleting index: {e}")
+            logger.error(f"[ERROR] Error deleting index: {e}")
             return False
     
-    def get_index_stats(self) -> Dict[str, Any]:
+    def get_index_stats(self, include_field_values: bool = True) -> Dict[str, Any]:
         """
         Get comprehensive statistics about the search index
         
+        Args:
+            include_field_values: Also collect the context, file type and category
+                                  values (one faceted query); the counts and
+                                  sizes alone come from one statistics call
+        
         Returns:
             Dict containing detailed index statistics including document counts,
-            context information, file types, categories, and other metadata
+            storage size, context information, file types, categories, and other metadata
         """
         try:
-            # Get total document count
-            results = self.search_client.search("*", select="id", top=0, include_total_count=True)
-            document_count = results.get_count()
-            
-            # Get statistics for all facetable fields in the new schema
-            contexts = self.get_unique_field_values("context_name")
-            file_types = self.get_unique_field_values("file_type")
-            categories = self.get_unique_field_values("category")
-            
-            # Get context names for better readability
-            context_names = self.get_unique_field_values("context_name")
-            
-            # Build comprehensive stats
-            stats = {
-                'index_name': self.index_name,
-                'service_name': self.service_name,
-                'endpoint': self.endpoint,
-                'document_count': document_count,
-                'context_count': len(contexts),
-                'contexts': sorted(contexts) if contexts else [],
-                'context_names': sorted(context_names) if context_names else [],
-                'file_types': sorted(file_types) if file_types else [],
-                'file_type_count': len(file_types),
-                'categories': sorted(categories) if categories else [],
-                'category_count': len(categories),
-                'schema_version': 'flexible_context_v1',
-                'features': {
-                    'vector_search': True,
-                    'semantic_search': True,
-                    'hybrid_search': True,
-                    'context_filtering': True,
-                    'file_metadata': True,
-                    'chunk_indexing': True,
-                    'timestamp_tracking': True
-                }
-            }
-            
-            return stats
-            
+            return self._cached(('index_stats', include_field_values),
+                                lambda: self._compute_index_stats(include_field_values))
         except Exception as e:
-            print(f"[ERROR] Error getting index stats: {e}")
+            logger.error(f"[ERROR] Error getting index stats: {e}")
             return {
                 'index_name': self.index_name,
                 'error': str(e),
@@ -682,39 +984,281 @@ class AzureCognitiveSearch(IVectorSearchService):
                 'context_count': 0
             }
     
+    def _compute_index_stats(self, include_field_values: bool = True) -> Dict[str, Any]:
+        """Build the get_index_stats dictionary (uncached; raises on failure)"""
+        # Document count and storage come from the index statistics endpoint, which
+        # reads service metadata instead of executing a search
+        index_statistics = self.index_client.get_index_statistics(self.index_name)
+        document_count = index_statistics.get('document_count', 0)
+        
+        # Get statistics for all facetable fields in the new schema, in one faceted query
+        if include_field_values:
+            facet_values = self._facet_values(("context_name", "file_type", "category"))
+            contexts = facet_values["context_name"]
+            file_types = facet_values["file_type"]
+            categories = facet_values["category"]
+        else:
+            contexts, file_types, categories = [], [], []
+        
+        # Context names are the context values themselves
+        context_names = contexts
+        
+        # Build comprehensive stats
+        stats = {
+            'index_name': self.index_name,
+            'service_name': self.service_name,
+            'endpoint': self.endpoint,
+            'document_count': document_count,
+            'storage_size': index_statistics.get('storage_size', 0),
+            'vector_index_size': index_statistics.get('vector_index_size', 0),
+            'context_count': len(contexts),
+            'contexts': sorted(contexts) if contexts else [],
+            'context_names': sorted(context_names) if context_names else [],
+            'file_types': sorted(file_types) if file_types else [],
+            'file_type_count': len(file_types),
+            'categories': sorted(categories) if categories else [],
+            'category_count': len(categories),
+            'schema_version': 'flexible_context_v1',
+            'features': {
+                'vector_search': True,
+                'semantic_search': True,
+                'hybrid_search': True,
+                'context_filtering': True,
+                'file_metadata': True,
+                'chunk_indexing': True,
+                'timestamp_tracking': True
+            }
+        }
+        
+        return stats
+    
     # ===== DOCUMENT OPERATIONS =====
     
+    def _tune_upload_batch_size(self, search_objects: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Probe for the fastest upload batch size using the leading search objects
+        
+        Uploads batches of 10, 20, 40, ... (up to the 1000-document service limit) and
+        measures documents per second. Growth stops once throughput drops by more than 10%
+        or a batch is rejected as too large; the best size seen is then locked in for
+        later uploads. A probe that runs out of objects resumes on the next upload.
+        
+        Args:
+            search_objects: Objects to upload; a leading slice is consumed by the probe
+            
+        Returns:
+            Tuple of (successful_uploads, objects_consumed)
+        """
+        probe = self._batch_size_probe
+        successful = 0
+        position = 0
+        finished = False
+        
+        while position < len(search_objects):
+            batch_size = int(probe['size'])
+            batch = search_objects[position:position + batch_size]
+            if len(batch) < batch_size:
+                # Too few objects left for a fair measurement at this size
+                break
+            
+            try:
+                started = time.perf_counter()
+                results = self.search_client.upload_documents(documents=batch)
+                elapsed = max(time.perf_counter() - started, 1e-6)
+            except RequestEntityTooLargeError:
+                probe['best_size'] = max(1, min(probe['best_size'], batch_size // 2))
+                finished = True
+                break
+            except Exception as e:
+                # Leave the batch to the regular upload (which retries) and stop probing
+                logger.warning(f"[WARNING] Upload batch size probe stopped: {e}")
+                finished = True
+                break
+            
+            position += len(batch)
+            for result in results:
+                if result.succeeded:
+                    successful += 1
+                else:
+                    logger.error(f"[ERROR] Upload failed: {result.error_message}")
+            
+            rate = len(batch) / elapsed
+            if rate < probe['best_rate'] * 0.9:
+                finished = True
+                break
+            if rate > probe['best_rate']:
+                probe['best_rate'], probe['best_size'] = rate, batch_size
+            if batch_size * 2 > MAX_DOCUMENTS_PER_BATCH:
+                finished = True
+                break
+            probe['size'] = batch_size * 2
+        
+        if finished:
+            self._upload_batch_size = int(probe['best_size'])
+            self._batch_size_probe = None
+            logger.info(f"[INFO] Upload batch size tuned to {self._upload_batch_size} documents")
+        
+        return successful, position
+    
+    def _upload_concurrently(self, search_objects: List[Dict[str, Any]]) -> int:
+        """
+        Upload search objects in batches of the upload batch size, several batches at once
+        
+        Batches go out on up to upload_workers threads, overlapping the request
+        round-trips; the pooled HTTP session keeps one connection per worker.
+        
+        Returns:
+            Number of documents indexed
+        """
+        batch_size = self._upload_batch_size
+        batches = [search_objects[i:i + batch_size] for i in range(0, len(search_objects), batch_size)]
+        workers = min(self._upload_workers, len(batches))
+        if workers <= 1:
+            return sum(self._upload_batch_with_retry(batch) for batch in batches)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(self._upload_batch_with_retry, batches))
+    
+    def _upload_batch_with_retry(self, batch: List[Dict[str, Any]], max_retries: int = 5) -> int:
+        """
+        Upload one batch, splitting it if the service rejects it as too large
+        
+        Documents the service throttles individually (status 429 or 503 inside a
+        successful response) are resent with exponential backoff, up to max_retries
+        times. Whole-request throttling is already retried by the SDK retry policy.
+        
+        Returns:
+            Number of documents indexed (errors are logged, never raised)
+        """
+        pending = batch
+        succeeded = 0
+        try:
+            for attempt in range(max_retries + 1):
+                try:
+                    results = self.search_client.upload_documents(documents=pending)
+                except RequestEntityTooLargeError:
+                    if len(pending) == 1:
+                        logger.error(f"[ERROR] Upload failed: document {pending[0].get('id')} is too large")
+                        return succeeded
+                    middle = len(pending) // 2
+                    return (succeeded + self._upload_batch_with_retry(pending[:middle], max_retries)
+                            + self._upload_batch_with_retry(pending[middle:], max_retries))
+                
+                documents_by_key = {document.get('id'): document for document in pending}
+                throttled = []
+                for result in results:
+                    if result.succeeded:
+                        succeeded += 1
+                    elif result.status_code in (429, 503) and result.key in documents_by_key:
+                        throttled.append(documents_by_key[result.key])
+                    else:
+                        logger.error(f"[ERROR] Upload failed: {result.key}: {result.error_message}")
+                
+                if not throttled:
+                    return succeeded
+                pending = throttled
+                if attempt < max_retries:
+                    time.sleep(min(2 ** attempt, 30))
+            
+            logger.error(f"[ERROR] Upload failed: {len(pending)} documents still throttled after {max_retries} retries")
+        except Exception as e:
+            logger.error(f"[ERROR] Upload batch failed: {e}")
+        return succeeded
+    
     def upload_search_objects_batch(self, search_objects: List[Dict[str, Any]]) -> Tuple[int, int]:
         """
         Upload search objects directly to Azure Cognitive Search (new format)
         
+        Objects go out in batches of the upload batch size rather than one request per
+        object, up to upload_workers batches at a time (see _upload_concurrently).
+        
         Args:
             search_objects: List of search objects ready for upload
             
         Returns:
             Tuple of (successful_uploads, failed_uploads)
         """
-        successful = 0
-        failed = 0
+        if not search_objects:
+            return 0, 0
+        
+        logger.debug("Uploading %d search objects", len(search_objects))
         
-        for i, search_object in enumerate(search_objects, 1):
-            print(f"Uploading document {i}/{len(search_objects)}: {search_object.get('file_name', 'Unknown')}")
+        # The batch size probe is shared, so uploads are serialized per service
+        successful = 0
+        with self._upload_lock:
             try:
-                # Upload the search object directly using Azure SDK
-                result = self.search_client.upload_documents(documents=[search_object])
+                remaining, unchanged = self._skip_unchanged(search_objects)
+                successful += unchanged
+                if self._batch_size_probe is not None:
+                    probed_successes, consumed = self._tune_upload_batch_size(remaining)
+                    successful += probed_successes
+                    remaining = remaining[consumed:]
                 
-                if result[0].succeeded:
-                    successful += 1
-                else:
-                    failed += 1
-                    print(f"[ERROR] Upload failed: {result[0].error_message}")
-                    
+                if remaining:
+                    successful += self._upload_concurrently(remaining)
             except Exception as e:
-                failed += 1
-                print(f"[ERROR] Upload failed: {e}")
+                logger.error(f"[ERROR] Upload failed: {e}")
         
-        return successful, failed
+        self.invalidate_metadata_cache()
+        # Anything not confirmed as indexed (failed, or dropped by an aborted upload) counts as failed
+        return successful, len(search_objects) - successful
 
+    def _index_field_names(self) -> set:
+        """Return the index's field names, read once until the index is recreated or deleted"""
+        if self._index_fields is None:
+            self._index_fields = {field.name for field in self.index_client.get_index(self.index_name).fields}
+        return self._index_fields
+    
+    def _skip_unchanged(self, search_objects: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Drop search objects whose content_hash matches the stored document
+        
+        The stored hashes of the batch's ids are read with one id-and-hash query per
+        1000 objects, so re-ingesting unchanged files sends no vectors. Indexes created
+        before the content_hash field existed get the objects without the field.
+        
+        Args:
+            search_objects: Search objects about to be uploaded
+            
+        Returns:
+            Tuple of (objects to upload, number of unchanged objects skipped)
+        """
+        hashes = {obj['id']: obj['content_hash'] for obj in search_objects if obj.get('content_hash')}
+        if not hashes:
+            return search_objects, 0
+        
+        try:
+            has_hash_field = 'content_hash' in self._index_field_names()
+        except Exception as e:
+            logger.warning(f"[WARNING] Could not read index schema, uploading without content hashes: {e}")
+            has_hash_field = False
+        if not has_hash_field:
+            stripped = [{k: v for k, v in obj.items() if k != 'content_hash'} for obj in search_objects]
+            return stripped, 0
+        
+        stored_hashes = {}
+        ids = list(hashes)
+        try:
+            for start in range(0, len(ids), MAX_DOCUMENTS_PER_BATCH):
+                batch_ids = ids[start:start + MAX_DOCUMENTS_PER_BATCH]
+                id_list = ','.join(doc_id.replace("'", "''") for doc_id in batch_ids)
+                for result in self.search_client.search(
+                    search_text=None,
+                    filter=f"search.in(id, '{id_list}', ',')",
+                    select="id,content_hash",
+                    top=len(batch_ids)
+                ):
+                    stored_hashes[result['id']] = result.get('content_hash')
+        except Exception as e:
+            logger.warning(f"[WARNING] Could not read stored content hashes, uploading all objects: {e}")
+            return search_objects, 0
+        
+        changed = [obj for obj in search_objects
+                   if not obj.get('content_hash') or stored_hashes.get(obj['id']) != obj['content_hash']]
+        unchanged = len(search_objects) - len(changed)
+        if unchanged:
+            logger.info("[INFO] Skipping %d unchanged search objects", unchanged)
+        return changed, unchanged
+    
     def delete_document(self, document_id: str) -> bool:
         """
         Delete a specific document by ID
@@ -727,16 +1271,17 @@ class AzureCognitiveSearch(IVectorSearchService):
         """
         try:
             result = self.search_client.delete_documents(documents=[{"id": document_id}])
+            self.invalidate_metadata_cache()
             
             if result[0].succeeded:
-                print(f"[SUCCESS] Document {document_id} deleted successfully")
+                logger.info(f"[SUCCESS] Document {document_id} deleted successfully")
                 return True
             else:
-                print(f"[ERROR] Failed to delete document: {result[0].error_message}")
+                logger.error(f"[ERROR] Failed to delete document: {result[0].error_message}")
                 return False
                 
         except Exception as e:
-            print(f"[ERROR] Delete failed for {document_id}: {e}")
+            logger.error(f"[ERROR] Delete failed for {document_id}: {e}")
             return False
     
     def delete_documents_by_filter(self, filters: Dict[str, Any]) -> int:
@@ -753,38 +1298,32 @@ class AzureCognitiveSearch(IVectorSearchService):
             # Build filter expression using FilterBuilder
             filter_expr = FilterBuilder.build_filter(filters)
             if not filter_expr:
-                print("[ERROR] No valid filter provided")
+                logger.error("[ERROR] No valid filter provided")
                 return 0
             
-            # Find all documents matching the filter
-            results = self.search_client.search(
-                search_text="*",
-                filter=filter_expr,
-                select="id"
-            )
+            # Delete page by page as the matching ids are read
+            successful_deletes, attempted = self._delete_id_pages(self._iter_id_pages(filter_expr))
             
-            documents_to_delete = [{"id": result["id"]} for result in results]
-            
-            if not documents_to_delete:
-                print(f"[INFO] No documents found matching filter: {filter_expr}")
+            if not attempted:
+                logger.info(f"[INFO] No documents found matching filter: {filter_expr}")
                 return 0
             
-            # Delete the documents
-            delete_results = self.search_client.delete_documents(documents=documents_to_delete)
-            
-            successful_deletes = sum(1 for result in delete_results if result.succeeded)
-            print(f"[SUCCESS] Deleted {successful_deletes}/{len(documents_to_delete)} documents matching filter: {filter_expr}")
+            logger.info(f"[SUCCESS] Deleted {successful_deletes}/{attempted} documents matching filter: {filter_expr}")
             
             return successful_deletes
             
         except Exception as e:
-            print(f"[ERROR] Failed to delete documents: {e}")
+            logger.error(f"[ERROR] Failed to delete documents: {e}")
             return 0
     
     def delete_documents_by_filename(self, filename: str) -> int:
         """
         Delete all documents that match a specific filename
         
+        An exact file name or full path is matched by a server-side filter and
+        deleted page by page. Only when nothing matches exactly does it fall back
+        to scanning every path for a case-insensitive partial match.
+        
         Args:
             filename: The filename to search for (can be partial or full path)
             
@@ -794,15 +1333,18 @@ class AzureCognitiveSearch(IVectorSearchService):
         try:
             from pathlib import Path
             
-            # Get all documents to search through them
-            results = self.search_client.search(
-                search_text="*",
-                select="id,file_path,context_name"
-            )
+            escaped = filename.replace("'", "''")
+            exact_filter = f"file_name eq '{escaped}' or file_path eq '{escaped}'"
+            successful_deletes, attempted = self._delete_id_pages(self._iter_id_pages(exact_filter))
+            if attempted:
+                logger.info(f"[SUCCESS] Deleted {successful_deletes}/{attempted} documents matching filename '{filename}'")
+                return successful_deletes
             
-            documents_to_delete = []
-            matched_files = []
+            # Scan every document's path in full 1000-row pages. Only the matching ids
+            # are kept; deleting mid-scan would shift the skip offsets of later pages.
+            results = self._scan_fields("id,file_path,context_name")
             
+            matching_ids = []
             filename_lower = filename.lower()
             
             for result in results:
@@ -818,71 +1360,215 @@ class AzureCognitiveSearch(IVectorSearchService):
                     filename_lower in file_basename or
                     filename_lower in file_path_lower):
                     
-                    documents_to_delete.append({"id": result["id"]})
-                    matched_files.append({
-                        "id": result["id"],
-                        "file_path": file_path,
-                        "context_name": result.get("context_name", "")
-                    })
-            
-            if not documents_to_delete:
-                print(f"No documents found matching filename: {filename}")
-                return 0
-            
-            # Show what will be deleted
-            print(f"[INFO] Found {len(documents_to_delete)} documents matching '{filename}':")
-            for file_info in matched_files:
-                print(f"   - {file_info['file_path']} (Context: {file_info['context_name']})")
+                    if not matching_ids:
+                        logger.info(f"[INFO] Documents matching '{filename}':")
+                    matching_ids.append(result["id"])
+                    logger.info(f"   - {file_path} (Context: {result.get('context_name', '')})")
             
-            # Delete the documents
-            delete_results = self.search_client.delete_documents(documents=documents_to_delete)
+            if not matching_ids:
+                logger.info(f"[INFO] No documents found matching filename: {filename}")
+                return 0
             
-            successful_deletes = sum(1 for result in delete_results if result.succeeded)
-            print(f"[SUCCESS] Deleted {successful_deletes}/{len(documents_to_delete)} documents matching filename '{filename}'")
+            # Delete the documents in batches of at most 1000 actions
+            pages = ([{"id": doc_id} for doc_id in matching_ids[start:start + MAX_DOCUMENTS_PER_BATCH]]
+                     for start in range(0, len(matching_ids), MAX_DOCUMENTS_PER_BATCH))
+            successful_deletes, attempted = self._delete_id_pages(pages)
+            logger.info(f"[SUCCESS] Deleted {successful_deletes}/{attempted} documents matching filename '{filename}'")
             
             return successful_deletes
             
         except Exception as e:
-            print(f"[ERROR] Delete by filename failed for '{filename}': {e}")
+            logger.error(f"[ERROR] Delete by filename failed for '{filename}': {e}")
             return 0
     
-    def delete_all_documents(self) -> int:
+    def delete_all_documents(self, fast: bool = False) -> int:
         """
         Delete all documents from the index (use with caution!)
         
+        Args:
+            fast: Drop and recreate the index from its current definition instead of
+                  deleting documents in batches (two calls regardless of index size)
+        
         Returns:
             int: Number of documents deleted
         """
         try:
-            # Get all document IDs
-            results = self.search_client.search(search_text="*", select="id")
-            documents_to_delete = [{"id": result["id"]} for result in results]
-            
-            if not documents_to_delete:
-                print("No documents found to delete")
+            if fast:
+                index_definition = self.index_client.get_index(self.index_name)
+                # Read the live count; the cached get_document_count may be up to a TTL old
+                document_count = self._count_documents()
+                self.index_client.delete_index(self.index_name)
+                self.invalidate_metadata_cache()
+                self._index_fields = None
+                if not self._recreate_index(index_definition):
+                    return 0
+                logger.info(f"[SUCCESS] Index '{self.index_name}' recreated, {document_count} documents removed")
+                return document_count
+            
+            total_deleted, attempted = self._delete_id_pages(self._iter_id_pages(), verbose=True)
+            
+            if not attempted:
+                logger.info("[INFO] No documents found to delete")
                 return 0
             
-            # Delete in batches of 1000 (Azure Search limit)
-            batch_size = 1000
-            total_deleted = 0
-            
-            for i in range(0, len(documents_to_delete), batch_size):
-                batch = documents_to_delete[i:i + batch_size]
-                delete_results = self.search_client.delete_documents(documents=batch)
-                successful_deletes = sum(1 for result in delete_results if result.succeeded)
-                total_deleted += successful_deletes
-                print(f"Deleted batch {i//batch_size + 1}: {successful_deletes}/{len(batch)} documents")
-            
-            print(f"[SUCCESS] Total documents deleted: {total_deleted}")
+            logger.info(f"[SUCCESS] Total documents deleted: {total_deleted}")
             return total_deleted
             
         except Exception as e:
-            print(f"[ERROR] Delete all failed: {e}")
+            logger.error(f"[ERROR] Delete all failed: {e}")
             return 0
     
+    def _recreate_index(self, index_definition: SearchIndex, max_attempts: int = 5) -> bool:
+        """
+        Create an index from a definition just after dropping it, retrying with backoff
+        
+        Creation can fail transiently (throttling, or a conflict while the old index is
+        still being removed); at that point the index no longer exists, so it is retried
+        rather than given up on after one attempt.
+        
+        Returns:
+            bool: True if the index was created
+        """
+        for attempt in range(max_attempts):
+            try:
+                self.index_client.create_index(index_definition)
+                return True
+            except Exception as e:
+                if attempt + 1 == max_attempts:
+                    logger.error(f"[ERROR] Index '{self.index_name}' was deleted but could not be recreated "
+                                 f"after {max_attempts} attempts: {e}. The index is now MISSING; "
+                                 f"recreate it with create_index before uploading or searching.")
+                    return False
+                delay = min(2 ** attempt, 30)
+                logger.warning(f"[WARNING] Recreating index '{self.index_name}' failed ({e}); retrying in {delay}s")
+                time.sleep(delay)
+        return False
+    
+    def _iter_id_pages(self, filter_expr: Optional[str] = None) -> Iterator[List[Dict[str, str]]]:
+        """
+        Yield delete actions ({"id": ...}) for matching documents, up to 1000 per page
+        
+        Each page is a fresh query for the first 1000 matches, so it must be deleted
+        before the next page is requested; skip-based paging would miss documents as
+        deletes shift the result offsets. Ids from the last two pages are skipped in
+        case the index has not yet refreshed, and the generator waits briefly (up to
+        three times) when a page holds nothing but such ids.
+        """
+        recent_pages: Deque[set] = deque(maxlen=2)
+        stale_rounds = 0
+        
+        while True:
+            results = self.search_client.search(
+                search_text=None, filter=filter_expr, select="id", top=MAX_DOCUMENTS_PER_BATCH
+            )
+            ids = [result["id"] for result in results]
+            if not ids:
+                return
+            
+            fresh_ids = [doc_id for doc_id in ids if not any(doc_id in page for page in recent_pages)]
+            if not fresh_ids:
+                stale_rounds += 1
+                if stale_rounds > 3:
+                    logger.warning(f"[WARNING] {len(ids)} deleted documents are still visible in the index")
+                    return
+                time.sleep(1.0)
+                continue
+            
+            stale_rounds = 0
+            recent_pages.append(set(fresh_ids))
+            yield [{"id": doc_id} for doc_id in fresh_ids]
+    
+    def _delete_id_pages(self, pages: Iterable[List[Dict[str, str]]], verbose: bool = False) -> Tuple[int, int]:
+        """
+        Delete each page of actions from _iter_id_pages as it is produced
+        
+        Returns:
+            Tuple of (documents deleted, documents attempted)
+        """
+        total_deleted = 0
+        attempted = 0
+        for batch_number, batch in enumerate(pages, 1):
+            delete_results = self.search_client.delete_documents(documents=batch)
+            successful_deletes = sum(1 for result in delete_results if result.succeeded)
+            total_deleted += successful_deletes
+            attempted += len(batch)
+            if verbose:
+                logger.info("Deleted batch %d: %d/%d documents", batch_number, successful_deletes, len(batch))
+        
+        if attempted:
+            self.invalidate_metadata_cache()
+        return total_deleted, attempted
+    
     # ===== SEARCH OPERATIONS =====
     
-    def text_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
+    def _scan_field_pages(self, select: str, filter_expr: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        Yield every matching document, restricted to the selected fields, in pages of 1000
+        
+        Without an explicit top the service pages at 50 rows, so a full scan would take
+        20 times as many requests. Pages are requested with top/skip, which the service
+        caps at a skip of 100,000. No search text is sent: like the other id and count
+        reads, this is a filter-only query with nothing to parse or score.
+        
+        Args:
+            select: Comma-separated fields to return (keep it narrow; never the vector)
+            filter_expr: Optional OData filter
+        """
+        skip = 0
+        while True:
+            page = list(self.search_client.search(
+                search_text=None,
+                filter=filter_expr,
+                select=select,
+                top=MAX_DOCUMENTS_PER_BATCH,
+                skip=skip
+            ))
+            if not page:
+                return
+            yield page
+            if len(page) < MAX_DOCUMENTS_PER_BATCH:
+                return
+            skip += len(page)
+    
+    def _scan_fields(self, select: str, filter_expr: Optional[str] = None) -> Iterator[Dict]:
+        """Yield matching documents one at a time from _scan_field_pages"""
+        for page in self._scan_field_pages(select, filter_expr):
+            yield from page
+    
+    @staticmethod
+    def _result_select(include_vector: bool) -> str:
+        """Return the select list for search results, with or without the vector"""
+        return _SEARCH_RESULT_SELECT_WITH_VECTOR if include_vector else _SEARCH_RESULT_SELECT
+    
+    def _iter_search(self, **search_kwargs) -> Iterator[Dict]:
+        """
+        Run a search and yield its results; continuation pages are fetched only as consumed
+        
+        The SDK already builds a fresh plain dict per result, so results are passed
+        through as-is instead of being copied.
+        """
+        yield from self.search_client.search(**search_kwargs)
+    
+    def _search_to_list(self, **search_kwargs) -> List[Dict]:
+        """Run a search and read every result page (blocking)"""
+        return list(self._iter_search(**search_kwargs))
+    
+    async def _search_async(self, **search_kwargs) -> List[Dict]:
+        """
+        Run a search and read every result page without blocking the event loop
+        
+        Uses the aio client when available; otherwise the sync client runs in a
+        worker thread so concurrent searches don't block the loop (or each other).
+        """
+        if not ASYNC_SEARCH_AVAILABLE:
+            return await asyncio.to_thread(self._search_to_list, **search_kwargs)
+        
+        client = await self._get_async_search_client()
+        results = await client.search(**search_kwargs)
+        return [result async for result in results]
+    
+    def text_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                    stream: bool = False, include_vector: bool = False) -> Iterable[Dict]:
         """
         Perform text-based search
         
@@ -890,45 +1576,85 @@ class AzureCognitiveSearch(IVectorSearchService):
             query: Search query string
             filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
             top: Maximum number of results
+            stream: Return a lazy iterator instead of a list (request errors are then
+                    raised while iterating rather than reported here)
+            include_vector: Also return each result's content_vector
             
         Returns:
-            List of search result dictionaries
+            List (or iterator, when streaming) of search result dictionaries
         """
         try:
             # Build filter expression using FilterBuilder
             filter_expr = FilterBuilder.build_filter(filters)
             
-            results = self.search_client.search(
-                search_text=query,
-                filter=filter_expr,
-                top=top,
-                highlight_fields="content",
-                select="*"
-            )
+            results = self._iter_search(**self._text_search_kwargs(query, filter_expr, top, include_vector))
             
-            return [dict(result) for result in results]
+            return results if stream else list(results)
             
         except Exception as e:
-            print(f"[ERROR] Text search failed: {e}")
+            logger.error(f"[ERROR] Text search failed: {e}")
             return []
     
-    async def vector_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
+    async def text_search_async(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                                include_vector: bool = False) -> List[Dict]:
         """
-        Perform vector-based semantic search
+        Perform text-based search without blocking the event loop
         
         Args:
             query: Search query string
             filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
             top: Maximum number of results
+            include_vector: Also return each result's content_vector
+            
+        Returns:
+            List of search result dictionaries
+        """
+        try:
+            filter_expr = FilterBuilder.build_filter(filters)
+            return await self._search_async(**self._text_search_kwargs(query, filter_expr, top, include_vector))
+        except Exception as e:
+            logger.error(f"[ERROR] Text search failed: {e}")
+            return []
+    
+    def _text_search_kwargs(self, query: str, filter_expr: Optional[str], top: int,
+                            include_vector: bool) -> Dict[str, Any]:
+        """Build the search arguments shared by text_search and text_search_async"""
+        return {
+            'search_text': query,
+            'filter': filter_expr,
+            'top': top,
+            'highlight_fields': "content",
+            'select': self._result_select(include_vector)
+        }
+    
+    async def vector_search(self, query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                            include_vector: bool = False, *,
+                            query_vector: Optional[List[float]] = None) -> List[Dict]:
+        """
+        Perform vector-based semantic search
+        
+        Args:
+            query: Search query string (may be omitted when query_vector is given)
+            filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
+            top: Maximum number of results
+            include_vector: Also return each result's content_vector
+            query_vector: Precomputed query embedding (from the index's embedding model);
+                          when given, the query is not embedded
             
         Returns:
             List of search result dictionaries
         """
+        if query_vector is None and (not query or not query.strip()):
+            logger.error("[ERROR] Vector search requires a non-empty query or a query_vector")
+            return []
+
         try:
-            # Generate embedding for query
-            query_embedding = await self.embedding_generator.generate_embedding(query)
+            # Generate embedding for query (cached for repeated queries) unless supplied
+            query_embedding = query_vector
+            if query_embedding is None:
+                query_embedding = await self.query_embedding_cache.get_or_generate(query, self.query_embedder)
             if not query_embedding:
-                print("[ERROR] Failed to generate query embedding")
+                logger.error("[ERROR] Failed to generate query embedding")
                 return []
             
             # Build filter expression using FilterBuilder
@@ -937,38 +1663,47 @@ class AzureCognitiveSearch(IVectorSearchService):
             # Create vector query
             vector_query = VectorizedQuery(vector=query_embedding, k_nearest_neighbors=top, fields="content_vector")
             
-            results = self.search_client.search(
+            return await self._search_async(
                 search_text=None,
                 vector_queries=[vector_query],
                 filter=filter_expr,
-                select="*",
+                select=self._result_select(include_vector),
                 top=top
             )
             
-            return [dict(result) for result in results]
-            
         except Exception as e:
-            print(f"[ERROR] Vector search failed: {e}")
+            logger.error(f"[ERROR] Vector search failed: {e}")
             return []
     
-    async def hybrid_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
+    async def hybrid_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                            include_vector: bool = False, *,
+                            query_vector: Optional[List[float]] = None) -> List[Dict]:
         """
         Perform hybrid search combining text and vector search
         
         Args:
-            query: Search query string
+            query: Search query string (used for the text half of the search)
             filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
             top: Maximum number of results
+            include_vector: Also return each result's content_vector
+            query_vector: Precomputed embedding for the vector half; when given, the
+                          query is not embedded
             
         Returns:
             List of search result dictionaries
         """
+        if not query or not query.strip():
+            logger.error("[ERROR] Hybrid search requires a non-empty query")
+            return []
+
         try:
-            # Generate embedding for query
-            query_embedding = await self.embedding_generator.generate_embedding(query)
+            # Generate embedding for query (cached for repeated queries) unless supplied
+            query_embedding = query_vector
+            if query_embedding is None:
+                query_embedding = await self.query_embedding_cache.get_or_generate(query, self.query_embedder)
             if not query_embedding:
-                print("[ERROR] Failed to generate query embedding, falling back to text search")
-                return self.text_search(query, filters, top)
+                logger.error("[ERROR] Failed to generate query embedding, falling back to text search")
+                return await self.text_search_async(query, filters, top, include_vector)
             
             # Build filter expression using FilterBuilder
             filter_expr = FilterBuilder.build_filter(filters)
@@ -976,21 +1711,20 @@ class AzureCognitiveSearch(IVectorSearchService):
             # Create vector query
             vector_query = VectorizedQuery(vector=query_embedding, k_nearest_neighbors=top, fields="content_vector")
             
-            results = self.search_client.search(
+            return await self._search_async(
                 search_text=query,
                 vector_queries=[vector_query],
                 filter=filter_expr,
-                select="*",
+                select=self._result_select(include_vector),
                 top=top
             )
             
-            return [dict(result) for result in results]
-            
         except Exception as e:
-            print(f"[ERROR] Hybrid search failed: {e}")
+            logger.error(f"[ERROR] Hybrid search failed: {e}")
             return []
     
-    def semantic_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
+    def semantic_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                        stream: bool = False, include_vector: bool = False) -> Iterable[Dict]:
         """
         Perform semantic search using Azure's semantic capabilities
         
@@ -998,29 +1732,57 @@ class AzureCognitiveSearch(IVectorSearchService):
             query: Search query string
             filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
             top: Maximum number of results
+            stream: Return a lazy iterator instead of a list (see text_search)
+            include_vector: Also return each result's content_vector
             
         Returns:
-            List of search result dictionaries
+            List (or iterator, when streaming) of search result dictionaries
         """
         try:
             # Build filter expression using FilterBuilder
             filter_expr = FilterBuilder.build_filter(filters)
             
-            results = self.search_client.search(
-                search_text=query,
-                filter=filter_expr,
-                query_type="semantic",
-                semantic_configuration_name="general-semantic-config",
-                top=top,
-                select="*"
-            )
+            results = self._iter_search(**self._semantic_search_kwargs(query, filter_expr, top, include_vector))
             
-            return [dict(result) for result in results]
+            return results if stream else list(results)
+            
+        except Exception as e:
+            logger.error(f"[ERROR] Semantic search failed: {e}")
+            return []
+    
+    async def semantic_search_async(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                                    include_vector: bool = False) -> List[Dict]:
+        """
+        Perform semantic search without blocking the event loop
+        
+        Args:
+            query: Search query string
+            filters: Optional dictionary of field filters (e.g., {"context_name": "WORK-123"})
+            top: Maximum number of results
+            include_vector: Also return each result's content_vector
             
+        Returns:
+            List of search result dictionaries
+        """
+        try:
+            filter_expr = FilterBuilder.build_filter(filters)
+            return await self._search_async(**self._semantic_search_kwargs(query, filter_expr, top, include_vector))
         except Exception as e:
-            print(f"[ERROR] Semantic search failed: {e}")
+            logger.error(f"[ERROR] Semantic search failed: {e}")
             return []
     
+    def _semantic_search_kwargs(self, query: str, filter_expr: Optional[str], top: int,
+                                include_vector: bool) -> Dict[str, Any]:
+        """Build the search arguments shared by semantic_search and semantic_search_async"""
+        return {
+            'search_text': query,
+            'filter': filter_expr,
+            'query_type': "semantic",
+            'semantic_configuration_name': SEMANTIC_CONFIGURATION_NAME,
+            'top': top,
+            'select': self._result_select(include_vector)
+        }
+    
     # ===== UTILITY METHODS =====
     
     def get_unique_field_values(self, field_name: str, max_values: int = 1000) -> List[str]:
@@ -1035,50 +1797,66 @@ class AzureCognitiveSearch(IVectorSearchService):
             List of unique values for the field
         """
         try:
-            unique_values_set = set()
-            skip = 0
-            batch_size = 1000
-            
-            while True:
-                # Get batch of documents with only the field we need
-                results = self.search_client.search(
-                    search_text="*",
-                    select=field_name,
-                    top=batch_size,
-                    skip=skip
-                )
-                
-                batch = list(results)
-                if not batch:
-                    break
-                
-                # Extract unique values from this batch
-                for doc in batch:
-                    value = doc.get(field_name)
-                    if value is not None:
-                        if isinstance(value, list):
-                            # Handle array fields (like tags)
-                            unique_values_set.update(str(item).strip() for item in value if item is not None)
-                        else:
-                            # Handle single value fields
-                            unique_values_set.add(str(value).strip())
-                
-                skip += batch_size
-                
-                # Stop early if we have enough unique values
-                if len(unique_values_set) >= max_values:
-                    break
-            
-            # Convert to sorted list and apply limit
-            unique_values = sorted(list(unique_values_set))[:max_values]
+            unique_values = self._cached(('unique_values', field_name, max_values),
+                                         lambda: self._collect_unique_field_values(field_name, max_values))
             
-            print(f"[DEBUG] Found {len(unique_values)} unique values for '{field_name}'")
-            return unique_values
+            logger.debug("Found %d unique values for '%s'", len(unique_values), field_name)
+            return list(unique_values)
             
         except Exception as e:
-            print(f"[ERROR] Failed to get unique values for field '{field_name}': {e}")
+            logger.error(f"[ERROR] Failed to get unique values for field '{field_name}': {e}")
             return []
     
+    def _collect_unique_field_values(self, field_name: str, max_values: int) -> List[str]:
+        """Page through the index collecting the smallest max_values values of a field (uncached)"""
+        unique_values_set = set()
+        
+        # Read documents with only the field we need, a page at a time
+        for batch in self._scan_field_pages(field_name):
+            # Extract unique values from this batch
+            for doc in batch:
+                value = doc.get(field_name)
+                if value is not None:
+                    if isinstance(value, list):
+                        # Handle array fields (like tags)
+                        unique_values_set.update(str(item).strip() for item in value if item is not None)
+                    else:
+                        # Handle single value fields
+                        unique_values_set.add(str(value).strip())
+            
+            # Stop early if we have enough unique values
+            if len(unique_values_set) >= max_values:
+                break
+        
+        # Keep the smallest max_values values in sorted order
+        return heapq.nsmallest(max_values, unique_values_set)
+    
+    def _facet_values(self, field_names: Iterable[str], max_values: int = 1000) -> Dict[str, List[str]]:
+        """
+        Collect the distinct values of several facetable fields with a single query
+        
+        Args:
+            field_names: Facetable fields to collect values for
+            max_values: Maximum number of values returned per field (default: 1000)
+            
+        Returns:
+            Dict mapping each field name to its sorted distinct values
+        """
+        field_names = list(field_names)
+        results = self.search_client.search(
+            search_text=None,
+            facets=[f"{field_name},count:{max_values}" for field_name in field_names],
+            top=0
+        )
+        facets = results.get_facets() or {}
+        
+        values = {}
+        for field_name in field_names:
+            field_values = {str(facet['value']).strip() for facet in facets.get(field_name, [])
+                            if facet.get('value') is not None}
+            values[field_name] = sorted(field_values)
+        return values
+    
     def get_document_count(self) -> int:
         """
         Get total number of documents in the index
@@ -1087,12 +1865,16 @@ class AzureCognitiveSearch(IVectorSearchService):
             Number of documents
         """
         try:
-            results = self.search_client.search("*", top=0, include_total_count=True)
-            return results.get_count() or 0
+            return self._cached('document_count', self._count_documents)
         except Exception as e:
-            print(f"[ERROR] Error getting document count: {e}")
+            logger.error(f"[ERROR] Error getting document count: {e}")
             return 0
     
+    def _count_documents(self) -> int:
+        """Query the index's total document count (uncached)"""
+        results = self.search_client.search(search_text=None, top=0, include_total_count=True)
+        return results.get_count() or 0
+    
     def test_connection(self) -> bool:
         """
         Test connection to Azure Cognitive Search
@@ -1101,29 +1883,30 @@ class AzureCognitiveSearch(IVectorSearchService):
             bool: True if connection successful, False otherwise
         """
         try:
-            # Try to get index stats
-            stats = self.get_index_stats()
-            return bool(stats)
+            # One metadata call; raises if the service or index is unreachable
+            self.index_client.get_index_statistics(self.index_name)
+            return True
         except Exception as e:
-            print(f"[ERROR] Connection test failed: {e}")
+            logger.error(f"[ERROR] Connection test failed: {e}")
             return False
     
-    def print_search_results(self, results: List[Dict], title: str = "Search Results"):
+    def print_search_results(self, results: Iterable[Dict], title: str = "Search Results"):
         """
         Print search results in a formatted way
         
+        Results are consumed lazily, so a streaming search prints each result as its
+        page arrives; the total is printed at the end.
+        
         Args:
-            results: List of search result dictionaries
+            results: List or iterator of search result dictionaries
             title: Title for the results display
         """
-        if not results:
-            print(f"[SEARCH] {title}: No results found")
-            return
-        
-        print(f"\n[SEARCH] {title} ({len(results)} results)")
-        print("=" * 60)
-        
+        count = 0
         for i, result in enumerate(results, 1):
+            if i == 1:
+                print(f"\n[SEARCH] {title}")
+                print("=" * 60)
+            count = i
             print(f"\n[DOCUMENT] Result {i}:")
             print(f"   ID: {result.get('id', 'N/A')}")
             print(f"   Title: {result.get('title', 'Untitled')}")
@@ -1135,8 +1918,19 @@ class AzureCognitiveSearch(IVectorSearchService):
             
             content = result.get('content', '')
             if content:
-                content_preview = content[:200] + "..." if len(content) > 200 else content
+                content_preview = f"{content[:200]}..." if content[200:201] else content
                 print(f"   Content: {content_preview}")
+        
+        if count:
+            print(f"\n[SEARCH] {title}: {count} results")
+        else:
+            print(f"[SEARCH] {title}: No results found")
+
+
+# Service instances shared per (service, key, index), so repeated factory calls in
+# one process reuse the same clients and pooled HTTPS connections
+_search_service_instances: Dict[Tuple[Optional[str], Optional[str], str], AzureCognitiveSearch] = {}
+_search_service_instances_lock = threading.Lock()
 
 
 # Convenience function to create a search service instance
@@ -1144,7 +1938,7 @@ def get_azure_search_service(service_name: Optional[str] = None,
                            admin_key: Optional[str] = None,
                            index_name: Optional[str] = None) -> AzureCognitiveSearch:
     """
-    Factory function to create an AzureCognitiveSearch instance
+    Factory function to get the shared AzureCognitiveSearch instance for a configuration
     
     Args:
         service_name: Azure Search service name (from env if not provided)
@@ -1152,9 +1946,25 @@ def get_azure_search_service(service_name: Optional[str] = None,
         index_name: Search index name (from env if not provided)
         
     Returns:
-        AzureCognitiveSearch instance
+        AzureCognitiveSearch instance (created on first use, then reused)
     """
-    return AzureCognitiveSearch(service_name, admin_key, index_name)
+    # Resolve the same defaults as the constructor so env-based and explicit
+    # calls for one configuration share an instance
+    key = (
+        service_name or os.getenv('AZURE_SEARCH_SERVICE'),
+        admin_key or os.getenv('AZURE_SEARCH_KEY'),
+        index_name or os.getenv('AZURE_SEARCH_INDEX', 'work-items-index')
+    )
+    
+    search_service = _search_service_instances.get(key)
+    if search_service is None:
+        # Locked so concurrent first calls (e.g. probes in worker threads) share one instance
+        with _search_service_instances_lock:
+            search_service = _search_service_instances.get(key)
+            if search_service is None:
+                search_service = AzureCognitiveSearch(*key)
+                _search_service_instances[key] = search_service
+    return search_service
 
 
 if __name__ == "__main__":
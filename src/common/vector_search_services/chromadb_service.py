@@ -8,11 +8,14 @@ Vector-only search service with persistent storage
 import chromadb
 from chromadb.config import Settings
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import asyncio
 from datetime import datetime
 
 from ..embedding_services.embedding_service_factory import get_embedding_generator
+from ..embedding_services.query_embedding_cache import QueryEmbeddingCache
+from ..embedding_services.batching_embedding_client import BatchingEmbeddingClient
 from .vector_search_interface import IVectorSearchService
 
 
@@ -113,6 +116,12 @@ class ChromaDBService(IVectorSearchService):
 
         # Lazy initialization for embedding service
         self._embedding_generator = None
+        self._query_embedder = None
+        self.query_embedding_cache = QueryEmbeddingCache()
+
+        # Short-lived cache for slowly-changing collection metadata (counts, unique values)
+        self.metadata_cache_ttl = float(os.getenv('SEARCH_METADATA_CACHE_TTL', '60'))
+        self._metadata_cache: Dict[Any, Tuple[float, Any]] = {}
 
         # Initialize ChromaDB client with persistence
         self.client = chromadb.PersistentClient(
@@ -142,6 +151,45 @@ class ChromaDBService(IVectorSearchService):
             self._embedding_generator = get_embedding_generator()  # Use environment configuration
         return self._embedding_generator
 
+    @property
+    def query_embedder(self) -> BatchingEmbeddingClient:
+        """Lazy batching wrapper that coalesces concurrent query embeddings"""
+        if self._query_embedder is None:
+            self._query_embedder = BatchingEmbeddingClient(self.embedding_generator)
+        return self._query_embedder
+
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached metadata value, recomputing it once the TTL has expired
+
+        Args:
+            key: Cache key for the value
+            compute: Callable producing the value on a miss (exceptions are not cached)
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        entry = self._metadata_cache.get(key)
+        if entry is not None and now - entry[0] < self.metadata_cache_ttl:
+            return entry[1]
+
+        value = compute()
+        self._metadata_cache[key] = (now, value)
+        return value
+
+    def _max_batch_size(self) -> int:
+        """Largest number of records one add() call accepts (client limit, 5000 if unknown)"""
+        get_max_batch_size = getattr(self.client, 'get_max_batch_size', None)
+        try:
+            return max(1, int(get_max_batch_size())) if get_max_batch_size else 5000
+        except Exception:
+            return 5000
+
+    def invalidate_metadata_cache(self) -> None:
+        """Drop cached collection metadata after the collection changes"""
+        self._metadata_cache.clear()
+
     def test_connection(self) -> bool:
         """Test ChromaDB connection and collection access"""
         try:
@@ -176,6 +224,7 @@ class ChromaDBService(IVectorSearchService):
                 name=self.collection_name,
                 metadata={"description": "Documentation retrieval collection"}
             )
+            self.invalidate_metadata_cache()
             print(f"[INFO] Created new ChromaDB collection: {self.collection_name}")
             return True
             
@@ -191,24 +240,7 @@ class ChromaDBService(IVectorSearchService):
             Dictionary with collection statistics
         """
         try:
-            # Get basic stats
-            document_count = self.collection.count()
-
-            # Get sample documents to analyze contexts
-            sample_results = self.collection.get(limit=100)
-            contexts = set()
-
-            if sample_results['metadatas']:
-                for metadata in sample_results['metadatas']:
-                    if metadata and 'context_name' in metadata:
-                        contexts.add(metadata['context_name'])
-
-            return {
-                'collection_name': self.collection_name,
-                'document_count': document_count,
-                'context_count': len(contexts),
-                'storage_path': self.persist_directory
-            }
+            return self._cached('collection_stats', self._compute_collection_stats)
 
         except Exception as e:
             print(f"[ERROR] Failed to get index stats: {e}")
@@ -219,6 +251,27 @@ class ChromaDBService(IVectorSearchService):
                 'storage_path': self.persist_directory
             }
 
+    def _compute_collection_stats(self) -> Dict[str, Any]:
+        """Query the collection for the statistics returned by get_collection_stats"""
+        # Get basic stats
+        document_count = self.collection.count()
+
+        # Get sample documents to analyze contexts
+        sample_results = self.collection.get(limit=100)
+        contexts = set()
+
+        if sample_results['metadatas']:
+            for metadata in sample_results['metadatas']:
+                if metadata and 'context_name' in metadata:
+                    contexts.add(metadata['context_name'])
+
+        return {
+            'collection_name': self.collection_name,
+            'document_count': document_count,
+            'context_count': len(contexts),
+            'storage_path': self.persist_directory
+        }
+
     def get_document_count(self) -> int:
         """
         Get total number of documents in the collection
@@ -227,7 +280,7 @@ class ChromaDBService(IVectorSearchService):
             Number of documents
         """
         try:
-            return self.collection.count()
+            return self._cached('document_count', self.collection.count)
         except Exception as e:
             print(f"[ERROR] Error getting document count: {e}")
             return 0
@@ -275,16 +328,21 @@ class ChromaDBService(IVectorSearchService):
                           and v is not None}
                 metadatas.append(metadata)
 
-            # Batch upload to ChromaDB
+            # Batch upload to ChromaDB, split at the client's maximum batch size
             if ids:
-                self.collection.add(
-                    ids=ids,
-                    documents=documents,
-                    embeddings=embeddings,
-                    metadatas=metadatas
-                )
+                batch_size = self._max_batch_size()
+                for start in range(0, len(ids), batch_size):
+                    end = start + batch_size
+                    self.collection.add(
+                        ids=ids[start:end],
+                        documents=documents[start:end],
+                        embeddings=embeddings[start:end],
+                        metadatas=metadatas[start:end]
+                    )
+                self.invalidate_metadata_cache()
                 print(f"[SUCCESS] Uploaded {len(ids)} documents to ChromaDB")
-                return len(ids), 0
+                # Objects skipped for missing id/content/embedding count as failed
+                return len(ids), len(search_objects) - len(ids)
             else:
                 return 0, len(search_objects)
 
@@ -296,6 +354,7 @@ class ChromaDBService(IVectorSearchService):
         """Delete single document by ID"""
         try:
             self.collection.delete(ids=[document_id])
+            self.invalidate_metadata_cache()
             return True
         except Exception as e:
             print(f"[ERROR] Delete failed for {document_id}: {e}")
@@ -311,6 +370,7 @@ class ChromaDBService(IVectorSearchService):
 
             if ids_to_delete:
                 self.collection.delete(ids=ids_to_delete)
+                self.invalidate_metadata_cache()
                 return len(ids_to_delete)
             return 0
 
@@ -325,6 +385,7 @@ class ChromaDBService(IVectorSearchService):
                 return 0
                 
             self.collection.delete(ids=document_ids)
+            self.invalidate_metadata_cache()
             return len(document_ids)
             
         except Exception as e:
@@ -341,8 +402,9 @@ class ChromaDBService(IVectorSearchService):
             # Convert filters to ChromaDB format
             chromadb_filters = self._convert_filters_to_chromadb(filters) if filters else None
 
-            # Get documents using ChromaDB collection get method
-            results = self.collection.get(
+            # Get documents using ChromaDB collection get method (blocking, so run in a worker thread)
+            results = await asyncio.to_thread(
+                self.collection.get,
                 where=chromadb_filters,
                 include=['metadatas', 'documents'],
                 limit=limit if limit else None
@@ -381,8 +443,9 @@ class ChromaDBService(IVectorSearchService):
         Get documents by specific IDs
         """
         try:
-            # Get documents using ChromaDB collection get method
-            results = self.collection.get(
+            # Get documents using ChromaDB collection get method (blocking, so run in a worker thread)
+            results = await asyncio.to_thread(
+                self.collection.get,
                 ids=document_ids,
                 include=['metadatas', 'documents']
             )
@@ -415,20 +478,38 @@ class ChromaDBService(IVectorSearchService):
             print(f"[ERROR] Get documents by IDs async failed: {e}")
             return []
 
-    async def vector_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
-        """Core vector search implementation"""
+    async def vector_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5,
+                            include_content: bool = True, *,
+                            query_vector: Optional[List[float]] = None) -> List[Dict]:
+        """
+        Core vector search implementation
+
+        Args:
+            query: Search query string
+            filters: Optional dictionary of field filters
+            top: Maximum number of results
+            include_content: Fetch document text; when False only metadata and scores
+                             are read from the collection
+            query_vector: Precomputed query embedding (from the same embedding model);
+                          when given, the query is not embedded
+
+        Returns:
+            List of search result dictionaries
+        """
         try:
-            # Generate embedding for query
-            query_embedding = await self.embedding_generator.generate_embedding(query)
+            # Generate embedding for query (cached for repeated queries) unless supplied
+            query_embedding = query_vector if query_vector is not None else await self.embed_query(query)
 
             # Convert filters to ChromaDB format
             chromadb_filters = self._convert_filters_to_chromadb(filters) if filters else None
 
-            # Perform vector search
-            results = self.collection.query(
+            # Perform vector search (blocking, so run in a worker thread)
+            results = await asyncio.to_thread(
+                self.collection.query,
                 query_embeddings=[query_embedding],
                 n_results=top,
-                where=chromadb_filters
+                where=chromadb_filters,
+                include=['metadatas', 'distances', 'documents'] if include_content else ['metadatas', 'distances']
             )
 
             return self._format_search_results(results)
@@ -437,6 +518,18 @@ class ChromaDBService(IVectorSearchService):
             print(f"[ERROR] Vector search failed: {e}")
             return []
 
+    async def embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Get the embedding for a search query, reusing the query embedding cache
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Embedding vector, or None if generation failed
+        """
+        return await self.query_embedding_cache.get_or_generate(query, self.query_embedder)
+
     # ===== UTILITY METHODS =====
 
     def _convert_filters_to_chromadb(self, filters: Dict[str, Any]) -> Optional[Dict]:
@@ -497,6 +590,42 @@ class ChromaDBService(IVectorSearchService):
 
         return formatted_results
 
+    def _collect_unique_field_values(self, field_name: str) -> Tuple[frozenset, Tuple[str, ...]]:
+        """
+        Scan collection metadata and collect the distinct values of a field
+
+        Returns:
+            Tuple of (value set, values pre-sorted as an immutable tuple) so cached
+            callers can slice the sorted form without re-sorting
+        """
+        # Get all documents with their metadata
+        all_results = self.collection.get()
+        
+        unique_values_set = set()
+        
+        # Extract unique values from metadata
+        if all_results['metadatas']:
+            for metadata in all_results['metadatas']:
+                if metadata and field_name in metadata:
+                    value = metadata[field_name]
+                    if value is not None:
+                        if isinstance(value, list):
+                            # Handle array fields (like tags)
+                            unique_values_set.update(str(item).strip() for item in value if item is not None)
+                        elif isinstance(value, str):
+                            # Handle comma-separated string fields (like tags stored as strings)
+                            if ',' in value:
+                                # Split comma-separated values
+                                values = [v.strip() for v in value.split(',') if v.strip()]
+                                unique_values_set.update(values)
+                            else:
+                                unique_values_set.add(value.strip())
+                        else:
+                            # Handle single value fields
+                            unique_values_set.add(str(value).strip())
+
+        return frozenset(unique_values_set), tuple(sorted(unique_values_set))
+
     def get_unique_field_values(self, field_name: str, max_values: int = 1000) -> List[str]:
         """
         Get unique values for any field by querying all documents
@@ -509,34 +638,11 @@ class ChromaDBService(IVectorSearchService):
             List of unique values for the field
         """
         try:
-            # Get all documents with their metadata
-            all_results = self.collection.get()
-            
-            unique_values_set = set()
-            
-            # Extract unique values from metadata
-            if all_results['metadatas']:
-                for metadata in all_results['metadatas']:
-                    if metadata and field_name in metadata:
-                        value = metadata[field_name]
-                        if value is not None:
-                            if isinstance(value, list):
-                                # Handle array fields (like tags)
-                                unique_values_set.update(str(item).strip() for item in value if item is not None)
-                            elif isinstance(value, str):
-                                # Handle comma-separated string fields (like tags stored as strings)
-                                if ',' in value:
-                                    # Split comma-separated values
-                                    values = [v.strip() for v in value.split(',') if v.strip()]
-                                    unique_values_set.update(values)
-                                else:
-                                    unique_values_set.add(value.strip())
-                            else:
-                                # Handle single value fields
-                                unique_values_set.add(str(value).strip())
+            _, sorted_values = self._cached(('unique_values', field_name),
+                                            lambda: self._collect_unique_field_values(field_name))
             
-            # Convert to sorted list and apply limit
-            unique_values = sorted(list(unique_values_set))[:max_values]
+            # Values are cached pre-sorted; just apply the limit
+            unique_values = list(sorted_values[:max_values])
             
             print(f"[DEBUG] Found {len(unique_values)} unique values for '{field_name}'")
             return unique_values
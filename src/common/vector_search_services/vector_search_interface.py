@@ -85,7 +85,8 @@ class IVectorSearchService(ABC):
     # ===== SEARCH OPERATIONS =====
     
     @abstractmethod
-    async def vector_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5) -> List[Dict]:
+    async def vector_search(self, query: str, filters: Optional[Dict[str, Any]] = None, top: int = 5, *,
+                            query_vector: Optional[List[float]] = None) -> List[Dict]:
         """
         Perform vector-based semantic search
         
@@ -93,6 +94,7 @@ class IVectorSearchService(ABC):
             query: Search query string
             filters: Optional dictionary of field filters
             top: Maximum number of results
+            query_vector: Precomputed query embedding; when given, the query is not embedded
             
         Returns:
             List of search result dictionaries
@@ -8,13 +8,13 @@ Automatically handles fallbacks and provider switching.
 
 import os
 from typing import List
-from dotenv import load_dotenv
+from src.common.environment import load_environment
 
-from src.common.vector_search_services.azure_cognitive_search import get_azure_search_service
-from src.common.vector_search_services.chromadb_service import get_chromadb_service
+# Backend modules are imported inside the provider helpers below so that only the
+# selected backend's SDK (chromadb or azure-search-documents) is loaded
 from src.common.vector_search_services.vector_search_interface import IVectorSearchService
 
-load_dotenv()
+load_environment()
 
 
 def get_vector_search_service(provider: str = None) -> IVectorSearchService:
@@ -45,9 +45,10 @@ def get_vector_search_service(provider: str = None) -> IVectorSearchService:
 
 def _get_azure_cognitive_search_service():
     """Get Azure Cognitive Search Search service"""
-    
+    from src.common.vector_search_services.azure_cognitive_search import get_azure_search_service
     return get_azure_search_service()
 
 def _get_chromdb_search_service():
     """Get Chroma DB search service"""
+    from src.common.vector_search_services.chromadb_service import get_chromadb_service
     return get_chromadb_service()
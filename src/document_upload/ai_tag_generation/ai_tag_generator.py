@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from openai import AzureOpenAI
 
+from src.common.http_client import get_shared_http_client
+
 
 class AITagGenerator:
     """AI-powered tag generator using Azure OpenAI (compatible with existing architecture)"""
@@ -25,7 +27,8 @@ class AITagGenerator:
             azure_endpoint=os.getenv('AZURE_AI_FOUNDRY_ENDPOINT'),
             api_key=os.getenv('AZURE_AI_FOUNDRY_CHAT_COMPLETION_MODEL_KEY'),
             api_version=os.getenv('OPENAI_API_VERSION', '2024-05-01-preview'),
-            timeout=120.0  # 2-minute timeout for large documents (per official SDK docs)
+            timeout=120.0,  # 2-minute timeout for large documents (per official SDK docs)
+            http_client=get_shared_http_client()  # Reuse pooled connections to the same endpoint
         )
         self.model = os.getenv('CHAT_COMPLETION_MODEL', 'gpt-4o-mini')
         self.max_tags = int(os.getenv('AI_TAG_MAX_TAGS_PER_DOCUMENT', '15'))
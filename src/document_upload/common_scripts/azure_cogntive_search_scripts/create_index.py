@@ -28,6 +28,7 @@ The script will:
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the src directory to the path so we can import our modules
@@ -67,7 +68,7 @@ def create_search_index(vector_dimensions: int = 1536, force_recreate: bool = Fa
         
         # Check if index already exists
         if search_service.index_exists():
-            stats = search_service.get_index_stats()
+            stats = search_service.get_index_stats(include_field_values=False)
             print(f"⚠️  Index '{search_service.index_name}' already exists:")
             print(f"   Documents: {stats.get('document_count', 0):,}")
             
@@ -165,7 +166,7 @@ def delete_index():
             return True
         
         # Get statistics before deletion
-        stats = search_service.get_index_stats()
+        stats = search_service.get_index_stats(include_field_values=False)
         print(f"⚠️  WARNING: This will permanently delete:")
         print(f"   Index: {search_service.index_name}")
         print(f"   Documents: {stats.get('document_count', 0):,}")
@@ -314,9 +315,20 @@ Examples:
     if not validate_environment():
         sys.exit(1)
     
-    # Test connection first
+    # Test connection first. The index existence check is an independent request,
+    # so it runs in the background while the connection test is in flight. The
+    # shared service is created here first so both probes reuse one instance.
     print("🔗 Testing connection to Azure Cognitive Search...")
-    if not test_connection():
+    try:
+        get_azure_search_service()
+    except Exception as e:
+        print(f"❌ Failed to initialize Azure Cognitive Search service: {e}")
+        sys.exit(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        index_exists_future = None if args.delete else executor.submit(check_index_exists)
+        connected = test_connection()
+    
+    if not connected:
         print("\n❌ Cannot connect to Azure Cognitive Search")
         print("   Please check your environment variables and network connectivity")
         sys.exit(1)
@@ -329,7 +341,7 @@ Examples:
     
     # Check if index exists
     print(f"\n📋 Checking index status...")
-    index_exists = check_index_exists()
+    index_exists = index_exists_future.result()
     
     # Handle check-only operation
     if args.check_only:
@@ -10,14 +10,162 @@ method converts it to the format needed by the pipeline.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import heapq
+import itertools
 import os
-from dotenv import load_dotenv
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.common.environment import load_environment
 
 # Load environment variables
-load_dotenv()
+load_environment()
+
+# Threads used to scan top-level subdirectories concurrently (1 = single-threaded walk).
+# Worth raising for document roots on network shares, where each readdir is a round-trip.
+DISCOVERY_SCAN_WORKERS = int(os.getenv('DISCOVERY_SCAN_WORKERS', '1'))
+
+# Path components that identify a work item directory, e.g. "Bug 1234567" or "WI-1234567"
+_WORK_ITEM_PREFIXES = ('Bug ', 'WI-', 'wi-', 'Task ', 'Feature ')
+
+# Directory listings from earlier walks in this process:
+# (directory, suffixes) -> (directory mtime_ns, matching file paths, [(subdir name, subdir path)])
+_directory_listing_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[int, List[str], List[Tuple[str, str]]]] = {}
+
+# Listings of directories modified this recently are not cached: another change within the
+# same mtime tick would leave the directory's mtime unchanged and the listing stale
+_LISTING_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def clear_discovery_cache() -> None:
+    """Forget all directory listings cached by earlier discovery walks."""
+    _directory_listing_cache.clear()
+
+
+def _list_directory(directory: str, suffixes: Tuple[str, ...]) -> Optional[Tuple[List[str], List[Tuple[str, str]]]]:
+    """
+    List one directory: files matching the suffixes and (name, path) of its subdirectories.
+    
+    Listings are memoized per directory and reused while the directory's mtime is
+    unchanged (adding, removing or renaming an entry updates it), so repeated walks of
+    the same tree cost one stat() per directory instead of a full readdir.
+    
+    Args:
+        directory: Directory to list
+        suffixes: Lowercase file extensions (with dots) to match
+        
+    Returns:
+        (matching file paths, subdirectories), or None if the directory cannot be read
+    """
+    cache_key = (directory, suffixes)
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        _directory_listing_cache.pop(cache_key, None)
+        return None
+    
+    cached = _directory_listing_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    
+    matches = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((entry.name, entry.path))
+                elif entry.name.lower().endswith(suffixes):
+                    matches.append(entry.path)
+    except OSError:
+        return None
+    
+    if time.time_ns() - mtime_ns >= _LISTING_CACHE_MIN_AGE_NS:
+        _directory_listing_cache[cache_key] = (mtime_ns, matches, subdirectories)
+    return matches, subdirectories
+
+
+def _scan_document_files(directory: str, suffixes: Tuple[str, ...], recursive: bool,
+                         include_hidden: bool = False) -> Iterator[Path]:
+    """
+    Yield files whose (lowercased) name ends with one of the given suffixes.
+    
+    Walks the tree once with os.scandir for all extensions together, instead of one
+    glob/rglob traversal per extension. Like rglob, symlinked directories are not
+    descended into and unreadable directories are skipped. Hidden directories
+    (.git, .venv, ...) are pruned at every level unless include_hidden is set.
+    
+    Uses an explicit directory stack rather than recursive generators, so each match is
+    yielded straight to the caller however deep the tree is, and at most one directory
+    handle is open at a time. Unchanged directories reuse their listing from earlier
+    walks (see _list_directory).
+    
+    Args:
+        directory: Directory to scan
+        suffixes: Lowercase file extensions (with dots) to match
+        recursive: Whether to descend into subdirectories
+        include_hidden: Whether to descend into directories whose name starts with '.'
+        
+    Yields:
+        Path: Matching file paths
+    """
+    pending = [directory]
+    while pending:
+        listing = _list_directory(pending.pop(), suffixes)
+        if listing is None:
+            continue
+        matches, subdirectories = listing
+        
+        for match in matches:
+            yield Path(match)
+        
+        if recursive:
+            # Reversed so subdirectories are popped (and yielded) in directory order
+            pending.extend(
+                path for name, path in reversed(subdirectories)
+                if include_hidden or not name.startswith('.')
+            )
+
+
+def _scan_document_files_concurrently(directory: str, suffixes: Tuple[str, ...],
+                                      include_hidden: bool, max_workers: int) -> Iterator[Path]:
+    """
+    Recursive variant of _scan_document_files that walks each top-level subdirectory
+    in its own worker thread, overlapping the directory reads.
+    
+    Files are yielded grouped by top-level subdirectory once each subdirectory is scanned.
+    
+    Args:
+        directory: Directory to scan
+        suffixes: Lowercase file extensions (with dots) to match
+        include_hidden: Whether to descend into directories whose name starts with '.'
+        max_workers: Maximum number of scanning threads
+        
+    Yields:
+        Path: Matching file paths
+    """
+    listing = _list_directory(directory, suffixes)
+    if listing is None:
+        return
+    matches, subdirectories = listing
+    
+    for match in matches:
+        yield Path(match)
+    
+    subdirectories = [path for name, path in subdirectories if include_hidden or not name.startswith('.')]
+    if not subdirectories:
+        return
+    
+    def scan_subdirectory(subdirectory: str) -> List[Path]:
+        return list(_scan_document_files(subdirectory, suffixes, True, include_hidden))
+    
+    # Bounded pool: one thread per subdirectory could exhaust file descriptors
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirectories))) as executor:
+        for files in executor.map(scan_subdirectory, subdirectories):
+            yield from files
 
 
 @dataclass
@@ -102,13 +250,31 @@ class DocumentDiscoveryStrategy(ABC):
         Returns:
             List[Path]: List of valid file paths
         """
-        valid_files = []
+        return list(self._iter_valid_files(files))
+    
+    def _iter_valid_files(self, files: Iterable[Path]) -> Iterator[Path]:
+        """
+        Lazily yield the valid files (see _filter_valid_files) from any iterable of paths.
+        
+        Args:
+            files: Iterable of file paths to filter
+            
+        Yields:
+            Path: Each valid file path, in input order
+        """
+        # Resolve the extensions once, not once per file
+        suffixes = tuple(ext.lower() for ext in self.get_supported_extensions())
         for file_path in files:
-            if (file_path.is_file() and 
-                file_path.stat().st_size > 0 and 
-                file_path.suffix.lower() in self.get_supported_extensions()):
-                valid_files.append(file_path)
-        return valid_files
+            # Cheap name check first, so unsupported files never cost a stat() call
+            if not file_path.name.lower().endswith(suffixes):
+                continue
+            # One stat() answers both "is it a regular file" and "is it non-empty"
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0:
+                yield file_path
 
 
 class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
@@ -129,6 +295,7 @@ class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
         """
         self.recursive = recursive
         self._extensions = extensions
+        self._env_extensions: Optional[List[str]] = None
     
     def get_strategy_name(self) -> str:
         """Get the name of this discovery strategy."""
@@ -144,12 +311,13 @@ class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
         if self._extensions:
             return self._extensions
         
-        # Get from environment variable
-        extensions_str = os.getenv('SUPPORTED_FILE_EXTENSIONS', '.md,.txt,.docx,.pptx')
-        extensions = [ext.strip() for ext in extensions_str.split(',')]
-        # Ensure all extensions start with a dot
-        extensions = [ext if ext.startswith('.') else f'.{ext}' for ext in extensions]
-        return extensions
+        # Get from environment variable (parsed once per strategy instance)
+        if self._env_extensions is None:
+            extensions_str = os.getenv('SUPPORTED_FILE_EXTENSIONS', '.md,.txt,.docx,.pptx')
+            extensions = [ext.strip() for ext in extensions_str.split(',')]
+            # Ensure all extensions start with a dot
+            self._env_extensions = [ext if ext.startswith('.') else f'.{ext}' for ext in extensions]
+        return self._env_extensions
     
     def discover_documents(self, root_path: str, **kwargs) -> List[Path]:
         """
@@ -157,7 +325,11 @@ class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
         
         Args:
             root_path: Root directory to start discovery from OR path to a single file
-            **kwargs: Additional parameters (recursive, max_files, exclude_patterns)
+            **kwargs: Additional parameters (recursive, max_files, exclude_patterns,
+                      include_hidden - also search hidden directories, default False,
+                      limit - stop the walk after this many matches, in walk order,
+                      scan_workers - threads scanning top-level subdirectories,
+                      default DISCOVERY_SCAN_WORKERS)
             
         Returns:
             List[Path]: List of discovered file paths
@@ -166,60 +338,51 @@ class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
         recursive = kwargs.get('recursive', self.recursive)
         max_files = kwargs.get('max_files', None)
         exclude_patterns = kwargs.get('exclude_patterns', [])
+        include_hidden = kwargs.get('include_hidden', False)
+        limit = kwargs.get('limit', None)
+        scan_workers = kwargs.get('scan_workers', DISCOVERY_SCAN_WORKERS)
         
         root_path_obj = Path(root_path)
         
-        if not root_path_obj.exists():
-            raise FileNotFoundError(f"Path does not exist: {root_path}")
+        # A single stat() both checks existence and tells a file from a directory
+        try:
+            root_stat = root_path_obj.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Path does not exist: {root_path}") from None
         
-        document_files = []
         extensions = self.get_supported_extensions()
         
         # Handle single file case
-        if root_path_obj.is_file():
-            # Check if the single file has a supported extension
-            if root_path_obj.suffix.lower() in extensions:
-                document_files = [root_path_obj]
-            else:
-                # File doesn't have supported extension, return empty list
-                document_files = []
+        if stat.S_ISREG(root_stat.st_mode):
+            # Check if the single file has a supported extension (otherwise nothing is found)
+            document_files = [root_path_obj] if root_path_obj.suffix.lower() in extensions else []
         else:
-            # Handle directory case (existing logic)
-            # Find all supported document files
-            for ext in extensions:
-                if recursive:
-                    # Use rglob for recursive search
-                    found_files = list(root_path_obj.rglob(f"*{ext}"))
-                else:
-                    # Use glob for non-recursive search (current directory only)
-                    found_files = list(root_path_obj.glob(f"*{ext}"))
-                
-                document_files.extend(found_files)
-        
-        # Filter valid files
-        valid_files = self._filter_valid_files(document_files)
-        
-        # Apply exclude patterns
+            # Handle directory case - one scandir pass finds every supported extension
+            suffixes = tuple(ext.lower() for ext in extensions)
+            if recursive and scan_workers > 1:
+                document_files = _scan_document_files_concurrently(
+                    str(root_path_obj), suffixes, include_hidden, scan_workers)
+            else:
+                document_files = _scan_document_files(str(root_path_obj), suffixes, recursive, include_hidden)
+        
+        # Filter valid files and apply exclude patterns as the walk yields them,
+        # without materializing intermediate lists
+        valid_files = self._iter_valid_files(document_files)
         if exclude_patterns:
-            filtered_files = []
-            for file_path in valid_files:
-                should_exclude = False
-                for pattern in exclude_patterns:
-                    if pattern in str(file_path):
-                        should_exclude = True
-                        break
-                if not should_exclude:
-                    filtered_files.append(file_path)
-            valid_files = filtered_files
-        
-        # Sort files
-        valid_files = sorted(valid_files)
-        
-        # Limit number of files if specified
-        if max_files and len(valid_files) > max_files:
-            valid_files = valid_files[:max_files]
-        
-        return valid_files
+            valid_files = (
+                file_path for file_path in valid_files
+                if not any(pattern in str(file_path) for pattern in exclude_patterns)
+            )
+        
+        # Callers that only need a sample (e.g. a smoke test) stop the walk
+        # as soon as enough matching files have been found
+        if limit:
+            valid_files = itertools.islice(valid_files, limit)
+        
+        # Sort files, keeping only the first max_files when a limit is specified
+        if max_files:
+            return heapq.nsmallest(max_files, valid_files)
+        return sorted(valid_files)
     
     def parse_result(self, discovery_result: List[Path], discovery_time: float, **kwargs) -> DocumentDiscoveryResult:
         """
@@ -246,6 +409,8 @@ class GeneralDocumentDiscoveryStrategy(DocumentDiscoveryStrategy):
             'recursive': kwargs.get('recursive', self.recursive),
             'max_files': kwargs.get('max_files'),
             'exclude_patterns': kwargs.get('exclude_patterns', []),
+            'include_hidden': kwargs.get('include_hidden', False),
+            'limit': kwargs.get('limit'),
             'extensions_used': self.get_supported_extensions()
         }
         
@@ -296,24 +461,19 @@ class PersonalDocumentationDiscoveryStrategy(GeneralDocumentDiscoveryStrategy):
         """
         errors = kwargs.get('errors', [])
         
-        # Analyze file types
+        # Classify each file once: count its type and extract its work item
         files_by_type = {}
-        for file_path in discovery_result:
-            file_type = file_path.suffix.lower()
-            files_by_type[file_type] = files_by_type.get(file_type, 0) + 1
-        
-        # Extract work items actually found in the discovered files
         work_items_found = set()
         work_items_file_count = {}
         
         for file_path in discovery_result:
+            file_type = file_path.suffix.lower()
+            files_by_type[file_type] = files_by_type.get(file_type, 0) + 1
+            
             # Try to extract work item ID from the file path
-            path_parts = file_path.parts
-            for part in path_parts:
+            for part in file_path.parts:
                 # Look for work item patterns like "Bug 1234567" or "WI-1234567"
-                if (part.startswith('Bug ') or part.startswith('WI-') or 
-                    part.startswith('wi-') or part.startswith('Task ') or
-                    part.startswith('Feature ')):
+                if part.startswith(_WORK_ITEM_PREFIXES):
                     work_item_id = part
                     work_items_found.add(work_item_id)
                     work_items_file_count[work_item_id] = work_items_file_count.get(work_item_id, 0) + 1
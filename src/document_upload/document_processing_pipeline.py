@@ -19,15 +19,9 @@ from typing import List, Dict, Optional, Iterator, Any
 from dataclasses import dataclass
 
 # Import our helper modules
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-
-from document_upload.discovery_strategies import DocumentDiscoveryStrategy, DocumentDiscoveryResult
-from document_upload.processing_strategies import DocumentProcessingStrategy, ProcessedDocument, DocumentProcessingResult
-from document_upload.upload_strategies import DocumentUploadStrategy, DocumentUploadResult
-
-# Import Azure search service for upload phase
-from src.common.vector_search_services.azure_cognitive_search import get_azure_search_service
+from .discovery_strategies import DocumentDiscoveryStrategy, DocumentDiscoveryResult
+from .processing_strategies import DocumentProcessingStrategy, ProcessedDocument, DocumentProcessingResult
+from .upload_strategies import DocumentUploadStrategy, DocumentUploadResult
 
 
 class DocumentDiscoveryPhase:
@@ -49,7 +43,7 @@ class DocumentDiscoveryPhase:
             self.discovery_strategy = discovery_strategy
         else:
             # Use PersonalDocumentationDiscoveryStrategy as default
-            from document_upload.discovery_strategies import PersonalDocumentationDiscoveryStrategy
+            from .discovery_strategies import PersonalDocumentationDiscoveryStrategy
             self.discovery_strategy = PersonalDocumentationDiscoveryStrategy()
     
     def discover_documents(self, root_directory: str, **kwargs) -> DocumentDiscoveryResult:
@@ -164,7 +158,7 @@ class DocumentProcessingPhase:
             self.strategy = processing_strategy
         else:
             # Use PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy as default
-            from document_upload.processing_strategies import PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy
+            from .processing_strategies import PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy
             self.strategy = PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy()
 
     def process_documents(self, discovered_files: List[Path]) -> DocumentProcessingResult:
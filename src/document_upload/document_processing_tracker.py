@@ -132,9 +132,12 @@ class DocumentProcessingTracker:
             # Process the file...
             tracker.mark_processed(file_path)
             tracker.save()
+    
+    An in-memory tracker (DocumentProcessingTracker(in_memory=True)) keeps its state only
+    in the process, which suits dry runs and smoke tests that must not touch the disk.
     """
     
-    def __init__(self, tracking_file_name: str = "processed_files.json"):
+    def __init__(self, tracking_file_name: str = "processed_files.json", in_memory: bool = False):
         """
         Initialize the document processing tracker.
         
@@ -144,8 +147,18 @@ class DocumentProcessingTracker:
         
         Args:
             tracking_file_name: Name of the JSON tracking file (default: "processed_files.json")
+            in_memory: Keep tracking state in memory only - no environment lookup, no
+                       tracking file is read, written or deleted (default: False)
         """
         self.tracking_file_name = tracking_file_name
+        self.in_memory = in_memory
+        
+        if in_memory:
+            self.tracking_source = None
+            self.tracking_file = None
+            self.processed_files = {}
+            return
+        
         self._initialize_tracking_source()
         self.processed_files = load_processed_files(self.tracking_file)
     
@@ -176,7 +189,7 @@ class DocumentProcessingTracker:
         Get the current tracking source directory.
         
         Returns:
-            Path: The directory where tracking files are stored
+            Path: The directory where tracking files are stored (None for an in-memory tracker)
         """
         return self.tracking_source
     
@@ -214,18 +227,20 @@ class DocumentProcessingTracker:
         self.processed_files.clear()
     
     def save(self):
-        """Save the current tracking state to file."""
+        """Save the current tracking state to file (no-op for an in-memory tracker)."""
+        if self.in_memory:
+            return
         save_processed_files(self.tracking_file, self.processed_files)
     
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about processed files."""
         return {
             'total_processed': len(self.processed_files),
-            'tracking_file_exists': self.tracking_file.exists()
+            'tracking_file_exists': not self.in_memory and self.tracking_file.exists()
         }
     
     def clear(self):
         """Clear all tracking data (use with caution)."""
         self.processed_files.clear()
-        if self.tracking_file.exists():
+        if not self.in_memory and self.tracking_file.exists():
             self.tracking_file.unlink()
@@ -479,10 +479,7 @@ Examples:
         args.preview = False
 
     try:
-        # Load environment and validate (using Scripts 1 & 2 patterns)
-        load_dotenv()
-        
-        # Validate environment variables
+        # Validate environment variables (loaded from .env at import)
         required_vars = ['AZURE_SEARCH_SERVICE', 'AZURE_SEARCH_KEY']
         missing_vars = [var for var in required_vars if not os.getenv(var)]
         
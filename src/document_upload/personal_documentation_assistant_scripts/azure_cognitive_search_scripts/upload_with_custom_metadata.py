@@ -36,13 +36,13 @@ sys.path.insert(0, str(src_dir))
 # Import project modules
 from src.common.vector_search_services.azure_cognitive_search import AzureCognitiveSearch, get_azure_search_service
 from src.document_upload.document_processing_tracker import DocumentProcessingTracker
-from document_upload.processing_strategies import (
+from src.document_upload.processing_strategies import (
     DocumentProcessingStrategy,
     PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy, 
     AZURE_SEARCH_INDEX_FIELDS,
     ProcessedDocument
 )
-from document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
+from src.document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
 
 # Load environment variables
 load_dotenv()
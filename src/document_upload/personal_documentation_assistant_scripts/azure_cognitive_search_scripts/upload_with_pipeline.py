@@ -46,29 +46,26 @@ sys.path.insert(0, str(src_dir))
 # Import project modules
 from src.common.vector_search_services.azure_cognitive_search import get_azure_search_service
 from src.document_upload.document_processing_tracker import DocumentProcessingTracker
-from document_upload.document_processing_pipeline import DocumentProcessingPipeline
-from document_upload.processing_strategies import PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy
-from document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
+from src.document_upload.document_processing_pipeline import DocumentProcessingPipeline
+from src.document_upload.processing_strategies import PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy
+from src.document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
 
 # Load environment variables
 load_dotenv()
 
 
-async def force_reset_index_and_tracker() -> bool:
+def force_reset_index_and_tracker() -> bool:
     """Complete index reset and tracker cleanup with comprehensive validation"""
     print("🗑️  Performing complete force reset...")
     
-    # Load environment and initialize services (using existing patterns)
-    load_dotenv()
-    
     try:
         # Initialize Azure Search service using existing factory function
         azure_search = get_azure_search_service()
         tracker = DocumentProcessingTracker()
         
-        # 1. Delete all documents from index using existing method
+        # 1. Delete all documents by recreating the index from its current definition
         print("   🔄 Deleting all documents from search index...")
-        deleted_count = azure_search.delete_all_documents()
+        deleted_count = azure_search.delete_all_documents(fast=True)
         print(f"   ✅ Successfully deleted {deleted_count} documents from index")
         
         # 2. Clear tracker state completely using existing method
@@ -127,10 +124,7 @@ async def process_path_with_pipeline(target_path: str, dry_run: bool = False) ->
         print(f"❌ Error: Path does not exist: {target_path}")
         return False
     
-    # Load environment and validate (using existing pattern from create_index.py)
-    load_dotenv()
-    
-    # Validate environment variables (using existing pattern)
+    # Validate environment variables (loaded from .env at import)
     required_vars = ['AZURE_SEARCH_SERVICE', 'AZURE_SEARCH_KEY', 'AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_KEY']
     missing_vars = [var for var in required_vars if not os.getenv(var)]
     
@@ -220,47 +214,49 @@ async def process_path_with_pipeline(target_path: str, dry_run: bool = False) ->
 
 def print_pipeline_statistics(discovery_result, processing_result, upload_result):
     """Enhanced statistics reporting based on Script 1 patterns"""
-    print("\n" + "="*60)
-    print("📊 PIPELINE EXECUTION STATISTICS")
-    print("="*60)
+    # Collect the report and emit it with a single write instead of one per line
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("📊 PIPELINE EXECUTION STATISTICS")
+    lines.append("="*60)
     
     # Discovery Phase Stats
-    print(f"\n📁 Discovery Phase:")
-    print(f"   Total files discovered: {discovery_result.total_files}")
+    lines.append(f"\n📁 Discovery Phase:")
+    lines.append(f"   Total files discovered: {discovery_result.total_files}")
     if hasattr(discovery_result, 'files_by_type') and discovery_result.files_by_type:
-        print(f"   Files by type: {discovery_result.files_by_type}")
+        lines.append(f"   Files by type: {discovery_result.files_by_type}")
     if hasattr(discovery_result, 'skipped_files'):
-        print(f"   Files skipped: {len(discovery_result.skipped_files)}")
+        lines.append(f"   Files skipped: {len(discovery_result.skipped_files)}")
     
     # Processing Phase Stats  
-    print(f"\n⚙️  Processing Phase:")
-    print(f"   Successfully processed: {processing_result.successfully_processed}")
-    print(f"   Failed processing: {processing_result.failed_documents}")
-    print(f"   Processing time: {processing_result.processing_time:.2f}s")
+    lines.append(f"\n⚙️  Processing Phase:")
+    lines.append(f"   Successfully processed: {processing_result.successfully_processed}")
+    lines.append(f"   Failed processing: {processing_result.failed_documents}")
+    lines.append(f"   Processing time: {processing_result.processing_time:.2f}s")
     if hasattr(processing_result, 'strategy_name'):
-        print(f"   Strategy used: {processing_result.strategy_name}")
+        lines.append(f"   Strategy used: {processing_result.strategy_name}")
     
     # Upload Phase Stats
-    print(f"\n📤 Upload Phase:")
-    print(f"   Search objects uploaded: {upload_result.successfully_uploaded}")
-    print(f"   Failed uploads: {upload_result.failed_uploads}")
-    print(f"   Upload time: {upload_result.upload_time:.2f}s")
+    lines.append(f"\n📤 Upload Phase:")
+    lines.append(f"   Search objects uploaded: {upload_result.successfully_uploaded}")
+    lines.append(f"   Failed uploads: {upload_result.failed_uploads}")
+    lines.append(f"   Upload time: {upload_result.upload_time:.2f}s")
     
     # Overall Pipeline Stats
     discovery_time = getattr(discovery_result, 'discovery_time', 0)
     total_time = discovery_time + processing_result.processing_time + upload_result.upload_time
-    print(f"\n🎯 Overall Results:")
-    print(f"   Total execution time: {total_time:.2f}s")
+    lines.append(f"\n🎯 Overall Results:")
+    lines.append(f"   Total execution time: {total_time:.2f}s")
     
     if discovery_result.total_files > 0:
         # Calculate success rate based on total discovered files
         success_rate = (upload_result.successfully_uploaded / discovery_result.total_files) * 100
-        print(f"   Overall success rate: {success_rate:.1f}%")
+        lines.append(f"   Overall success rate: {success_rate:.1f}%")
         
         # Processing efficiency
         if processing_result.successfully_processed > 0:
             upload_efficiency = (upload_result.successfully_uploaded / processing_result.successfully_processed) * 100
-            print(f"   Upload efficiency: {upload_efficiency:.1f}%")
+            lines.append(f"   Upload efficiency: {upload_efficiency:.1f}%")
     
     # Error Summary
     all_errors = []
@@ -272,23 +268,25 @@ def print_pipeline_statistics(discovery_result, processing_result, upload_result
         all_errors.extend(upload_result.errors)
     
     if all_errors:
-        print(f"\n⚠️  Errors encountered: {len(all_errors)}")
+        lines.append(f"\n⚠️  Errors encountered: {len(all_errors)}")
         for i, error in enumerate(all_errors[:5], 1):  # Show first 5 errors
-            print(f"   {i}. {error}")
+            lines.append(f"   {i}. {error}")
         if len(all_errors) > 5:
-            print(f"   ... and {len(all_errors) - 5} more errors")
+            lines.append(f"   ... and {len(all_errors) - 5} more errors")
     else:
-        print(f"\n✅ No errors encountered during processing")
+        lines.append(f"\n✅ No errors encountered during processing")
         
     # Performance insights
     if discovery_result.total_files > 0:
         avg_processing_time = processing_result.processing_time / max(processing_result.successfully_processed, 1)
-        print(f"\n📈 Performance Metrics:")
-        print(f"   Average processing time per file: {avg_processing_time:.2f}s")
+        lines.append(f"\n📈 Performance Metrics:")
+        lines.append(f"   Average processing time per file: {avg_processing_time:.2f}s")
         
         if upload_result.successfully_uploaded > 0:
             avg_upload_time = upload_result.upload_time / upload_result.successfully_uploaded
-            print(f"   Average upload time per object: {avg_upload_time:.2f}s")
+            lines.append(f"   Average upload time per object: {avg_upload_time:.2f}s")
+    
+    print("\n".join(lines))
 
 
 def main() -> int:
@@ -377,7 +375,7 @@ Advanced Usage:
                 
                 # Perform reset (unless dry run)
                 if not args.dry_run:
-                    reset_success = await force_reset_index_and_tracker()
+                    reset_success = force_reset_index_and_tracker()
                     if not reset_success:
                         print("❌ Force reset failed")
                         return 1
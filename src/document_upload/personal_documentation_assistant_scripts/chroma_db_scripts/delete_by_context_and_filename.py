@@ -532,10 +532,7 @@ Examples:
         args.preview = False
 
     try:
-        # Load environment and validate
-        load_dotenv()
-        
-        # Validate environment variables for ChromaDB
+        # Validate environment variables for ChromaDB (loaded from .env at import)
         required_vars = ['CHROMADB_COLLECTION_NAME', 'CHROMADB_PERSIST_DIRECTORY']
         missing_vars = [var for var in required_vars if not os.getenv(var)]
         
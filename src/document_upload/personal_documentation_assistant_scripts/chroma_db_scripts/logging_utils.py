@@ -20,6 +20,7 @@ Usage:
 """
 
 import os
+import re
 import sys
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -31,6 +32,9 @@ DEFAULT_LOG_DIRECTORY = r"C:\Users\aayushalok\OneDrive - Microsoft\Desktop\Perso
 # IST timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# ANSI escape sequences stripped from file output (compiled once, used for every message)
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 class ScriptLogger:
     """
@@ -115,9 +119,7 @@ class ScriptLogger:
     
     def _clean_message(self, message: str) -> str:
         """Remove ANSI escape codes for clean file output"""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', message)
+        return _ANSI_ESCAPE.sub('', message)
     
     def close_log(self):
         """Close the log with a footer"""
@@ -67,7 +67,7 @@ def print_and_log(message: str, end: str = '\n'):
         _script_logger.log(message, end=end)
 
 
-async def force_reset_chromadb_and_tracker() -> bool:
+def force_reset_chromadb_and_tracker() -> bool:
     """Complete ChromaDB reset and tracker cleanup with comprehensive validation"""
     print_and_log("🗑️  Performing complete force reset...")
     
@@ -110,7 +110,7 @@ async def force_reset_chromadb_and_tracker() -> bool:
 
 def create_configured_pipeline() -> DocumentProcessingPipeline:
     """Create fully configured pipeline with ChromaDB strategies"""
-    from document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
+    from src.document_upload.discovery_strategies import GeneralDocumentDiscoveryStrategy
     
     # Initialize strategies
     discovery_strategy = GeneralDocumentDiscoveryStrategy()
@@ -138,10 +138,7 @@ async def process_path_with_chromadb_pipeline(target_path: str, dry_run: bool =
         print_and_log(f"❌ Error: Path does not exist: {target_path}")
         return False
     
-    # Load environment
-    load_dotenv()
-    
-    # Create configured pipeline
+    # Create configured pipeline (environment was loaded at import)
     pipeline = create_configured_pipeline()
 
     try:
@@ -209,50 +206,52 @@ async def process_path_with_chromadb_pipeline(target_path: str, dry_run: bool =
 
 def print_chromadb_pipeline_statistics(discovery_result, processing_result, upload_result):
     """Enhanced statistics reporting for ChromaDB pipeline"""
-    print_and_log("\n" + "="*60)
-    print_and_log("📊 CHROMADB PIPELINE EXECUTION STATISTICS")
-    print_and_log("="*60)
+    # Collect the report and emit it with a single write instead of one per line
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("📊 CHROMADB PIPELINE EXECUTION STATISTICS")
+    lines.append("="*60)
     
     # Discovery Phase Stats
-    print_and_log(f"\n📁 Discovery Phase:")
-    print_and_log(f"   Total files discovered: {discovery_result.total_files}")
+    lines.append(f"\n📁 Discovery Phase:")
+    lines.append(f"   Total files discovered: {discovery_result.total_files}")
     if hasattr(discovery_result, 'files_by_type') and discovery_result.files_by_type:
-        print_and_log(f"   Files by type: {discovery_result.files_by_type}")
+        lines.append(f"   Files by type: {discovery_result.files_by_type}")
     if hasattr(discovery_result, 'skipped_files'):
-        print_and_log(f"   Files skipped: {len(discovery_result.skipped_files)}")
+        lines.append(f"   Files skipped: {len(discovery_result.skipped_files)}")
     
     # Processing Phase Stats  
-    print_and_log(f"\n⚙️  Processing Phase:")
-    print_and_log(f"   Successfully processed: {processing_result.successfully_processed}")
-    print_and_log(f"   Failed processing: {processing_result.failed_documents}")
-    print_and_log(f"   Processing time: {processing_result.processing_time:.2f}s")
-    print_and_log(f"   Strategy used: {processing_result.strategy_name}")
+    lines.append(f"\n⚙️  Processing Phase:")
+    lines.append(f"   Successfully processed: {processing_result.successfully_processed}")
+    lines.append(f"   Failed processing: {processing_result.failed_documents}")
+    lines.append(f"   Processing time: {processing_result.processing_time:.2f}s")
+    lines.append(f"   Strategy used: {processing_result.strategy_name}")
     
     # Strategy-specific metadata
     if hasattr(processing_result, 'strategy_metadata') and processing_result.strategy_metadata:
         metadata = processing_result.strategy_metadata
         work_items_count = metadata.get('work_items_count', 0)
         if work_items_count > 0:
-            print_and_log(f"   Work items found: {work_items_count}")
+            lines.append(f"   Work items found: {work_items_count}")
             work_items = metadata.get('work_items_found', [])
             if work_items:
-                print_and_log(f"   Work items: {', '.join(work_items[:5])}")
+                lines.append(f"   Work items: {', '.join(work_items[:5])}")
                 if len(work_items) > 5:
-                    print_and_log(f"   (and {len(work_items) - 5} more)")
+                    lines.append(f"   (and {len(work_items) - 5} more)")
     
     # Upload Phase Stats
-    print_and_log(f"\n📤 Upload Phase:")
-    print_and_log(f"   Search objects uploaded: {upload_result.successfully_uploaded}")
-    print_and_log(f"   Failed uploads: {upload_result.failed_uploads}")
-    print_and_log(f"   Upload time: {upload_result.upload_time:.2f}s")
+    lines.append(f"\n📤 Upload Phase:")
+    lines.append(f"   Search objects uploaded: {upload_result.successfully_uploaded}")
+    lines.append(f"   Failed uploads: {upload_result.failed_uploads}")
+    lines.append(f"   Upload time: {upload_result.upload_time:.2f}s")
     
     # Overall Pipeline Stats
     discovery_time = getattr(discovery_result, 'discovery_time', 0)
     total_time = discovery_time + processing_result.processing_time + upload_result.upload_time
-    print_and_log(f"\n📈 Overall Pipeline:")
-    print_and_log(f"   Total execution time: {total_time:.2f}s")
-    print_and_log(f"   Vector service: ChromaDB (local)")
-    print_and_log(f"   Embedding service: {os.getenv('EMBEDDING_PROVIDER_SERVICE', 'local')}")
+    lines.append(f"\n📈 Overall Pipeline:")
+    lines.append(f"   Total execution time: {total_time:.2f}s")
+    lines.append(f"   Vector service: ChromaDB (local)")
+    lines.append(f"   Embedding service: {os.getenv('EMBEDDING_PROVIDER_SERVICE', 'local')}")
 
     # Error Summary
     all_errors = []
@@ -264,14 +263,16 @@ def print_chromadb_pipeline_statistics(discovery_result, processing_result, uplo
         all_errors.extend(upload_result.errors)
     
     if all_errors:
-        print_and_log(f"\n⚠️  Errors encountered: {len(all_errors)}")
+        lines.append(f"\n⚠️  Errors encountered: {len(all_errors)}")
         # Show first few errors
         for error in all_errors[:3]:
-            print_and_log(f"   • {error}")
+            lines.append(f"   • {error}")
         if len(all_errors) > 3:
-            print_and_log(f"   • ... and {len(all_errors) - 3} more errors")
+            lines.append(f"   • ... and {len(all_errors) - 3} more errors")
+    
+    lines.append("="*60)
     
-    print_and_log("="*60)
+    print_and_log("\n".join(lines))
 
 
 async def run_main():
@@ -333,7 +334,7 @@ Examples:
         
         # Handle force reset if requested
         if args.force_reset:
-            if not await force_reset_chromadb_and_tracker():
+            if not force_reset_chromadb_and_tracker():
                 print_and_log("❌ Force reset failed")
                 return 1
         
@@ -16,6 +16,8 @@ and contains strategies tailored to work item-based document organization:
 import json
 import re
 import asyncio
+import hashlib
+from array import array
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -23,13 +25,7 @@ from typing import List, Dict, Optional, Any, Iterator
 from dataclasses import dataclass
 import frontmatter
 import os
-from dotenv import load_dotenv
-
-# Import our helper modules
-import sys
-
-from src.document_upload.ai_tag_generation.ai_tag_generator import AITagGenerator
-sys.path.append(str(Path(__file__).parent.parent))
+from src.common.environment import load_environment
 
 # Import chunking strategies
 from .chunking_strategies import SimpleChunkingStrategy, ChunkingConfig
@@ -48,13 +44,17 @@ except ImportError:
     PPTX_AVAILABLE = False
 
 # Load environment variables
-load_dotenv()
+load_environment()
+
+# Settings read once at import (after .env is loaded) instead of per strategy or batch
+ENABLE_AI_TAG_GENERATION = os.getenv('ENABLE_AI_TAG_GENERATION', 'false').lower() == 'true'
+EMBEDDING_PROVIDER_SERVICE = os.getenv('EMBEDDING_PROVIDER_SERVICE', 'azure_ai_foundry')
 
 # Azure Cognitive Search Index Fields - based on create_index.py schema
 AZURE_SEARCH_INDEX_FIELDS = {
     'id', 'content', 'content_vector', 'file_path', 'file_name', 'file_type', 
     'title', 'tags', 'category', 'context_name', 'last_modified', 
-    'chunk_index', 'metadata_json'
+    'chunk_index', 'metadata_json', 'content_hash'
 }
 
 
@@ -119,6 +119,32 @@ def _read_document_file(file_path: Path) -> Optional[Dict]:
         return None
 
 
+# YAML frontmatter delimiter line, as recognized by python-frontmatter
+_YAML_FRONTMATTER_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+
+def _load_frontmatter_metadata(content: str) -> Dict:
+    """
+    Parse only the frontmatter metadata of a markdown document.
+    
+    frontmatter.loads() splits the whole document to also return its body. When
+    only the metadata is needed, hand it just the leading YAML block so the cost
+    no longer grows with the document length.
+    
+    Args:
+        content: Full markdown document text
+        
+    Returns:
+        Dict: Frontmatter metadata (empty if the document has none)
+    """
+    opening = _YAML_FRONTMATTER_BOUNDARY.match(content)
+    if opening:
+        closing = _YAML_FRONTMATTER_BOUNDARY.search(content, opening.end())
+        if closing:
+            content = content[:closing.end()]
+    return frontmatter.loads(content).metadata
+
+
 def _extract_docx_content(file_path: Path) -> Optional[str]:
     """
     Extract text content from a DOCX file with proper structure preservation.
@@ -432,6 +458,84 @@ class DocumentProcessingStrategy(ABC):
         path_str = str(file_path).replace('\\', '/')
         return hashlib.md5(path_str.encode()).hexdigest()
 
+    async def _generate_chunk_embeddings_batched(self, chunks: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for all chunks of a document in one batched request.
+        
+        Sends every non-blank chunk through the generator's generate_embeddings_batch
+        instead of one request per chunk. Output stays aligned with the input: chunks
+        that are blank or fail to embed get an empty vector as fallback.
+        
+        Args:
+            chunks: List of text chunks to generate embeddings for
+            
+        Returns:
+            List[List[float]]: List of embedding vectors, empty list for failed embeddings
+        """
+        from src.common.embedding_services.embedding_service_factory import get_embedding_generator
+        
+        embeddings: List[List[float]] = [[] for _ in chunks]
+        # Generators skip blank texts in batches, so only send (and map back) the others
+        indexed_chunks = [(i, chunk) for i, chunk in enumerate(chunks) if chunk and chunk.strip()]
+        
+        batch_embeddings = []
+        if indexed_chunks:
+            try:
+                embedding_generator = get_embedding_generator()
+                batch_embeddings = await embedding_generator.generate_embeddings_batch(
+                    [chunk for _, chunk in indexed_chunks]
+                )
+            except Exception as e:
+                print(f"Error generating embeddings for document chunks: {e}")
+            
+            if len(batch_embeddings) != len(indexed_chunks):
+                batch_embeddings = [None] * len(indexed_chunks)
+        
+        valid_mask = self._valid_embedding_mask(batch_embeddings)
+        for (i, _), embedding, is_valid in zip(indexed_chunks, batch_embeddings, valid_mask):
+            if is_valid:
+                embeddings[i] = embedding
+        
+        failed_chunks = [i for i, embedding in enumerate(embeddings) if not embedding]
+        if failed_chunks:
+            print(f"Warning: Failed to generate embeddings for {len(failed_chunks)} of {len(chunks)} chunks: {failed_chunks}")
+        
+        return embeddings
+    
+    @staticmethod
+    def _valid_embedding_mask(batch_embeddings: List[Optional[List[float]]]) -> List[bool]:
+        """
+        Check a batch of embeddings in one vectorized pass.
+        
+        Batch generators pad failures with None or zero vectors. An embedding is
+        valid when it is present, has the batch's dimension, is finite and is not
+        all zeros.
+        
+        Args:
+            batch_embeddings: Embeddings returned by generate_embeddings_batch
+            
+        Returns:
+            List[bool]: One flag per embedding
+        """
+        import numpy as np
+        
+        dimension = next((len(embedding) for embedding in batch_embeddings if embedding), 0)
+        rows = [i for i, embedding in enumerate(batch_embeddings)
+                if embedding is not None and len(embedding) == dimension and dimension]
+        mask = [False] * len(batch_embeddings)
+        if not rows:
+            return mask
+        
+        try:
+            matrix = np.asarray([batch_embeddings[i] for i in rows], dtype=np.float32)
+        except (TypeError, ValueError):
+            return mask
+        
+        row_valid = np.isfinite(matrix).all(axis=1) & matrix.any(axis=1)
+        for i, is_valid in zip(rows, row_valid.tolist()):
+            mask[i] = is_valid
+        return mask
+
 
 class PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy(DocumentProcessingStrategy):
     """
@@ -730,24 +834,7 @@ class PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy(Docum
         Returns:
             List[List[float]]: List of embedding vectors, empty list for failed embeddings
         """
-        from src.common.embedding_services.embedding_service_factory import get_embedding_generator
-        
-        embedding_generator = get_embedding_generator()
-        embeddings = []
-        
-        for i, chunk in enumerate(chunks):
-            try:
-                embedding = await embedding_generator.generate_embedding(chunk)
-                if embedding is None:
-                    print(f"Warning: Failed to generate embedding for chunk {i}")
-                    embeddings.append([])  # Empty vector as fallback
-                else:
-                    embeddings.append(embedding)
-            except Exception as e:
-                print(f"Error generating embedding for chunk {i}: {e}")
-                embeddings.append([])  # Empty vector as fallback
-        
-        return embeddings
+        return await self._generate_chunk_embeddings_batched(chunks)
     
     def create_chunk_search_objects(self, processed_doc: ProcessedDocument, 
                                    chunk_embeddings: List[List[float]]) -> List[Dict[str, Any]]:
@@ -766,34 +853,60 @@ class PersonalDocumentationAssistantAzureCognitiveSearchProcessingStrategy(Docum
         """
         search_objects = []
         
+        # Convert tags array to comma-separated string (Azure Search expects string, not array)
+        tags_str = ', '.join(processed_doc.tags) if isinstance(processed_doc.tags, list) else str(processed_doc.tags) if processed_doc.tags else ''
+        
+        # Fields shared by every chunk of the document, built once per document
+        document_fields = {
+            "file_path": processed_doc.file_path,
+            "file_name": processed_doc.file_name,
+            "file_type": processed_doc.file_type,
+            "title": processed_doc.title,
+            "tags": tags_str,  # Convert to string format
+            "category": processed_doc.category,
+            "context_name": processed_doc.context_name,
+            "last_modified": processed_doc.last_modified,
+            "metadata_json": processed_doc.metadata_json
+        }
+        document_id = processed_doc.document_id
+        file_name = processed_doc.file_name
+        
         for chunk_index, (chunk_content, embedding) in enumerate(zip(processed_doc.content_chunks, chunk_embeddings)):
-            # Convert tags array to comma-separated string (Azure Search expects string, not array)
-            tags_str = ', '.join(processed_doc.tags) if isinstance(processed_doc.tags, list) else str(processed_doc.tags) if processed_doc.tags else ''
-            
-            # Create enhanced chunk index with file path and chunk number for better identification
-            # Format: "filename.ext_chunk_N" for easy identification and sorting
-            enhanced_chunk_index = f"{processed_doc.file_name}_chunk_{chunk_index}"
-            
             # Create search index object matching the exact schema from create_index.py
             search_object = {
-                "id": f"{processed_doc.document_id}_chunk_{chunk_index}",
+                "id": f"{document_id}_chunk_{chunk_index}",
                 "content": chunk_content,
                 "content_vector": embedding,
-                "file_path": processed_doc.file_path,
-                "file_name": processed_doc.file_name,
-                "file_type": processed_doc.file_type,
-                "title": processed_doc.title,
-                "tags": tags_str,  # Convert to string format
-                "category": processed_doc.category,
-                "context_name": processed_doc.context_name,
-                "last_modified": processed_doc.last_modified,
-                "chunk_index": enhanced_chunk_index,
-                "metadata_json": processed_doc.metadata_json
+                **document_fields,
+                # Enhanced chunk index "filename.ext_chunk_N" for easy identification and sorting
+                "chunk_index": f"{file_name}_chunk_{chunk_index}"
             }
+            # Lets the upload skip chunks the index already holds unchanged
+            search_object["content_hash"] = self.compute_content_hash(search_object)
             search_objects.append(search_object)
         
         return search_objects
     
+    @staticmethod
+    def compute_content_hash(search_object: Dict[str, Any]) -> str:
+        """
+        Compute a stable hash of everything a search object would write to the index.
+        
+        Covers every field (the vector as raw float bytes rather than JSON), so a
+        chunk hashes the same only if re-uploading it would change nothing.
+        
+        Args:
+            search_object: Search object without its content_hash
+            
+        Returns:
+            str: 32-character hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        fields = {k: v for k, v in search_object.items() if k not in ('content_vector', 'content_hash')}
+        digest.update(json.dumps(fields, sort_keys=True, default=str).encode())
+        digest.update(array('d', search_object.get('content_vector') or []).tobytes())
+        return digest.hexdigest()
+    
     async def create_search_index_objects(self, processed_documents: List[ProcessedDocument]):
         """
         Create Azure Cognitive Search index objects optimized for Personal Documentation Assistant.
@@ -854,8 +967,10 @@ class PersonalDocumentationAssistantChromaDBProcessingStrategy(DocumentProcessin
         
         # Initialize AI tag generator if enabled
         self.ai_tag_generator = None
-        if os.getenv('ENABLE_AI_TAG_GENERATION', 'false').lower() == 'true':
+        if ENABLE_AI_TAG_GENERATION:
             print("[INFO] AI tag generation enabled")
+            # Imported only when enabled: pulls in the OpenAI SDK
+            from src.document_upload.ai_tag_generation.ai_tag_generator import AITagGenerator
             self.ai_tag_generator = AITagGenerator()
     
     def get_strategy_name(self) -> str:
@@ -953,7 +1068,7 @@ class PersonalDocumentationAssistantChromaDBProcessingStrategy(DocumentProcessin
                 for work_item in work_items_found
             },
             "vector_service": "ChromaDB",
-            "embedding_service": os.getenv("EMBEDDING_PROVIDER_SERVICE", "azure_ai_foundry")
+            "embedding_service": EMBEDDING_PROVIDER_SERVICE
         }
         
         return DocumentProcessingResult(
@@ -998,8 +1113,8 @@ class PersonalDocumentationAssistantChromaDBProcessingStrategy(DocumentProcessin
                 clean_content = content
                 if file_type == 'markdown':
                     try:
-                        post = frontmatter.loads(content)
-                        metadata = dict(post.metadata) if post.metadata else {}
+                        frontmatter_metadata = _load_frontmatter_metadata(content)
+                        metadata = dict(frontmatter_metadata) if frontmatter_metadata else {}
                     except:
                         pass  # If frontmatter parsing fails, use content as-is            
             # Extract work item ID from directory structure (primary strategy)
@@ -1168,24 +1283,7 @@ class PersonalDocumentationAssistantChromaDBProcessingStrategy(DocumentProcessin
         Returns:
             List[List[float]]: List of embedding vectors
         """
-        from src.common.embedding_services.embedding_service_factory import get_embedding_generator
-        
-        embedding_generator = get_embedding_generator()
-        embeddings = []
-        
-        for i, chunk in enumerate(chunks):
-            try:
-                embedding = await embedding_generator.generate_embedding(chunk)
-                if embedding is None:
-                    print(f"Warning: Failed to generate embedding for chunk {i}")
-                    embeddings.append([])  # Empty vector as fallback
-                else:
-                    embeddings.append(embedding)
-            except Exception as e:
-                print(f"Error generating embedding for chunk {i}: {e}")
-                embeddings.append([])  # Empty vector as fallback
-        
-        return embeddings
+        return await self._generate_chunk_embeddings_batched(chunks)
     
     def _flatten_metadata_for_chromadb(self, metadata_json_str: str) -> Dict[str, Any]:
         """
@@ -1246,37 +1344,43 @@ class PersonalDocumentationAssistantChromaDBProcessingStrategy(DocumentProcessin
         # Flatten additional metadata for ChromaDB
         flattened_metadata = self._flatten_metadata_for_chromadb(processed_doc.metadata_json)
         
+        # Store both comma-separated tags AND individual tag fields for better querying
+        tags_str = ', '.join(processed_doc.tags) if isinstance(processed_doc.tags, list) else str(processed_doc.tags) if processed_doc.tags else ''
+        
+        # Fields shared by every chunk of the document, built once per document
+        document_fields = {
+            "file_path": processed_doc.file_path,
+            "file_name": processed_doc.file_name,
+            "file_type": processed_doc.file_type,
+            "title": processed_doc.title,
+            "tags": tags_str,
+            "category": processed_doc.category or "",
+            "context_name": processed_doc.context_name or "",
+            "last_modified": processed_doc.last_modified,
+            "processing_strategy": processed_doc.processing_strategy
+        }
+        
+        # Add tag count for filtering if tags exist
+        if processed_doc.tags:
+            document_fields["tag_count"] = len(processed_doc.tags)
+        
+        # Add flattened metadata fields directly to the search object
+        document_fields.update(flattened_metadata)
+        
+        document_id = processed_doc.document_id
+        file_name = processed_doc.file_name
+        
         for chunk_index, (chunk_content, embedding) in enumerate(zip(processed_doc.content_chunks, chunk_embeddings)):
-            # Store both comma-separated tags AND individual tag fields for better querying
-            tags_str = ', '.join(processed_doc.tags) if isinstance(processed_doc.tags, list) else str(processed_doc.tags) if processed_doc.tags else ''
-            
-            # Create enhanced chunk index for better identification
-            enhanced_chunk_index = f"{processed_doc.file_name}_chunk_{chunk_index}"
-            
             # Create ChromaDB-compatible search object
             search_object = {
-                "id": f"{processed_doc.document_id}_chunk_{chunk_index}",
+                "id": f"{document_id}_chunk_{chunk_index}",
                 "content": chunk_content,
                 "content_vector": embedding,
-                "file_path": processed_doc.file_path,
-                "file_name": processed_doc.file_name,
-                "file_type": processed_doc.file_type,
-                "title": processed_doc.title,
-                "tags": tags_str,
-                "category": processed_doc.category or "",
-                "context_name": processed_doc.context_name or "",
-                "last_modified": processed_doc.last_modified,
-                "chunk_index": enhanced_chunk_index,
-                "processing_strategy": processed_doc.processing_strategy
+                # Enhanced chunk index for better identification
+                "chunk_index": f"{file_name}_chunk_{chunk_index}",
+                **document_fields
             }
             
-            # Add tag count for filtering if tags exist
-            if processed_doc.tags:
-                search_object["tag_count"] = len(processed_doc.tags)
-            
-            # Add flattened metadata fields directly to the search object
-            search_object.update(flattened_metadata)
-            
             search_objects.append(search_object)
         
         return search_objects
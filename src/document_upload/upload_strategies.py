@@ -20,15 +20,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from src.common.environment import load_environment
 
-from .processing_strategies import DocumentProcessingStrategy, ProcessedDocument
+from .processing_strategies import DocumentProcessingStrategy, ProcessedDocument, EMBEDDING_PROVIDER_SERVICE
 
 # Load environment variables
-load_dotenv()
+load_environment()
 
 logger = logging.getLogger(__name__)
 
+# Documents between upload progress lines (the last document always reports)
+UPLOAD_PROGRESS_INTERVAL = max(1, int(os.getenv('UPLOAD_PROGRESS_INTERVAL', '100')))
+
+
+def _print_upload_progress(doc_idx: int, total_documents: int, uploaded: int, failed: int) -> None:
+    """Print one progress line every UPLOAD_PROGRESS_INTERVAL documents instead of per document"""
+    if doc_idx % UPLOAD_PROGRESS_INTERVAL == 0 or doc_idx == total_documents:
+        print(f"   📄 Documents {doc_idx}/{total_documents}: {uploaded} search objects uploaded, {failed} failed")
+
 
 @dataclass
 class DocumentUploadResult:
@@ -164,12 +173,7 @@ class AzureCognitiveSearchDocumentUploadStrategy(DocumentUploadStrategy):
         # Process each document individually
         for doc_idx, processed_doc in enumerate(processed_documents, 1):
             try:
-                print(f"📄 Document {doc_idx}/{len(processed_documents)}: {processed_doc.file_name}")
-                
-                # Create search index objects for this document
-                print(f"🔄 Creating search objects with embeddings...")
-                
-                # Collect search objects for this document
+                # Create and collect the search objects (with embeddings) for this document
                 doc_search_objects = []
                 if self.processing_strategy:
                     async for search_object in self.processing_strategy.create_search_index_objects([processed_doc]):
@@ -183,12 +187,8 @@ class AzureCognitiveSearchDocumentUploadStrategy(DocumentUploadStrategy):
                 doc_total_objects = len(doc_search_objects)
                 total_search_objects += doc_total_objects
                 
-                print(f"      📊 Generated {doc_total_objects} search objects")
-                
                 if doc_search_objects:
                     # Upload this document's search objects to Azure Search
-                    print(f"      📤 Uploading {doc_total_objects} objects to Azure Search...", end=" ")
-                    
                     successful, failed = self.azure_search_service.upload_search_objects_batch(doc_search_objects)
                     
                     successfully_uploaded += successful
@@ -197,30 +197,30 @@ class AzureCognitiveSearchDocumentUploadStrategy(DocumentUploadStrategy):
                     if failed > 0:
                         error_msg = f"Document {doc_idx} ({processed_doc.file_name}): {failed}/{doc_total_objects} objects failed to upload"
                         errors.append(error_msg)
-                        print(f"⚠️  ({successful} succeeded, {failed} failed)")
                         failed_upload_files.append(Path(processed_doc.file_path))
                     else:
-                        print("✅")
                         successfully_uploaded_files.append(Path(processed_doc.file_path))
                         
                         # Mark file as processed immediately after successful upload
                         if tracker is not None:
                             tracker.mark_processed(Path(processed_doc.file_path), processed_doc.metadata)
-                            print(f"      📋 Marked as processed in tracker")
                 else:
                     error_msg = f"Document {doc_idx} ({processed_doc.file_name}): No search objects generated"
                     errors.append(error_msg)
-                    print(f"      ❌ No search objects generated")
                     failed_upload_files.append(Path(processed_doc.file_path))
                     
             except Exception as e:
                 error_msg = f"Document {doc_idx} ({processed_doc.file_name}): Upload error - {str(e)}"
                 errors.append(error_msg)
                 logger.error(error_msg)
-                print(f"      ❌ Error: {str(e)}")
                 # Count all potential objects from this document as failed
                 failed_uploads += processed_doc.chunk_count  # Estimate based on chunk count
                 failed_upload_files.append(Path(processed_doc.file_path))
+            finally:
+                _print_upload_progress(doc_idx, len(processed_documents), successfully_uploaded, failed_uploads)
+        
+        if errors:
+            print(f"   ⚠️  {len(errors)} upload errors (see result errors)")
         
         # Save tracker after all uploads are complete
         if tracker is not None and successfully_uploaded_files:
@@ -369,12 +369,7 @@ class ChromaDBDocumentUploadStrategy(DocumentUploadStrategy):
         # Process each document individually
         for doc_idx, processed_doc in enumerate(processed_documents, 1):
             try:
-                print(f"📄 Document {doc_idx}/{len(processed_documents)}: {processed_doc.file_name}")
-                
-                # Create search index objects for this document
-                print(f"🔄 Creating ChromaDB search objects ...")
-                
-                # Collect search objects for this document
+                # Create and collect the search objects (with embeddings) for this document
                 doc_search_objects = []
                 if self.processing_strategy:
                     async for search_object in self.processing_strategy.create_search_index_objects([processed_doc]):
@@ -388,12 +383,8 @@ class ChromaDBDocumentUploadStrategy(DocumentUploadStrategy):
                 doc_total_objects = len(doc_search_objects)
                 total_search_objects += doc_total_objects
                 
-                print(f"      📊 Generated {doc_total_objects} ChromaDB search objects")
-                
                 if doc_search_objects:
                     # Upload this document's search objects to ChromaDB
-                    print(f"      📤 Uploading {doc_total_objects} objects to ChromaDB...", end=" ")
-                    
                     successful, failed = self.chromadb_service.upload_search_objects_batch(doc_search_objects)
                     
                     successfully_uploaded += successful
@@ -402,30 +393,30 @@ class ChromaDBDocumentUploadStrategy(DocumentUploadStrategy):
                     if failed > 0:
                         error_msg = f"Document {doc_idx} ({processed_doc.file_name}): {failed}/{doc_total_objects} objects failed to upload"
                         errors.append(error_msg)
-                        print(f"⚠️  ({successful} succeeded, {failed} failed)")
                         failed_upload_files.append(Path(processed_doc.file_path))
                     else:
-                        print("✅")
                         successfully_uploaded_files.append(Path(processed_doc.file_path))
                         
                         # Mark file as processed immediately after successful upload
                         if tracker is not None:
                             tracker.mark_processed(Path(processed_doc.file_path), processed_doc.metadata)
-                            print(f"      📋 Marked as processed in tracker")
                 else:
                     error_msg = f"Document {doc_idx} ({processed_doc.file_name}): No search objects generated"
                     errors.append(error_msg)
-                    print(f"      ❌ No search objects generated")
                     failed_upload_files.append(Path(processed_doc.file_path))
                     
             except Exception as e:
                 error_msg = f"Document {doc_idx} ({processed_doc.file_name}): Upload error - {str(e)}"
                 errors.append(error_msg)
                 logger.error(error_msg)
-                print(f"      ❌ Error: {str(e)}")
                 # Count all potential objects from this document as failed
                 failed_uploads += processed_doc.chunk_count  # Estimate based on chunk count
                 failed_upload_files.append(Path(processed_doc.file_path))
+            finally:
+                _print_upload_progress(doc_idx, len(processed_documents), successfully_uploaded, failed_uploads)
+        
+        if errors:
+            print(f"   ⚠️  {len(errors)} upload errors (see result errors)")
         
         # Save tracker after all uploads are complete
         if tracker is not None and successfully_uploaded_files:
@@ -441,7 +432,7 @@ class ChromaDBDocumentUploadStrategy(DocumentUploadStrategy):
             "documents_failed_upload": len(failed_upload_files),
             "chromadb_collection_name": self.collection_name,
             "chromadb_persist_directory": self.persist_directory,
-            "embedding_service": os.getenv("EMBEDDING_PROVIDER_SERVICE", "azure_ai_foundry")
+            "embedding_service": EMBEDDING_PROVIDER_SERVICE
         }
         
         logger.info(f"Upload completed: {successfully_uploaded}/{total_search_objects} objects uploaded successfully")
@@ -0,0 +1,8 @@
+"""Run the MCP server with `python -m src.mcp_server`"""
+
+import asyncio
+
+from src.mcp_server.server import main
+
+if __name__ == "__main__":
+    asyncio.run(main())
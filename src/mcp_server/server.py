@@ -9,29 +9,20 @@ and managing documentation for LLM interactions.
 
 import asyncio
 import logging
+import os
 from typing import Optional
-import sys
-from pathlib import Path
 
-from src.common.vector_search_services.vector_search_interface import IVectorSearchService
 from src.common.vector_search_services.vector_search_service_factory import get_vector_search_service
 from src.mcp_server.tools import get_all_tools
 
-# ONE simple line to fix all imports - find project root and add src
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / 'src'))
-
 # Import the actual MCP server classes (now no naming conflict)
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
-# Import our search functionality
-from src.common.embedding_services.embedding_service_factory import get_embedding_generator
-
 # Import refactored tool components
-from mcp_server.tools.tool_router import ToolRouter
+from src.mcp_server.tools.tool_router import ToolRouter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,9 +36,29 @@ search_service = None
 embedding_generator = None
 tool_router: Optional[ToolRouter] = None
 
+# Serializes first-time initialization so concurrent tool calls during cold start
+# don't each construct their own search service and embedding generator
+_init_lock = asyncio.Lock()
+_initialized = False
+
 
 async def initialize_services():
-    """Initialize search and embedding services"""
+    """Initialize search and embedding services (idempotent and safe to call concurrently)"""
+    global search_service, embedding_generator, tool_router, _initialized
+    
+    if _initialized:
+        return search_service, embedding_generator, tool_router
+    
+    async with _init_lock:
+        if not _initialized:
+            _initialize_services_locked()
+            _initialized = True
+    
+    return search_service, embedding_generator, tool_router
+
+
+def _initialize_services_locked():
+    """Create any services that are not yet initialized; caller holds _init_lock"""
     global search_service, embedding_generator, tool_router
     
     if search_service is None:
@@ -56,30 +67,32 @@ async def initialize_services():
         
     if embedding_generator is None:
         logger.info("[INFO] Initializing embedding services...")
+        # Imported lazily: embedding providers may pull in heavy ML libraries
+        from src.common.embedding_services.embedding_service_factory import get_embedding_generator
         embedding_generator = get_embedding_generator()
     
     if tool_router is None:
         logger.info("[INFO] Initializing tool router...")
         tool_router = ToolRouter(search_service)
-        
-    return search_service, embedding_generator, tool_router
+
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[types.Tool] = get_all_tools()
 
 
 @app.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools for documentation search and management."""
-    return get_all_tools()
+    return _TOOLS
 
 
 @app.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """Handle tool calls for documentation operations."""
-    global tool_router
-    
-    # Initialize tool router if not already done
-    if tool_router is None:
+    # main() initializes services before serving; this guard (a flag check once
+    # initialized) covers any path that reaches a tool call without main()
+    if not _initialized:
         await initialize_services()
-    
     return await tool_router.handle_tool_call(name, arguments)
 
 
@@ -91,44 +104,57 @@ async def main():
         # Test connections on startup
         logger.info("[CONNECT] Testing connections...")
         
-        # Initialize and test search functionality
-        global search_service, embedding_generator
-        search_service = get_vector_search_service()
-        embedding_generator = get_embedding_generator()
+        # Initialize all services once, before any tool call can arrive
+        await initialize_services()
+        
+        # Run the startup probes concurrently - they are independent blocking calls.
+        # Each probe is bounded so one unreachable service can't stall startup.
+        probe_timeout = float(os.getenv('MCP_STARTUP_PROBE_TIMEOUT', '30'))
+        embedding_ok, doc_count, contexts = await asyncio.gather(
+            asyncio.wait_for(asyncio.to_thread(embedding_generator.test_connection), probe_timeout),
+            asyncio.wait_for(asyncio.to_thread(search_service.get_document_count), probe_timeout),
+            asyncio.wait_for(asyncio.to_thread(search_service.get_unique_field_values, "context_name"), probe_timeout),
+            return_exceptions=True
+        )
         
         # Test embedding service
-        if embedding_generator.test_connection():
+        if embedding_ok is True:
             logger.info("[SUCCESS] Embedding service connection successful")
         else:
             logger.warning("[WARNING]  Embedding service connection failed")
         
         # Test search service
-        try:
-            doc_count = search_service.get_document_count()
-            contexts = search_service.get_unique_field_values("context_name")
-            logger.info(f"[SUCCESS] Connected to search index: {doc_count} documents, {len(contexts)} contexts")
-        except Exception as e:
-            logger.error(f"[ERROR] Search service connection failed: {e}")
+        search_error = next((r for r in (doc_count, contexts) if isinstance(r, Exception)), None)
+        if search_error is None:
+            logger.info("[SUCCESS] Connected to search index: %s documents, %s contexts", doc_count, len(contexts))
+        else:
+            logger.error("[ERROR] Search service connection failed: %s", search_error)
         
         logger.info("[TARGET] MCP Server ready for connections")
         
         # Run the server
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="documentation-retrieval-mcp-server",
-                    server_version="1.0.0",
-                    capabilities=app.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
+        try:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="documentation-retrieval-mcp-server",
+                        server_version="1.0.0",
+                        capabilities=app.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={}
+                        )
                     )
                 )
-            )
+        finally:
+            # Async clients (e.g. the aio Azure Search client) must be closed on this loop
+            aclose = getattr(search_service, 'aclose', None)
+            if aclose is not None:
+                await aclose()
     
     except Exception as e:
-        logger.error(f"[ERROR] MCP Server failed to start: {e}")
+        logger.error("[ERROR] MCP Server failed to start: %s", e)
         raise
 
 
@@ -6,13 +6,41 @@ Tool definitions for the MCP server supporting both Azure Cognitive Search
 and ChromaDB backends.
 """
 
+from functools import lru_cache
+from typing import Callable, Dict
+
 import mcp.types as types
 from src.mcp_server.tools.azure_cognitive_search.azure_cognitive_search_tool_schemas import get_all_azure_cognitive_search_tools
 from src.mcp_server.tools.chroma_db.chroma_db_tool_schemas import get_all_chroma_db_tools
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 
 def get_all_tools() -> list[types.Tool]:
     tools = []
     tools.extend(get_all_chroma_db_tools())
     # tools.extend(get_all_azure_cognitive_search_tools())
-    return tools
\ No newline at end of file
+    return tools
+
+
+@lru_cache(maxsize=None)
+def get_argument_validators() -> Dict[str, Callable[[dict], dict]]:
+    """
+    Compile one argument validator per advertised tool from its input schema
+
+    Each validator raises ValueError (fastjsonschema.JsonSchemaException) for invalid
+    arguments and returns the arguments with schema defaults filled in. Tools that
+    declare no properties take no arguments and get no validator, so their calls skip
+    validation entirely. Returns an empty mapping when fastjsonschema is not installed.
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return {}
+    return {
+        tool.name: fastjsonschema.compile(tool.inputSchema)
+        for tool in get_all_tools()
+        if tool.inputSchema.get("properties")
+    }
@@ -11,13 +11,31 @@ This module contains:
 3. Legacy compatibility - for backward compatibility
 """
 
+from functools import lru_cache
+
 import mcp.types as types
 
 
+def _limit_schema(noun: str, default: int, maximum: int) -> dict:
+    """Schema for the bounded integer max_* limit arguments shared by the tools"""
+    return {
+        "type": "integer",
+        "description": f"Maximum number of {noun} to return (default: {default})",
+        "default": default,
+        "minimum": 1,
+        "maximum": maximum
+    }
+
+
+@lru_cache(maxsize=None)
 def get_universal_search_tools() -> list[types.Tool]:
-    """Get universal search tool definitions"""
+    """Get universal search tool definitions
+
+    The schemas are static, so the list is built once and shared; treat it as read-only.
+    The literals are trusted, so Tool.model_construct skips pydantic validation.
+    """
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="search_documents",
             description="Universal document search with multiple search types and comprehensive filtering",
             inputSchema={
@@ -29,8 +47,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                     },
                     "search_type": {
                         "type": "string",
-                        "enum": ["text", "vector", "semantic", "hybrid"],
-                        "description": "Type of search to perform (default: hybrid)",
+                        "description": "Type of search to perform: text, vector, semantic or hybrid (default: hybrid; other values run hybrid)",
                         "default": "hybrid"
                     },
                     "filters": {
@@ -75,13 +92,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                             }
                         }
                     },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 5)",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 50
-                    },
+                    "max_results": _limit_schema("results", 5, 50),
                     "include_content": {
                         "type": "boolean",
                         "description": "Include full content in results (default: true)",
@@ -91,7 +102,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                 "required": ["query"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="get_document_content",
             description="Retrieve full content of specific documents by their identifiers",
             inputSchema={
@@ -132,10 +143,11 @@ def get_universal_search_tools() -> list[types.Tool]:
     ]
 
 
+@lru_cache(maxsize=None)
 def get_context_discovery_tools() -> list[types.Tool]:
     """Get context and structure discovery tools"""
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="get_document_contexts",
             description="Get all available document contexts with statistics",
             inputSchema={
@@ -146,17 +158,11 @@ def get_context_discovery_tools() -> list[types.Tool]:
                         "description": "Include document counts per context (default: true)",
                         "default": True
                     },
-                    "max_contexts": {
-                        "type": "integer",
-                        "description": "Maximum number of contexts to return (default: 100)",
-                        "default": 100,
-                        "minimum": 1,
-                        "maximum": 1000
-                    }
+                    "max_contexts": _limit_schema("contexts", 100, 1000)
                 }
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="explore_document_structure",
             description="Explore document structure and navigate through contexts, files, and chunks",
             inputSchema={
@@ -176,13 +182,7 @@ def get_context_discovery_tools() -> list[types.Tool]:
                         "type": "string", 
                         "description": "Optional file name to filter exploration"
                     },
-                    "max_items": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (default: 50)",
-                        "default": 50,
-                        "minimum": 1,
-                        "maximum": 200
-                    }
+                    "max_items": _limit_schema("items", 50, 200)
                 },
                 "required": ["structure_type"]
             }
@@ -190,10 +190,11 @@ def get_context_discovery_tools() -> list[types.Tool]:
     ]
 
 
+@lru_cache(maxsize=None)
 def get_analytics_tools() -> list[types.Tool]:
     """Get document analytics and summary tools"""
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="get_index_summary",
             description="Get comprehensive index statistics and document distribution",
             inputSchema={
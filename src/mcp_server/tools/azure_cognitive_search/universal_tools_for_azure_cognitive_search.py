@@ -7,13 +7,70 @@ These replace the old work-item specific tools with universal capabilities.
 """
 
 import logging
+import re
+from datetime import datetime
 from typing import Dict, Any, Optional, List
 import mcp.types as types
 
-from src.common.vector_search_services.azure_cognitive_search import AzureCognitiveSearchFilterBuilder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger("work-items-mcp")
 
+# Static pieces of the formatted search response, built once
+_RESULT_SEPARATOR = "\n---\n"
+_KEY_METADATA_FIELDS = ('work_item_id', 'project', 'author', 'version', 'status')
+
+# Core identification block of each search result, filled via str.format_map
+_RESULT_HEADER_TEMPLATE = (
+    "## Result {i}\n"
+    "**Context:** {context_name}\n"
+    "**File:** {file_name}\n"
+    "**Title:** {title}\n"
+    "**Chunk:** {chunk_index}\n"
+)
+_RESULT_FIELD_DEFAULTS = {'context_name': 'Unknown', 'file_name': 'Unknown', 'title': 'No title'}
+
+
+class _SafeDict(dict):
+    """Result fields for str.format_map, with display defaults for missing keys"""
+
+    def __missing__(self, key):
+        return _RESULT_FIELD_DEFAULTS.get(key, 'N/A')
+
+
+def _loads_json(text: str) -> Any:
+    """Parse JSON from search results, using orjson when it is installed (raises ValueError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_LEADING_WHITESPACE = re.compile(r'\s*')
+_NON_WHITESPACE = re.compile(r'\S')
+
+
+def _truncate_stripped(content: str, limit: int, suffix: str = "...") -> str:
+    """
+    Equivalent to stripping ``content`` and truncating it to ``limit`` characters
+    (appending ``suffix`` when cut), but only copies the part that is kept
+    instead of the whole, possibly very large, document text
+    """
+    start = _LEADING_WHITESPACE.match(content).end()
+    if _NON_WHITESPACE.search(content, start + limit):
+        return f"{content[start:start + limit]}{suffix}"
+    return content[start:].rstrip()
+
+
+def _build_filter(filters: Dict[str, Any]) -> Optional[str]:
+    """Build an OData filter, importing the Azure SDK-backed builder only when needed"""
+    from src.common.vector_search_services.azure_cognitive_search import AzureCognitiveSearchFilterBuilder
+    return AzureCognitiveSearchFilterBuilder.build_filter(filters)
+
 
 async def handle_search_documents(search_service, arguments: dict) -> list[types.TextContent]:
     """Handle universal document search with comprehensive filtering"""
@@ -24,7 +81,7 @@ async def handle_search_documents(search_service, arguments: dict) -> list[types
         max_results = arguments.get("max_results", 5)
         include_content = arguments.get("include_content", True)
         
-        logger.info(f"[SEARCH] Universal search: query='{query}', type={search_type}, filters={filters}")
+        logger.info("[SEARCH] Universal search: query='%s', type=%s, filters=%s", query, search_type, filters)
         
         # Handle special chunk_pattern filter by mapping to chunk_index
         processed_filters = {}
@@ -35,15 +92,10 @@ async def handle_search_documents(search_service, arguments: dict) -> list[types
             else:
                 processed_filters[key] = value
         
-        # Execute search based on type - pass processed filters dict directly to search methods
-        if search_type == "text":
-            results = search_service.text_search(query, processed_filters, max_results)
-        elif search_type == "vector":
-            results = await search_service.vector_search(query, processed_filters, max_results)
-        elif search_type == "semantic":
-            results = search_service.semantic_search(query, processed_filters, max_results)
-        else:  # hybrid (default)
-            results = await search_service.hybrid_search(query, processed_filters, max_results)
+        # Execute search based on type (unknown types fall back to hybrid) - pass
+        # processed filters dict directly to search methods
+        run_search = _SEARCH_RUNNERS.get(search_type, _SEARCH_RUNNERS["hybrid"])
+        results = await run_search(search_service, query, processed_filters, max_results)
         
         # Format results
         if not results:
@@ -53,96 +105,90 @@ async def handle_search_documents(search_service, arguments: dict) -> list[types
                 text=f"[SEARCH] No documents found for query: '{query}'{filter_desc}"
             )]
         
-        formatted_results = []
+        parts = [
+            f"# Search Results\n\n**Query:** \"{query}\"\n**Search Type:** {search_type.upper()}\n**Results Found:** {len(results)}\n\n"
+        ]
         for i, result in enumerate(results[:max_results], 1):
-            result_text = f"## Result {i}\n"
+            if i > 1:
+                parts.append("\n")
             
             # Core document identification
-            result_text += f"**Context:** {result.get('context_name', 'Unknown')}\n"
-            result_text += f"**File:** {result.get('file_name', 'Unknown')}\n"
-            result_text += f"**Title:** {result.get('title', 'No title')}\n"
-            result_text += f"**Chunk:** {result.get('chunk_index', 'N/A')}\n"
+            parts.append(_RESULT_HEADER_TEMPLATE.format_map(_SafeDict(result, i=i)))
             
             # Additional valuable metadata for LLM
             file_type = result.get('file_type', '').lstrip('.')  # Remove leading dot if present
             if file_type:
-                result_text += f"**File Type:** {file_type.upper()}\n"
+                parts.append(f"**File Type:** {file_type.upper()}\n")
             
             file_path = result.get('file_path', '')
             if file_path:
-                result_text += f"**Path:** {file_path}\n"
+                parts.append(f"**Path:** {file_path}\n")
             
             category = result.get('category', '')
             if category:
-                result_text += f"**Category:** {category}\n"
+                parts.append(f"**Category:** {category}\n")
             
             tags = result.get('tags', '')
             if tags:
                 # Tags are stored as comma-separated string, format them nicely
                 tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
                 if tag_list:
-                    result_text += f"**Tags:** {', '.join(tag_list)}\n"
+                    parts.append(f"**Tags:** {', '.join(tag_list)}\n")
             
             last_modified = result.get('last_modified', '')
             if last_modified:
                 # Format the timestamp more readably
                 try:
-                    from datetime import datetime
                     if isinstance(last_modified, str):
                         # Parse ISO format timestamp
                         dt = datetime.fromisoformat(last_modified.replace('Z', '+00:00'))
                         formatted_date = dt.strftime('%Y-%m-%d %H:%M UTC')
-                        result_text += f"**Last Modified:** {formatted_date}\n"
+                        parts.append(f"**Last Modified:** {formatted_date}\n")
                     else:
-                        result_text += f"**Last Modified:** {last_modified}\n"
+                        parts.append(f"**Last Modified:** {last_modified}\n")
                 except (ValueError, ImportError):
-                    result_text += f"**Last Modified:** {last_modified}\n"
+                    parts.append(f"**Last Modified:** {last_modified}\n")
             
             # Document ID for reference (useful for debugging/tracking)
             doc_id = result.get('id', '')
             if doc_id:
-                result_text += f"**Document ID:** {doc_id}\n"
+                parts.append(f"**Document ID:** {doc_id}\n")
             
             # Additional metadata if available
             metadata_json = result.get('metadata_json', '')
             if metadata_json:
                 try:
-                    import json
-                    metadata = json.loads(metadata_json)
+                    metadata = _loads_json(metadata_json)
                     if metadata:
-                        result_text += f"**Additional Metadata:** {len(metadata)} fields available\n"
+                        parts.append(f"**Additional Metadata:** {len(metadata)} fields available\n")
                         # Show a few key metadata fields if they exist
-                        interesting_keys = ['work_item_id', 'project', 'author', 'version', 'status']
                         shown_metadata = []
-                        for key in interesting_keys:
+                        for key in _KEY_METADATA_FIELDS:
                             if key in metadata and metadata[key]:
                                 shown_metadata.append(f"{key}: {metadata[key]}")
                         if shown_metadata:
-                            result_text += f"**Key Metadata:** {', '.join(shown_metadata)}\n"
-                except (json.JSONDecodeError, ImportError):
+                            parts.append(f"**Key Metadata:** {', '.join(shown_metadata)}\n")
+                except ValueError:
                     pass
             
             if include_content and 'content' in result:
-                content = result['content'].strip()
-                if len(content) > 400:
-                    content = content[:400] + "..."
-                result_text += f"\n**Content:**\n```\n{content}\n```\n"
+                content = _truncate_stripped(result['content'], 400)
+                parts.append(f"\n**Content:**\n```\n{content}\n```\n")
             
             # Relevance score (keeping this at the end as it's technical)
             score = result.get('@search.score', 'N/A')
             if isinstance(score, (int, float)):
-                result_text += f"**Relevance Score:** {score:.4f}\n"
+                parts.append(f"**Relevance Score:** {score:.4f}\n")
             else:
-                result_text += f"**Relevance Score:** {score}\n"
-            result_text += "\n---\n"
-            formatted_results.append(result_text)
+                parts.append(f"**Relevance Score:** {score}\n")
+            parts.append(_RESULT_SEPARATOR)
         
-        response = f"# Search Results\n\n**Query:** \"{query}\"\n**Search Type:** {search_type.upper()}\n**Results Found:** {len(results)}\n\n" + "\n".join(formatted_results)
+        response = "".join(parts)
         
         return [types.TextContent(type="text", text=response)]
         
     except Exception as e:
-        logger.error(f"Error in search_documents: {e}")
+        logger.error("Error in search_documents: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Search failed: {str(e)}"
@@ -155,7 +201,7 @@ async def handle_get_document_contexts(search_service, arguments: dict) -> list[
         include_stats = arguments.get("include_stats", True)
         max_contexts = arguments.get("max_contexts", 100)
         
-        logger.info(f"[CONTEXTS] Getting contexts: stats={include_stats}")
+        logger.info("[CONTEXTS] Getting contexts: stats=%s", include_stats)
         
         # Use Azure Search facets to get context distribution
         facets = [f"context_name,count:{max_contexts}"]
@@ -193,7 +239,7 @@ async def handle_get_document_contexts(search_service, arguments: dict) -> list[
         return [types.TextContent(type="text", text=response)]
         
     except Exception as e:
-        logger.error(f"Error in get_document_contexts: {e}")
+        logger.error("Error in get_document_contexts: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Context discovery failed: {str(e)}"
@@ -208,24 +254,19 @@ async def handle_explore_document_structure(search_service, arguments: dict) ->
         file_name = arguments.get("file_name") 
         max_items = arguments.get("max_items", 50)
         
-        logger.info(f"[STRUCTURE] Exploring: type={structure_type}, context={context_name}")
-        
-        if structure_type == "contexts":
-            return await _explore_contexts(search_service, arguments)
-        elif structure_type == "files":
-            return await _explore_files(search_service, arguments)
-        elif structure_type == "chunks":
-            return await _explore_chunks(search_service, arguments)
-        elif structure_type == "categories":
-            return await _explore_categories(search_service, arguments)
-        else:
+        logger.info("[STRUCTURE] Exploring: type=%s, context=%s", structure_type, context_name)
+        
+        explorer = _STRUCTURE_EXPLORERS.get(structure_type)
+        if explorer is None:
             return [types.TextContent(
                 type="text",
                 text=f"[ERROR] Unknown structure type: {structure_type}"
             )]
+        
+        return await explorer(search_service, arguments)
             
     except Exception as e:
-        logger.error(f"Error in explore_document_structure: {e}")
+        logger.error("Error in explore_document_structure: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Structure exploration failed: {str(e)}"
@@ -238,7 +279,7 @@ async def handle_get_index_summary(search_service, arguments: dict) -> list[type
         include_facets = arguments.get("include_facets", True)
         facet_limit = arguments.get("facet_limit", 50)
         
-        logger.info(f"[SUMMARY] Getting index summary: facets={include_facets}")
+        logger.info("[SUMMARY] Getting index summary: facets=%s", include_facets)
         
         # Prepare facets for detailed statistics
         facets = []
@@ -303,7 +344,7 @@ async def handle_get_index_summary(search_service, arguments: dict) -> list[type
         return [types.TextContent(type="text", text=response)]
         
     except Exception as e:
-        logger.error(f"Error in get_index_summary: {e}")
+        logger.error("Error in get_index_summary: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Index summary failed: {str(e)}"
@@ -330,9 +371,8 @@ async def _explore_files(search_service, arguments: dict) -> list[types.TextCont
     # Use search client directly with facets for file exploration
     results = search_service.search_client.search(
         search_text="*",
-        filter=AzureCognitiveSearchFilterBuilder.build_filter(filters) if filters else None,
+        filter=_build_filter(filters) if filters else None,
         facets=["file_name,count:1000"],
-        select="file_name,file_type,file_path,category,tags,last_modified",
         top=0
     )
     
@@ -351,7 +391,7 @@ async def _explore_files(search_service, arguments: dict) -> list[types.TextCont
         
         file_results = search_service.search_client.search(
             search_text="*",
-            filter=AzureCognitiveSearchFilterBuilder.build_filter(file_query_filters),
+            filter=_build_filter(file_query_filters),
             select="file_name,file_type,file_path,category,tags,last_modified",
             top=1
         )
@@ -399,7 +439,6 @@ async def _explore_files(search_service, arguments: dict) -> list[types.TextCont
         last_modified = metadata.get('last_modified', '')
         if last_modified:
             try:
-                from datetime import datetime
                 if isinstance(last_modified, str):
                     dt = datetime.fromisoformat(last_modified.replace('Z', '+00:00'))
                     response += f"   - *Modified: {dt.strftime('%Y-%m-%d %H:%M:%S UTC')}*\n"
@@ -431,7 +470,7 @@ async def _explore_chunks(search_service, arguments: dict) -> list[types.TextCon
     # Use Azure Search with proper sorting and additional metadata fields
     results = search_service.search_client.search(
         search_text="*",
-        filter=AzureCognitiveSearchFilterBuilder.build_filter(filters) if filters else None,
+        filter=_build_filter(filters) if filters else None,
         select="id,file_name,file_path,file_type,chunk_index,context_name,title,content,category,tags,last_modified,metadata_json",
         top=max_items
     )
@@ -474,7 +513,6 @@ async def _explore_chunks(search_service, arguments: dict) -> list[types.TextCon
         last_modified = chunk.get('last_modified', '')
         if last_modified:
             try:
-                from datetime import datetime
                 if isinstance(last_modified, str):
                     # Parse ISO format datetime
                     dt = datetime.fromisoformat(last_modified.replace('Z', '+00:00'))
@@ -488,8 +526,7 @@ async def _explore_chunks(search_service, arguments: dict) -> list[types.TextCon
         metadata_json = chunk.get('metadata_json', '')
         if metadata_json and metadata_json.strip():
             try:
-                import json
-                metadata = json.loads(metadata_json)
+                metadata = _loads_json(metadata_json)
                 if isinstance(metadata, dict) and metadata:
                     key_fields = ['author', 'subject', 'keywords', 'description', 'created_date', 'word_count', 'page_count']
                     metadata_info = []
@@ -501,9 +538,7 @@ async def _explore_chunks(search_service, arguments: dict) -> list[types.TextCon
             except:
                 pass
         
-        content = chunk.get('content', '').strip()
-        if len(content) > 150:
-            content = content[:150] + "..."
+        content = _truncate_stripped(chunk.get('content', ''), 150)
         response += f"**Preview:**\n```\n{content}\n```\n\n"
         
         if i >= max_items:
@@ -524,7 +559,7 @@ async def _explore_categories(search_service, arguments: dict) -> list[types.Tex
     # Use search client with facets for category exploration
     results = search_service.search_client.search(
         search_text="*",
-        filter=AzureCognitiveSearchFilterBuilder.build_filter(filters) if filters else None,
+        filter=_build_filter(filters) if filters else None,
         facets=["category,count:1000"],
         top=0
     )
@@ -555,7 +590,7 @@ async def handle_get_document_content(search_service, arguments: dict) -> list[t
         max_content_length = arguments.get("max_content_length")
         include_metadata = arguments.get("include_metadata", True)
         
-        logger.info(f"[CONTENT] Getting document content: ids={document_ids}, context_file={context_and_file}")
+        logger.info("[CONTENT] Getting document content: ids=%s, context_file=%s", document_ids, context_and_file)
         
         # Ensure we have at least one identifier
         if not any([document_ids, context_and_file]):
@@ -574,7 +609,7 @@ async def handle_get_document_content(search_service, arguments: dict) -> list[t
                     result = search_service.search_client.get_document(key=doc_id)
                     results.append(result)
                 except Exception as e:
-                    logger.warning(f"Could not retrieve document ID {doc_id}: {e}")
+                    logger.warning("Could not retrieve document ID %s: %s", doc_id, e)
         
         # Handle context and file combination
         if context_and_file:
@@ -638,11 +673,15 @@ async def handle_get_document_content(search_service, arguments: dict) -> list[t
                 result_text += "\n"
             
             # Full content (with optional length limit)
-            content = result.get('content', '').strip()
+            content = result.get('content', '')
+            if max_content_length:
+                content = _truncate_stripped(
+                    content, max_content_length,
+                    f"... [content truncated at {max_content_length} characters]"
+                )
+            else:
+                content = content.strip()
             if content:
-                if max_content_length and len(content) > max_content_length:
-                    content = content[:max_content_length] + f"... [content truncated at {max_content_length} characters]"
-                
                 result_text += f"**Full Content:**\n```\n{content}\n```\n"
             else:
                 result_text += "**Full Content:** *No content available*\n"
@@ -655,8 +694,26 @@ async def handle_get_document_content(search_service, arguments: dict) -> list[t
         return [types.TextContent(type="text", text=response)]
         
     except Exception as e:
-        logger.error(f"Error in get_document_content: {e}")
+        logger.error("Error in get_document_content: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Content retrieval failed: {str(e)}"
         )]
+
+
+# Search type -> awaitable search call, each called as (search_service, query, filters, top).
+# text/semantic searches are synchronous, so they run off the event loop
+_SEARCH_RUNNERS = {
+    "text": lambda service, query, filters, top: service.text_search_async(query, filters, top),
+    "vector": lambda service, query, filters, top: service.vector_search(query, filters, top),
+    "semantic": lambda service, query, filters, top: service.semantic_search_async(query, filters, top),
+    "hybrid": lambda service, query, filters, top: service.hybrid_search(query, filters, top),
+}
+
+# Structure type -> explorer, each called as (search_service, arguments)
+_STRUCTURE_EXPLORERS = {
+    "contexts": _explore_contexts,
+    "files": _explore_files,
+    "chunks": _explore_chunks,
+    "categories": _explore_categories,
+}
@@ -12,13 +12,29 @@ This module contains:
 3. Metadata filtering - using ChromaDB's native filtering
 """
 
+from functools import lru_cache
+
 import mcp.types as types
 
 
+def _limit_schema(description: str, default: int) -> dict:
+    """Schema for the integer max_* limit arguments shared by the tools"""
+    return {
+        "type": "integer",
+        "default": default,
+        "description": description
+    }
+
+
+@lru_cache(maxsize=None)
 def get_universal_search_tools() -> list[types.Tool]:
-    """Get universal search tool definitions for ChromaDB backend"""
+    """Get universal search tool definitions for ChromaDB backend
+
+    The schemas are static, so the list is built once and shared; treat it as read-only.
+    The literals are trusted, so Tool.model_construct skips pydantic validation.
+    """
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="chromadb_search_documents",
             description="Search documents using ChromaDB vector search with comprehensive filtering options",
             inputSchema={
@@ -30,9 +46,8 @@ def get_universal_search_tools() -> list[types.Tool]:
                     },
                     "search_type": {
                         "type": "string",
-                        "enum": ["vector"],
                         "default": "vector",
-                        "description": "Search type (all route to vector search in ChromaDB)"
+                        "description": "Search type (any value is accepted; all route to vector search in ChromaDB)"
                     },
                     "filters": {
                         "type": "object",
@@ -76,11 +91,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                             }
                         }
                     },
-                    "max_results": {
-                        "type": "integer",
-                        "default": 5,
-                        "description": "Maximum number of results to return"
-                    },
+                    "max_results": _limit_schema("Maximum number of results to return", 5),
                     "include_content": {
                         "type": "boolean",
                         "default": True,
@@ -90,7 +101,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                 "required": ["query"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="chromadb_get_document_content",
             description="Get full content of specific documents by ID or context/file",
             inputSchema={
@@ -123,7 +134,7 @@ def get_universal_search_tools() -> list[types.Tool]:
                 }
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="chromadb_explore_document_structure",
             description="Explore document structure - contexts, files, chunks, or categories",
             inputSchema={
@@ -143,16 +154,12 @@ def get_universal_search_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Filter by specific file"
                     },
-                    "max_items": {
-                        "type": "integer",
-                        "default": 50,
-                        "description": "Maximum items to return"
-                    }
+                    "max_items": _limit_schema("Maximum items to return", 50)
                 },
                 "required": ["structure_type"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="chromadb_get_document_contexts",
             description="Get all available document contexts with statistics",
             inputSchema={
@@ -163,15 +170,11 @@ def get_universal_search_tools() -> list[types.Tool]:
                         "default": True,
                         "description": "Include document counts per context"
                     },
-                    "max_contexts": {
-                        "type": "integer",
-                        "default": 100,
-                        "description": "Maximum contexts to return"
-                    }
+                    "max_contexts": _limit_schema("Maximum contexts to return", 100)
                 }
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="chromadb_get_index_summary",
             description="Get comprehensive ChromaDB collection statistics and document distribution",
             inputSchema={
@@ -13,16 +13,53 @@ Key differences from Azure version:
 - Tags stored as comma-separated strings
 """
 
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 import mcp.types as types
 
-from src.common.vector_search_services.chromadb_service import ChromaDBService, ChromaDBFilterBuilder
+from src.mcp_server.tools.search_result_cache import SearchResultCache
+
+if TYPE_CHECKING:
+    # Only needed for annotations; avoids importing chromadb when the module loads
+    from src.common.vector_search_services.chromadb_service import ChromaDBService
 
 logger = logging.getLogger("chroma-db-mcp")
 
+# Formatted search responses, reused for repeated or near-identical queries
+_search_result_cache = SearchResultCache()
+
+# Define minimum relevance threshold to filter out irrelevant results
+# CUrrently chosen based on observation of scores
+MIN_RELEVANCE_THRESHOLD = 0.01
+
+# Static pieces of the formatted responses, built once
+_RESULT_SEPARATOR = "\n---\n"
+_NO_RESULTS_TEXT = "[SEARCH] No results found."
+_LOW_RELEVANCE_HINT = (f"but all had low relevance scores (< {MIN_RELEVANCE_THRESHOLD:.1f}). "
+                       "Try refining your search query for better matches.")
+
+# Core identification block of each search result, filled via str.format_map
+_RESULT_HEADER_TEMPLATE = (
+    "## Result {i}\n"
+    "**Context:** {context_name}\n"
+    "**File:** {file_name}\n"
+    "**Title:** {title}\n"
+    "**Chunk:** {chunk_index}\n"
+    "**Relevance:** {score:.3f}\n"
+)
+_RESULT_FIELD_DEFAULTS = {'context_name': 'Unknown', 'file_name': 'Unknown', 'title': 'No title'}
+
+
+class _SafeDict(dict):
+    """Result fields for str.format_map, with display defaults for missing keys"""
 
-async def handle_search_documents(search_service: ChromaDBService, arguments: dict) -> list[types.TextContent]:
+    def __missing__(self, key):
+        return _RESULT_FIELD_DEFAULTS.get(key, 'N/A')
+
+
+async def handle_search_documents(search_service: 'ChromaDBService', arguments: dict) -> list[types.TextContent]:
     """Handle universal document search with ChromaDB vector search"""
     try:
         query = arguments.get("query", "")
@@ -31,11 +68,33 @@ async def handle_search_documents(search_service: ChromaDBService, arguments: di
         max_results = arguments.get("max_results", 5)
         include_content = arguments.get("include_content", True)
         
-        logger.info(f"[SEARCH] ChromaDB search: query='{query}', type={search_type}, filters={filters}")
+        logger.info("[SEARCH] ChromaDB search: query='%s', type=%s, filters=%s", query, search_type, filters)
             
+        # Serve repeated or semantically equivalent queries from the result cache
+        scope = SearchResultCache.make_scope(filters, max_results=max_results, include_content=include_content)
+        cache_key = SearchResultCache.make_key(query, scope)
+        cached = _search_result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[SEARCH] Returning cached results")
+            return cached
+
+        query_embedding = await search_service.embed_query(query)
+        if query_embedding is None:
+            logger.error("[ERROR] Failed to generate query embedding")
+            return [types.TextContent(
+                type="text",
+                text=f"[ERROR] Search failed: could not generate an embedding for query: '{query}'"
+            )]
+        cached = _search_result_cache.get_similar(scope, query_embedding)
+        if cached is not None:
+            logger.info("[SEARCH] Returning cached results for a similar query")
+            return cached
+
         # ALL search types route to vector search in ChromaDB (no text/hybrid/semantic search)
-        logger.info(f"[SEARCH] Using vector search (ChromaDB backend)")
-        results = await search_service.vector_search(query, filters, max_results)
+        logger.info("[SEARCH] Using vector search (ChromaDB backend)")
+        # Skip reading document text from the collection when it won't be shown
+        results = await search_service.vector_search(query, filters, max_results, include_content=include_content,
+                                                    query_vector=query_embedding)
         
         # Format results
         if not results:
@@ -45,17 +104,19 @@ async def handle_search_documents(search_service: ChromaDBService, arguments: di
                 text=f"[SEARCH] No documents found for query: '{query}'{filter_desc}"
             )]
         
-        return _format_search_results(results, include_content, max_results)
+        response = _format_search_results(results, include_content, max_results)
+        _search_result_cache.put(cache_key, scope, response, query_embedding)
+        return response
         
     except Exception as e:
-        logger.error(f"[ERROR] ChromaDB search failed: {e}")
+        logger.error("[ERROR] ChromaDB search failed: %s", e)
         return [types.TextContent(
             type="text",
             text=f"[ERROR] Search failed: {str(e)}"
         )]
 
 
-async def handle_get_document_content(search_service: ChromaDBService, arguments: dict) -> list[types.TextContent]:
+async def handle_get_document_content(search_service: 'ChromaDBService', arguments: dict) -> list[types.TextContent]:
     """Handle document content retrieval with ChromaDB filtering"""
     try:
         context_and_file = arguments.get("context_and_file")
@@ -75,7 +136,7 @@ async def handle_get_document_content(search_service: ChromaDBService, arguments
             if file_name:
                 filters["file_name"] = file_name
 
-            logger.info(f"[CONTENT] Getting documents by context/file: {filters}")
+            logger.info("[CONTENT] Getting documents by context/file: %s", filters)
 
             # Use filter-based document retrieval instead of vector search for content fetching
             results = await search_service.get_documents_by_filter_async(filters, 50)  # Get more results for content
@@ -85,7 +146,7 @@ async def handle_get_document_content(search_service: ChromaDBService, arguments
             if isinstance(document_ids, str):
                 document_ids = [document_ids]
 
-            logger.info(f"[CONTENT] Getting documents by IDs: {document_ids}")
+            logger.info("[CONTENT] Getting documents by IDs: %s", document_ids)
 
             # Use proper service method for document ID retrieval
             results = await search_service.get_documents_by_ids_async(document_ids)
@@ -105,11 +166,11 @@ async def handle_get_document_content(search_service: ChromaDBService, arguments
         return _format_content_results(results, include_metadata, max_content_length)
 
     except Exception as e:
-        logger.error(f"[ERROR] Content retrieval failed: {e}")
+        logger.error("[ERROR] Content retrieval failed: %s", e)
         return [types.TextContent(type="text", text=f"[ERROR] Content retrieval failed: {e}")]
 
 
-async def handle_explore_document_structure(search_service: ChromaDBService, arguments: dict) -> list[types.TextContent]:
+async def handle_explore_document_structure(search_service: 'ChromaDBService', arguments: dict) -> list[types.TextContent]:
     """Handle document structure exploration using ChromaDB sampling"""
     try:
         structure_type = arguments.get("structure_type", "contexts")
@@ -117,41 +178,43 @@ async def handle_explore_document_structure(search_service: ChromaDBService, arg
         file_name = arguments.get("file_name")
         max_items = arguments.get("max_items", 50)
 
-        logger.info(f"[EXPLORE] Structure type: {structure_type}, context: {context_name}, file: {file_name}")
+        logger.info("[EXPLORE] Structure type: %s, context: %s, file: %s", structure_type, context_name, file_name)
 
-        if structure_type == "contexts":
-            return await _explore_contexts(search_service, max_items)
-        elif structure_type == "files":
-            return await _explore_files(search_service, context_name, max_items)
-        elif structure_type == "chunks":
-            return await _explore_chunks(search_service, context_name, file_name, max_items)
-        elif structure_type == "categories":
-            return await _explore_categories(search_service, context_name, max_items)
-        else:
+        explorer = _STRUCTURE_EXPLORERS.get(structure_type)
+        if explorer is None:
             return [types.TextContent(
                 type="text",
                 text=f"[ERROR] Unknown structure type: {structure_type}"
             )]
 
+        return await explorer(search_service, context_name, file_name, max_items)
+
     except Exception as e:
-        logger.error(f"[ERROR] Structure exploration failed: {e}")
+        logger.error("[ERROR] Structure exploration failed: %s", e)
         return [types.TextContent(type="text", text=f"[ERROR] Structure exploration failed: {e}")]
 
 
-async def handle_get_document_contexts(search_service: ChromaDBService, arguments: dict) -> list[types.TextContent]:
+async def handle_get_document_contexts(search_service: 'ChromaDBService', arguments: dict) -> list[types.TextContent]:
     """Handle document context discovery with statistics"""
     try:
         include_stats = arguments.get("include_stats", True)
         max_contexts = arguments.get("max_contexts", 100)
 
-        logger.info(f"[CONTEXTS] Getting contexts, include_stats={include_stats}, max={max_contexts}")
-
-        # Use sampling approach since ChromaDB doesn't have native faceting
-        context_results = await _explore_contexts(search_service, max_contexts)
+        logger.info("[CONTEXTS] Getting contexts, include_stats=%s, max=%s", include_stats, max_contexts)
 
         if include_stats:
+            # Fetch collection statistics in a worker thread while the contexts are explored
+            stats, context_results = await asyncio.gather(
+                asyncio.to_thread(search_service.get_collection_stats),
+                _explore_contexts(search_service, max_contexts)
+            )
+        else:
+            stats = None
+            # Use sampling approach since ChromaDB doesn't have native faceting
+            context_results = await _explore_contexts(search_service, max_contexts)
+
+        if stats is not None:
             # Add collection statistics
-            stats = search_service.get_collection_stats()
             stats_text = f"\n## Collection Statistics\n"
             stats_text += f"**Total Documents:** {stats.get('document_count', 0)}\n"
             stats_text += f"**Collection Name:** {stats.get('collection_name', 'unknown')}\n"
@@ -168,20 +231,20 @@ async def handle_get_document_contexts(search_service: ChromaDBService, argument
         return context_results
 
     except Exception as e:
-        logger.error(f"[ERROR] Context discovery failed: {e}")
+        logger.error("[ERROR] Context discovery failed: %s", e)
         return [types.TextContent(
             type="text", 
             text=f"[ERROR] Context discovery failed: {str(e)}"
         )]
 
 
-async def handle_get_index_summary(search_service: ChromaDBService, arguments: dict) -> list[types.TextContent]:
+async def handle_get_index_summary(search_service: 'ChromaDBService', arguments: dict) -> list[types.TextContent]:
     """Handle ChromaDB collection summary with basic statistics"""
     try:
-        logger.info(f"[SUMMARY] Getting collection summary")
+        logger.info("[SUMMARY] Getting collection summary")
 
-        # Get basic collection statistics
-        stats = search_service.get_collection_stats()
+        # Get basic collection statistics (synchronous, so run off the event loop)
+        stats = await asyncio.to_thread(search_service.get_collection_stats)
 
         summary_text = "## ChromaDB Collection Summary\n\n"
         summary_text += f"**Collection Name:** {stats.get('collection_name')}\n"
@@ -192,7 +255,7 @@ async def handle_get_index_summary(search_service: ChromaDBService, arguments: d
         return [types.TextContent(type="text", text=summary_text)]
 
     except Exception as e:
-        logger.error(f"[ERROR] Index summary failed: {e}")
+        logger.error("[ERROR] Index summary failed: %s", e)
         return [types.TextContent(type="text", text=f"[ERROR] Index summary failed: {e}")]
 
 def _format_search_results(results: list, include_content: bool, max_results: int) -> list[types.TextContent]:
@@ -202,10 +265,6 @@ def _format_search_results(results: list, include_content: bool, max_results: in
     relevant documents are shown. Score 0.1 corresponds to ChromaDB distance ~0.9,
     which represents the minimum useful semantic similarity threshold.
     """
-    # Define minimum relevance threshold to filter out irrelevant results
-    # CUrrently chosen based on observation of scores
-    MIN_RELEVANCE_THRESHOLD = 0.01
-    
     # Filter results by relevance score first
     relevant_results = []
     filtered_count = 0
@@ -222,10 +281,10 @@ def _format_search_results(results: list, include_content: bool, max_results: in
         if filtered_count > 0:
             return [types.TextContent(
                 type="text", 
-                text=f"[SEARCH] Found {filtered_count} results, but all had low relevance scores (< {MIN_RELEVANCE_THRESHOLD:.1f}). Try refining your search query for better matches."
+                text=f"[SEARCH] Found {filtered_count} results, {_LOW_RELEVANCE_HINT}"
             )]
         else:
-            return [types.TextContent(type="text", text="[SEARCH] No results found.")]
+            return [types.TextContent(type="text", text=_NO_RESULTS_TEXT)]
     
     formatted_results = []
     
@@ -235,35 +294,26 @@ def _format_search_results(results: list, include_content: bool, max_results: in
         formatted_results.append(types.TextContent(type="text", text=info_text))
 
     for i, result in enumerate(relevant_results[:max_results], 1):
-        result_text = f"## Result {i}\n"
-
-        # Core document identification
-        result_text += f"**Context:** {result.get('context_name', 'Unknown')}\n"
-        result_text += f"**File:** {result.get('file_name', 'Unknown')}\n"
-        result_text += f"**Title:** {result.get('title', 'No title')}\n"
-        result_text += f"**Chunk:** {result.get('chunk_index', 'N/A')}\n"
-
-        # Search relevance score
-        score = result.get('@search.score', 0)
-        result_text += f"**Relevance:** {score:.3f}\n"
+        # Core document identification and search relevance score
+        parts = [_RESULT_HEADER_TEMPLATE.format_map(_SafeDict(result, i=i, score=result.get('@search.score', 0)))]
 
         # Additional metadata
         if result.get('category'):
-            result_text += f"**Category:** {result.get('category')}\n"
+            parts.append(f"**Category:** {result['category']}\n")
         if result.get('file_type'):
-            result_text += f"**File Type:** {result.get('file_type')}\n"
+            parts.append(f"**File Type:** {result['file_type']}\n")
         if result.get('tags'):
-            result_text += f"**Tags:** {result.get('tags')}\n"
+            parts.append(f"**Tags:** {result['tags']}\n")
 
         # Include content if requested
-        if include_content and result.get('content'):
-            content = result['content']
-            if len(content) > 400:
-                content = content[:400] + "...[truncated]"
-            result_text += f"\n**Content:**\n{content}\n"
+        content = result.get('content') if include_content else None
+        if content:
+            # content[400:401] tests for overflow without measuring the full string
+            preview = f"{content[:400]}...[truncated]" if content[400:401] else content
+            parts.append(f"\n**Content:**\n{preview}\n")
 
-        result_text += "\n---\n"
-        formatted_results.append(types.TextContent(type="text", text=result_text))
+        parts.append(_RESULT_SEPARATOR)
+        formatted_results.append(types.TextContent(type="text", text="".join(parts)))
 
     return formatted_results
 
@@ -273,38 +323,39 @@ def _format_content_results(results: list, include_metadata: bool, max_content_l
     formatted_results = []
 
     for i, result in enumerate(results, 1):
-        content_text = f"## Document {i}\n"
-
-        # Document identification
-        content_text += f"**ID:** {result.get('id', 'Unknown')}\n"
-        content_text += f"**File:** {result.get('file_name', 'Unknown')}\n"
-        content_text += f"**Context:** {result.get('context_name', 'Unknown')}\n"
+        parts = [
+            f"## Document {i}\n",
+            # Document identification
+            f"**ID:** {result.get('id', 'Unknown')}\n",
+            f"**File:** {result.get('file_name', 'Unknown')}\n",
+            f"**Context:** {result.get('context_name', 'Unknown')}\n",
+        ]
 
         # Metadata if requested
         if include_metadata:
             if result.get('title'):
-                content_text += f"**Title:** {result.get('title')}\n"
+                parts.append(f"**Title:** {result['title']}\n")
             if result.get('category'):
-                content_text += f"**Category:** {result.get('category')}\n"
+                parts.append(f"**Category:** {result['category']}\n")
             if result.get('file_type'):
-                content_text += f"**File Type:** {result.get('file_type')}\n"
+                parts.append(f"**File Type:** {result['file_type']}\n")
             if result.get('last_modified'):
-                content_text += f"**Modified:** {result.get('last_modified')}\n"
+                parts.append(f"**Modified:** {result['last_modified']}\n")
 
         # Content with optional length limit
         content = result.get('content', '')
         if max_content_length and len(content) > max_content_length:
             content = content[:max_content_length] + "...[truncated]"
 
-        content_text += f"\n**Content:**\n{content}\n"
-        content_text += "\n---\n"
+        parts.append(f"\n**Content:**\n{content}\n")
+        parts.append(_RESULT_SEPARATOR)
 
-        formatted_results.append(types.TextContent(type="text", text=content_text))
+        formatted_results.append(types.TextContent(type="text", text="".join(parts)))
 
     return formatted_results
 
 
-async def _explore_contexts(search_service: ChromaDBService, max_items: int) -> list[types.TextContent]:
+async def _explore_contexts(search_service: 'ChromaDBService', max_items: int) -> list[types.TextContent]:
     """Explore available contexts in ChromaDB using filter-based document retrieval"""
     try:
         # Get sample of documents without vector search - much more efficient and reliable
@@ -324,9 +375,10 @@ async def _explore_contexts(search_service: ChromaDBService, max_items: int) ->
             )]
 
         # Format context results
-        context_text = "## Available Contexts\n\n"
-        for context, count in sorted(contexts.items())[:max_items]:
-            context_text += f"**{context}:** {count} documents\n"
+        context_text = "## Available Contexts\n\n" + "".join(
+            f"**{context}:** {count} documents\n"
+            for context, count in heapq.nsmallest(max_items, contexts.items())
+        )
 
         return [types.TextContent(type="text", text=context_text)]
 
@@ -334,7 +386,7 @@ async def _explore_contexts(search_service: ChromaDBService, max_items: int) ->
         return [types.TextContent(type="text", text=f"[ERROR] Context exploration failed: {e}")]
 
 
-async def _explore_files(search_service: ChromaDBService, context_name: str, max_items: int) -> list[types.TextContent]:
+async def _explore_files(search_service: 'ChromaDBService', context_name: str, max_items: int) -> list[types.TextContent]:
     """Explore files in a context using filter-based document retrieval"""
     try:
         # Build filter for context
@@ -366,10 +418,10 @@ async def _explore_files(search_service: ChromaDBService, context_name: str, max
             )]
 
         # Format file results
-        files_text = f"## Files{' in ' + context_name if context_name else ''}\n\n"
-        for file_name, info in sorted(files.items())[:max_items]:
-            files_text += f"**{file_name}** ({info['file_type']}): {info['count']} chunks\n"
-            files_text += f"  Title: {info['title']}\n\n"
+        files_text = f"## Files{' in ' + context_name if context_name else ''}\n\n" + "".join(
+            f"**{file_name}** ({info['file_type']}): {info['count']} chunks\n  Title: {info['title']}\n\n"
+            for file_name, info in heapq.nsmallest(max_items, files.items(), key=lambda item: item[0])
+        )
 
         return [types.TextContent(type="text", text=files_text)]
 
@@ -377,7 +429,7 @@ async def _explore_files(search_service: ChromaDBService, context_name: str, max
         return [types.TextContent(type="text", text=f"[ERROR] File exploration failed: {e}")]
 
 
-async def _explore_chunks(search_service: ChromaDBService, context_name: str, file_name: str, max_items: int) -> list[types.TextContent]:
+async def _explore_chunks(search_service: 'ChromaDBService', context_name: str, file_name: str, max_items: int) -> list[types.TextContent]:
     """Explore chunks for a specific file using filter-based document retrieval"""
     try:
         # Build filters
@@ -405,7 +457,7 @@ async def _explore_chunks(search_service: ChromaDBService, context_name: str, fi
 
             # Show content preview
             content = result.get('content', '')
-            preview = content[:200] + "..." if len(content) > 200 else content
+            preview = f"{content[:200]}..." if content[200:201] else content
             chunks_text += f"  Preview: {preview}\n\n"
 
         return [types.TextContent(type="text", text=chunks_text)]
@@ -414,7 +466,7 @@ async def _explore_chunks(search_service: ChromaDBService, context_name: str, fi
         return [types.TextContent(type="text", text=f"[ERROR] Chunk exploration failed: {e}")]
 
 
-async def _explore_categories(search_service: ChromaDBService, context_name: str, max_items: int) -> list[types.TextContent]:
+async def _explore_categories(search_service: 'ChromaDBService', context_name: str, max_items: int) -> list[types.TextContent]:
     """Explore categories using filter-based document retrieval"""
     try:
         # Build filter for context if specified
@@ -440,11 +492,21 @@ async def _explore_categories(search_service: ChromaDBService, context_name: str
             )]
 
         # Format category results
-        categories_text = f"## Categories{' in ' + context_name if context_name else ''}\n\n"
-        for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True)[:max_items]:
-            categories_text += f"**{category}:** {count} documents\n"
+        categories_text = f"## Categories{' in ' + context_name if context_name else ''}\n\n" + "".join(
+            f"**{category}:** {count} documents\n"
+            for category, count in heapq.nlargest(max_items, categories.items(), key=lambda x: x[1])
+        )
 
         return [types.TextContent(type="text", text=categories_text)]
 
     except Exception as e:
         return [types.TextContent(type="text", text=f"[ERROR] Category exploration failed: {e}")]
+
+
+# Structure type -> explorer, each called as (search_service, context_name, file_name, max_items)
+_STRUCTURE_EXPLORERS = {
+    "contexts": lambda service, context_name, file_name, max_items: _explore_contexts(service, max_items),
+    "files": lambda service, context_name, file_name, max_items: _explore_files(service, context_name, max_items),
+    "chunks": _explore_chunks,
+    "categories": lambda service, context_name, file_name, max_items: _explore_categories(service, context_name, max_items),
+}
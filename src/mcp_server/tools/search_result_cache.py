@@ -0,0 +1,168 @@
+"""
+Search Result Cache
+===================
+
+In-process cache of formatted search tool responses for the MCP server.
+
+Two lookup tiers:
+1. Exact match on the normalized request (query, filters, limits)
+2. Semantic match - a cached response is reused when its query embedding is
+   close enough (cosine similarity) to the new query within the same
+   filters/limits scope
+
+Responses are stored already formatted, so a hit skips the search and the
+result formatting entirely.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class SearchResultCache:
+    """
+    LRU + TTL cache of formatted search responses with a cosine-similarity tier
+    """
+
+    def __init__(self,
+                 max_size: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 similarity_threshold: Optional[float] = None):
+        """
+        Initialize the search result cache
+
+        Args:
+            max_size: Maximum cached responses (from env if None, default 1024)
+            ttl_seconds: Entry lifetime in seconds (from env if None, default 300)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+                                  (from env if None, default 0.95; above 1 disables the tier)
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv('SEARCH_RESULT_CACHE_SIZE', '1024'))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('SEARCH_RESULT_CACHE_TTL', '300'))
+        self.similarity_threshold = (similarity_threshold if similarity_threshold is not None
+                                     else float(os.getenv('SEARCH_RESULT_CACHE_SIMILARITY', '0.95')))
+
+        # key -> (stored_at, scope, normalized embedding or None, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, Any, Any]]" = OrderedDict()
+        # scope -> (keys, stacked embedding matrix), rebuilt lazily after changes
+        self._scope_matrices: Dict[Hashable, Tuple[List[Hashable], Any]] = {}
+
+    @staticmethod
+    def make_scope(filters: Optional[Dict[str, Any]], **options: Any) -> Hashable:
+        """Build the hashable scope (filters + options) a cached response is valid for"""
+        filters_key = json.dumps(filters or {}, sort_keys=True, default=str)
+        return (filters_key, tuple(sorted(options.items())))
+
+    @staticmethod
+    def make_key(query: str, scope: Hashable) -> Hashable:
+        """Build the exact-match key for a query within a scope"""
+        return (query.strip().lower(), scope)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for an exact key, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[3]
+
+    def get_similar(self, scope: Hashable, embedding: Optional[List[float]]) -> Optional[Any]:
+        """
+        Return the cached value whose query embedding is most similar to ``embedding``
+
+        Args:
+            scope: Scope from make_scope(); only entries in the same scope are considered
+            embedding: Query embedding for the new request
+
+        Returns:
+            Cached value if the best cosine similarity meets the threshold, else None
+        """
+        if not embedding or self.similarity_threshold > 1:
+            return None
+
+        keys, matrix = self._get_scope_matrix(scope)
+        if not keys:
+            return None
+
+        import numpy as np
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != matrix.shape[1]:
+            return None
+
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return self.get(keys[best])
+
+    def put(self, key: Hashable, scope: Hashable, value: Any, embedding: Optional[List[float]] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full
+
+        Args:
+            key: Exact-match key from make_key()
+            scope: Scope from make_scope()
+            value: Value to cache (treated as immutable by callers)
+            embedding: Optional query embedding enabling semantic hits
+        """
+        if self.max_size <= 0:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic(), scope, self._normalize(embedding), value)
+        self._scope_matrices.pop(scope, None)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._entries.clear()
+        self._scope_matrices.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove one entry and drop its scope's stacked matrix"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._scope_matrices.pop(entry[1], None)
+
+    def _get_scope_matrix(self, scope: Hashable) -> Tuple[List[Hashable], Any]:
+        """Return (keys, stacked normalized embeddings) for live entries in a scope"""
+        cached = self._scope_matrices.get(scope)
+        if cached is not None:
+            return cached
+
+        import numpy as np
+        now = time.monotonic()
+        keys, vectors = [], []
+        for key, (stored_at, entry_scope, vector, _) in self._entries.items():
+            if entry_scope == scope and vector is not None and now - stored_at <= self.ttl_seconds:
+                if vectors and vector.shape != vectors[0].shape:
+                    continue
+                keys.append(key)
+                vectors.append(vector)
+
+        matrix = np.vstack(vectors) if vectors else None
+        self._scope_matrices[scope] = (keys, matrix)
+        return keys, matrix
+
+    @staticmethod
+    def _normalize(embedding: Optional[List[float]]):
+        """Convert an embedding to a unit-length float32 vector, or None"""
+        if not embedding:
+            return None
+        import numpy as np
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
@@ -7,11 +7,14 @@ and ChromaDB backends. Routes tool calls to appropriate handlers based on
 the search service type.
 """
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any
 import mcp.types as types
 
 from src.common.vector_search_services.vector_search_interface import IVectorSearchService
+from src.mcp_server.tools import get_argument_validators
 
 # Azure Cognitive Search handlers
 from .azure_cognitive_search.universal_tools_for_azure_cognitive_search import (
@@ -41,8 +44,14 @@ class ToolRouter:
     def __init__(self, search_service: IVectorSearchService):
         self.search_service = search_service
         
-        # Set up all handlers
+        # Bound in-flight backend calls so bursts of tool calls queue up instead of
+        # triggering service throttling; size roughly to the search replica count
+        self.max_inflight = int(os.getenv('SEARCH_MAX_INFLIGHT', '8'))
+        self._search_semaphore = asyncio.Semaphore(self.max_inflight)
+        
+        # Set up all handlers and the precompiled argument validators
         self._setup_handlers()
+        self.validators = get_argument_validators()
     
     def _setup_handlers(self):
         """Setup all handlers for both Azure and ChromaDB tools"""
@@ -65,21 +74,36 @@ class ToolRouter:
     async def handle_tool_call(self, name: str, arguments: dict) -> list[types.TextContent]:
         """Route tool call to appropriate handler"""
         try:
-            if name not in self.handlers:
+            handler = self.handlers.get(name)
+            if handler is None:
                 return [types.TextContent(
                     type="text", 
                     text=f"[ERROR] Unknown tool: {name}. Available tools: {', '.join(self.handlers.keys())}"
                 )]
             
-            handler = self.handlers[name]
+            if arguments is None:
+                arguments = {}
+            
+            # Validate arguments against the tool schema and apply its defaults
+            # (no-argument tools have no validator and skip this step)
+            validator = self.validators.get(name)
+            if validator is not None:
+                try:
+                    arguments = validator(arguments)
+                except ValueError as e:
+                    return [types.TextContent(
+                        type="text",
+                        text=f"[ERROR] Invalid arguments for {name}: {e}"
+                    )]
             
             # Log the routing decision
-            logger.info(f"[ROUTER] Routing {name} to handler")
+            logger.info("[ROUTER] Routing %s to handler", name)
             
-            return await handler(self.search_service, arguments)
+            async with self._search_semaphore:
+                return await handler(self.search_service, arguments)
             
         except Exception as e:
-            logger.error(f"Error handling tool call {name}: {e}")
+            logger.error("Error handling tool call %s: %s", name, e)
             return [types.TextContent(
                 type="text", 
                 text=f"[ERROR] Error executing {name}: {str(e)}"